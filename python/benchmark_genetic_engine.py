@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Cypher AI Genetic Engine - Benchmark Suite
+
+Seeded benchmarks for the genetic engine hot paths:
+- Cold start to READY (separate process)
+- evaluate_individual / evaluate_population throughput
+- run_evolution generations/sec at several population sizes
+- calculate_diversity cost
+- NSGA-II Pareto ranking cost
+- train_neural_networks and neural_architecture_search wall time
+- Peak RSS
+
+Usage:
+    python benchmark_genetic_engine.py --output results.json
+    python benchmark_genetic_engine.py --save-baseline benchmarks/baseline.json
+    python benchmark_genetic_engine.py --baseline benchmarks/baseline.json --tolerance 0.2
+
+Results are JSON. With --baseline, metrics that are worse than the baseline by more than
+--tolerance are reported as regressions and the exit code is 1.
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import resource
+import subprocess
+import contextlib
+import numpy as np
+from datetime import datetime
+from typing import List, Dict, Any
+
+ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ENGINE_DIR)
+
+import genetic_engine
+from genetic_engine import CypherAIGeneticEngine, FitnessCache
+
+
+class BenchmarkSuite:
+    """Runs the engine benchmarks and collects metrics"""
+    
+    def __init__(self, seed: int = 42, population_sizes: List[int] = None, generations: int = 20,
+                 evaluations: int = 2000, include_nas: bool = True):
+        self.seed = seed
+        self.population_sizes = population_sizes or [50, 100, 500]
+        self.generations = generations
+        self.evaluations = evaluations
+        self.include_nas = include_nas
+        self.metrics = {}
+        self.engine = None
+    
+    def record(self, name: str, value: float, unit: str, higher_is_better: bool):
+        """Store one metric"""
+        self.metrics[name] = {
+            'value': float(value),
+            'unit': unit,
+            'higher_is_better': higher_is_better
+        }
+        print(f"📊 {name}: {value:.3f} {unit}", file=sys.stderr)
+    
+    def reseed(self):
+        """Reset every RNG the engine uses so each benchmark sees the same inputs"""
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        genetic_engine.torch.manual_seed(self.seed)
+        if self.engine is not None:
+            self.engine.rng = np.random.default_rng(self.seed)
+    
+    def random_genomes(self, count: int) -> np.ndarray:
+        """Seeded 0/1 genome matrix"""
+        return np.random.default_rng(self.seed).integers(
+            0, 2, size=(count, CypherAIGeneticEngine.GENOME_LENGTH), dtype=np.uint8
+        )
+    
+    def run(self) -> Dict[str, Any]:
+        """Run every benchmark, returning the machine-readable report"""
+        
+        self.bench_cold_start()
+        
+        # Engine chatter and protocol messages would drown the report
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            self.engine = CypherAIGeneticEngine()
+            self.engine.background_training = False
+            self.reseed()
+            
+            started = time.perf_counter()
+            self.engine.ensure_initialized()
+            self.record('initialize_ms', (time.perf_counter() - started) * 1000, 'ms', False)
+            
+            self.bench_evaluation()
+            self.bench_evolution()
+            self.bench_diversity()
+            self.bench_pareto_ranking()
+            self.bench_training()
+            if self.include_nas:
+                self.bench_nas()
+        
+        self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        # ru_maxrss is kilobytes on Linux and bytes on macOS
+        scale = 1024 * 1024 if sys.platform == 'darwin' else 1024
+        self.record('peak_rss_mb', self_rss / scale, 'MB', False)
+        self.record('peak_child_rss_mb', child_rss / scale, 'MB', False)
+        
+        return {
+            'meta': {
+                'seed': self.seed,
+                'timestamp': datetime.now().isoformat(),
+                'python': platform.python_version(),
+                'numpy': np.__version__,
+                'torch': genetic_engine.torch.__version__,
+                'platform': platform.platform(),
+                'cpu_count': os.cpu_count(),
+                'population_sizes': self.population_sizes,
+                'generations': self.generations
+            },
+            'metrics': self.metrics
+        }
+    
+    def bench_cold_start(self, runs: int = 5):
+        """Median time from process launch to the READY line"""
+        
+        env = dict(os.environ, CYPHER_AI_WARMUP='0', PYTHONHASHSEED=str(self.seed))
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            process = subprocess.Popen(
+                [sys.executable, os.path.join(ENGINE_DIR, 'genetic_engine.py')],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                env=env, text=True
+            )
+            try:
+                for line in process.stdout:
+                    if line.startswith('READY'):
+                        timings.append((time.perf_counter() - started) * 1000)
+                        break
+                process.stdin.write('{"command": "shutdown"}\n')
+                process.stdin.flush()
+                process.wait(timeout=30)
+            finally:
+                if process.poll() is None:
+                    process.kill()
+        
+        if timings:
+            self.record('cold_start_ready_ms', float(np.median(timings)), 'ms', False)
+    
+    def bench_evaluation(self):
+        """Uncached per-individual and batched evaluation throughput"""
+        
+        engine = self.engine
+        engine.fitness_cache = FitnessCache(max_size=0)
+        individuals = [genetic_engine.creator.Individual(genome.tolist())
+                       for genome in self.random_genomes(self.evaluations)]
+        
+        count = min(len(individuals), 500)
+        started = time.perf_counter()
+        for individual in individuals[:count]:
+            engine.evaluate_individual(individual)
+        elapsed = time.perf_counter() - started
+        self.record('evaluate_individual_per_sec', count / elapsed, 'evals/s', True)
+        
+        started = time.perf_counter()
+        engine.evaluate_population(individuals)
+        elapsed = time.perf_counter() - started
+        self.record('evaluate_population_per_sec', len(individuals) / elapsed, 'evals/s', True)
+        
+        engine.fitness_cache = FitnessCache(max_size=100000)
+    
+    def bench_evolution(self):
+        """Generations/sec for each population size and backend"""
+        
+        engine = self.engine
+        engine.max_generations = self.generations
+        engine.target_fitness = float('inf')
+        engine.checkpoint_dir = None
+        
+        for backend in CypherAIGeneticEngine.POPULATION_BACKENDS:
+            for population_size in self.population_sizes:
+                self.reseed()
+                engine.fitness_cache = FitnessCache(max_size=100000)
+                started = time.perf_counter()
+                result = engine.run_evolution('GENERAL', backend=backend, population_size=population_size)
+                elapsed = time.perf_counter() - started
+                self.record(f'generations_per_sec_{backend}_{population_size}',
+                            (result['generation'] + 1) / elapsed, 'gen/s', True)
+    
+    def bench_diversity(self):
+        """calculate_diversity cost for growing populations"""
+        
+        for population_size in (100, 1000, 10000):
+            genomes = self.random_genomes(population_size)
+            repeats = 20
+            started = time.perf_counter()
+            for _ in range(repeats):
+                self.engine.calculate_diversity(genomes)
+            elapsed = (time.perf_counter() - started) / repeats
+            self.record(f'diversity_ms_{population_size}', elapsed * 1000, 'ms', False)
+    
+    def bench_pareto_ranking(self):
+        """Non-dominated sorting plus crowding distance for growing populations"""
+        
+        rng = np.random.default_rng(self.seed)
+        for population_size in (1000, 10000, 50000):
+            accuracies = rng.random(population_size) * 100
+            fp_rates = rng.random(population_size)
+            started = time.perf_counter()
+            self.engine.rank_pareto(accuracies, fp_rates)
+            self.record(f'pareto_ranking_ms_{population_size}', (time.perf_counter() - started) * 1000, 'ms', False)
+    
+    def bench_training(self):
+        """One synchronous periodic training pass over all sector models"""
+        
+        self.reseed()
+        started = time.perf_counter()
+        self.engine.train_neural_networks(0, background=False)
+        self.record('train_neural_networks_ms', (time.perf_counter() - started) * 1000, 'ms', False)
+    
+    def bench_nas(self):
+        """Neural Architecture Search wall time for one sector"""
+        
+        self.reseed()
+        started = time.perf_counter()
+        self.engine.neural_architecture_search('GENERAL')
+        self.record('neural_architecture_search_ms', (time.perf_counter() - started) * 1000, 'ms', False)
+
+
+def compare_to_baseline(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[Dict[str, Any]]:
+    """Per-metric comparison; a metric regresses when it is worse than baseline by more than tolerance"""
+    
+    comparisons = []
+    for name, metric in results['metrics'].items():
+        reference = baseline.get('metrics', {}).get(name)
+        if not reference or not reference['value']:
+            continue
+        
+        ratio = metric['value'] / reference['value']
+        change = ratio - 1 if metric['higher_is_better'] else 1 - ratio
+        comparisons.append({
+            'metric': name,
+            'baseline': reference['value'],
+            'value': metric['value'],
+            'change': change,
+            'regression': change < -tolerance
+        })
+    return comparisons
+
+
+def main():
+    """Command line entry point"""
+    
+    parser = argparse.ArgumentParser(description='Benchmark the Cypher AI genetic engine')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--population-sizes', default='50,100,500',
+                        help='comma-separated population sizes for run_evolution')
+    parser.add_argument('--generations', type=int, default=20)
+    parser.add_argument('--evaluations', type=int, default=2000)
+    parser.add_argument('--skip-nas', action='store_true', help='skip the (slow) NAS benchmark')
+    parser.add_argument('--output', help='write results JSON here instead of stdout')
+    parser.add_argument('--baseline', help='baseline results JSON to compare against')
+    parser.add_argument('--save-baseline', help='also write results to this baseline path')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='allowed fractional slowdown before a metric counts as a regression')
+    args = parser.parse_args()
+    
+    suite = BenchmarkSuite(
+        seed=args.seed,
+        population_sizes=[int(size) for size in args.population_sizes.split(',')],
+        generations=args.generations,
+        evaluations=args.evaluations,
+        include_nas=not args.skip_nas
+    )
+    results = suite.run()
+    
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            comparisons = compare_to_baseline(results, json.load(baseline_file), args.tolerance)
+        results['comparison'] = {'baseline': args.baseline, 'tolerance': args.tolerance, 'metrics': comparisons}
+        
+        for comparison in comparisons:
+            marker = '❌' if comparison['regression'] else '✅'
+            print(f"{marker} {comparison['metric']}: {comparison['change']:+.1%} vs baseline", file=sys.stderr)
+        if any(comparison['regression'] for comparison in comparisons):
+            exit_code = 1
+    
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output_file:
+            output_file.write(report + '\n')
+    else:
+        print(report)
+    
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save_baseline)), exist_ok=True)
+        with open(args.save_baseline, 'w') as baseline_file:
+            baseline_file.write(report + '\n')
+    
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,69 +10,1127 @@ Features:
 - Multi-objective optimization for security policies
 """
 
+from __future__ import annotations
+
+import os
 import sys
+import stat
+import copy
 import json
 import time
+import struct
+import socket
+
+_IMPORT_STARTED = time.perf_counter()
+
+import math
+import bisect
 import random
+import itertools
+import threading
+import queue as queue_module
+import multiprocessing
 import numpy as np
+from collections import OrderedDict, Counter
+from contextlib import contextmanager, ExitStack
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from typing import List, Dict, Tuple, Any
 from datetime import datetime
 
-import torch
-import torch.nn as nn
-import torch.optim as optim
-from deap import base, creator, tools, algorithms
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+# torch and DEAP take seconds to import; they are loaded on first use so READY is immediate
+_FRAMEWORK_NAMES = ('torch', 'nn', 'optim', 'base', 'creator', 'tools', 'algorithms',
+                    'SecurityPolicyNetwork')
+_framework_lock = threading.Lock()
+
+
+def _load_frameworks():
+    """Import torch, DEAP and the policy network into module globals"""
+    global torch, nn, optim, base, creator, tools, algorithms, SecurityPolicyNetwork
+    
+    with _framework_lock:
+        if 'SecurityPolicyNetwork' in globals():
+            return
+        
+        import torch
+        import torch.nn as nn
+        import torch.optim as optim
+        from deap import base, creator, tools, algorithms
+        from security_policy_network import SecurityPolicyNetwork
+
+
+def __getattr__(name: str):
+    """Resolve lazily imported framework names for importers of this module"""
+    if name in _FRAMEWORK_NAMES:
+        _load_frameworks()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def pack_genomes(genes: np.ndarray) -> np.ndarray:
+    """Pack an (N, L) 0/1 genome matrix into an (N, L/8) uint8 bit array"""
+    return np.packbits(np.asarray(genes, dtype=np.uint8), axis=1)
+
+
+def unpack_genomes(packed: np.ndarray, genome_length: int) -> np.ndarray:
+    """Unpack an (N, L/8) uint8 bit array into an (N, L) 0/1 genome matrix"""
+    return np.unpackbits(packed, axis=1, count=genome_length)
+
+
+def pareto_fronts(maximize: np.ndarray, minimize: np.ndarray) -> np.ndarray:
+    """Non-dominated front of each point (0 = Pareto front) for one objective to maximize and one to minimize"""
+    
+    # Identical points never dominate each other, so each distinct point is ranked once;
+    # np.unique sorts by the first objective (best first), then by the second (best first)
+    points, inverse = np.unique(np.column_stack([-np.asarray(maximize, dtype=np.float64),
+                                                 np.asarray(minimize, dtype=np.float64)]),
+                                axis=0, return_inverse=True)
+    
+    # In that order every earlier point with a lower-or-equal second objective dominates the current one.
+    # front_min[k] is the lowest second objective in front k so far, non-decreasing in k, so the
+    # current point's front is found by binary search: O(N log N) instead of pairwise O(N^2)
+    fronts = np.empty(len(points), dtype=np.int64)
+    front_min = []
+    for index, value in enumerate(points[:, 1].tolist()):
+        front = bisect.bisect_right(front_min, value)
+        if front == len(front_min):
+            front_min.append(value)
+        else:
+            front_min[front] = value
+        fronts[index] = front
+    
+    return fronts[inverse.reshape(-1)]
+
+
+def crowding_distances(fronts: np.ndarray, objectives: np.ndarray) -> np.ndarray:
+    """NSGA-II crowding distance of each point within its front (infinite at the ends of a front)"""
+    
+    distances = np.zeros(len(fronts))
+    if len(fronts) == 0:
+        return distances
+    
+    for values in np.asarray(objectives, dtype=np.float64).T:
+        # All fronts at once: sort by front, then by this objective
+        order = np.lexsort((values, fronts))
+        sorted_fronts = fronts[order]
+        sorted_values = values[order]
+        
+        boundary = sorted_fronts[1:] != sorted_fronts[:-1]
+        first = np.concatenate([[True], boundary])
+        last = np.concatenate([boundary, [True]])
+        starts = np.flatnonzero(first)
+        ends = np.flatnonzero(last)
+        span = np.repeat(sorted_values[ends] - sorted_values[starts], ends - starts + 1)
+        
+        gaps = np.zeros(len(order))
+        gaps[1:-1] = sorted_values[2:] - sorted_values[:-2]
+        contribution = np.divide(gaps, span, out=np.zeros(len(order)), where=span > 0)
+        contribution[first | last] = np.inf
+        distances[order] += contribution
+    
+    return distances
+
+class FitnessCache:
+    """Bounded LRU cache of genome fitness values, valid for one model version"""
+    
+    def __init__(self, max_size: int = 100000):
+        self.max_size = max_size
+        self.model_version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+    
+    @staticmethod
+    def genome_key(genome) -> bytes:
+        """Key a 0/1 genome by its packed bit representation"""
+        return np.packbits(np.asarray(genome, dtype=np.uint8)).tobytes()
+    
+    def get(self, key: bytes):
+        """Return the cached fitness for a genome key, or None on a miss"""
+        counts = self._thread_counts()
+        with self._lock:
+            fitness = self._entries.get(key)
+            if fitness is None:
+                self.misses += 1
+                counts['misses'] += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            counts['hits'] += 1
+            return fitness
+    
+    def put(self, key: bytes, fitness: Tuple[float, float], model_version: int):
+        """Store a genome's fitness scored against model_version, evicting the least recently used entries"""
+        if self.max_size <= 0:
+            return
+        
+        with self._lock:
+            # The models changed while the genome was being scored
+            if model_version != self.model_version:
+                return
+            self._entries[key] = fitness
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, model_version: int):
+        """Drop all entries computed against an older model version"""
+        with self._lock:
+            self._entries.clear()
+            self.model_version = model_version
+    
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries)
+        }
+    
+    def thread_stats(self) -> Dict[str, int]:
+        """Hit/miss counters for lookups made on the calling thread; a run evaluates on its own thread"""
+        return dict(self._thread_counts())
+    
+    def _thread_counts(self) -> Dict[str, int]:
+        counts = getattr(self._local, 'counts', None)
+        if counts is None:
+            counts = self._local.counts = {'hits': 0, 'misses': 0}
+        return counts
+
+
+def _encode_default(value):
+    """Serialize NumPy scalars and arrays that json/msgpack cannot handle natively"""
+    if hasattr(value, 'tolist'):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+class ProgressChannel:
+    """Protocol message sink: KIND:{json} lines on stdout, or length-prefixed frames on a file descriptor"""
+    
+    FORMATS = ('line', 'framed')
+    CODECS = ('json', 'msgpack')
+    
+    def __init__(self, format: str = 'line', codec: str = 'json', fd: int = None):
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown progress format: {format}")
+        if codec not in self.CODECS:
+            raise ValueError(f"Unknown progress codec: {codec}")
+        if format == 'framed' and fd is None:
+            raise ValueError("Framed progress needs a file descriptor")
+        
+        if codec == 'msgpack' and not MSGPACK_AVAILABLE:
+            print("⚠️ msgpack not installed, framing progress messages as JSON", file=sys.stderr)
+            codec = 'json'
+        
+        self.format = format
+        self.codec = codec
+        self.fd = fd
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_env(cls) -> 'ProgressChannel':
+        """Line protocol on stdout unless CYPHER_AI_PROGRESS_FD names a framed channel"""
+        
+        fd = os.getenv('CYPHER_AI_PROGRESS_FD')
+        if not fd:
+            return cls()
+        
+        codec = os.getenv('CYPHER_AI_PROGRESS_CODEC', 'json')
+        try:
+            fd = int(fd)
+            os.fstat(fd)
+            return cls('framed', codec, fd)
+        except (ValueError, OSError) as e:
+            print(f"⚠️ Progress channel unavailable ({e}), using stdout lines", file=sys.stderr)
+            return cls()
+    
+    def encode(self, kind: str, payload: Dict[str, Any]) -> bytes:
+        """One complete frame: 4-byte big-endian body length followed by the encoded message"""
+        
+        message = {'type': kind, 'data': payload}
+        if self.codec == 'msgpack':
+            body = msgpack.packb(message, default=_encode_default)
+        else:
+            body = json.dumps(message, separators=(',', ':'), default=_encode_default).encode('utf-8')
+        return struct.pack('>I', len(body)) + body
+    
+    def write(self, kind: str, payload: Dict[str, Any]):
+        """Send one message"""
+        
+        if self.format == 'line':
+            # Single write per line so concurrent writers never split a message
+            sys.stdout.write(f"{kind}:{json.dumps(payload, default=_encode_default)}\n")
+            sys.stdout.flush()
+            return
+        
+        frame = memoryview(self.encode(kind, payload))
+        with self._lock:
+            while frame:
+                written = os.write(self.fd, frame)
+                frame = frame[written:]
+
+
+class ProgressThrottle:
+    """Coalesces per-generation progress into at most one message per interval"""
+    
+    def __init__(self, emit, kind: str, interval: float = 0.0):
+        self.emit = emit
+        self.kind = kind
+        self.interval = interval
+        self._last_emit = None
+        self._pending = None
+        self._coalesced = 0
+        self._window_best = None
+    
+    def update(self, payload: Dict[str, Any]):
+        """Record one generation's stats, emitting if the interval has elapsed"""
+        
+        self._pending = payload
+        self._coalesced += 1
+        best = payload.get('best_fitness')
+        if best is not None and (self._window_best is None or best > self._window_best):
+            self._window_best = best
+        
+        now = time.monotonic()
+        if self._last_emit is None or now - self._last_emit >= self.interval:
+            self._last_emit = now
+            self.flush()
+    
+    def flush(self):
+        """Emit whatever has been coalesced since the last message"""
+        
+        if self._pending is None:
+            return
+        
+        payload = self._pending
+        if self._coalesced > 1:
+            payload = {**payload, 'coalesced': self._coalesced, 'window_best_fitness': self._window_best}
+        
+        self.emit(self.kind, payload)
+        self._pending = None
+        self._coalesced = 0
+        self._window_best = None
+
+
+class PhaseTimer:
+    """Wall time per evolution phase, for the current generation and for the whole run"""
+    
+    def __init__(self):
+        self.generation = {}
+        self.totals = {}
+        self._last = time.perf_counter()
+    
+    def start(self):
+        """Begin a new generation"""
+        self.generation = {}
+        self._last = time.perf_counter()
+    
+    def mark(self, phase: str):
+        """Charge the time since the previous mark to a phase"""
+        now = time.perf_counter()
+        elapsed = now - self._last
+        self.generation[phase] = self.generation.get(phase, 0.0) + elapsed
+        self.totals[phase] = self.totals.get(phase, 0.0) + elapsed
+        self._last = now
+    
+    @staticmethod
+    def as_ms(phases: Dict[str, float]) -> Dict[str, float]:
+        """Seconds to milliseconds, for protocol messages"""
+        return {phase: seconds * 1000 for phase, seconds in phases.items()}
+
+
+class ConvergenceMonitor:
+    """Detects stalled runs: best and average fitness both flat, or diversity collapsed, for `patience` generations"""
+    
+    def __init__(self, patience: int = 50, min_delta: float = 1e-3, diversity_floor: float = 0.0):
+        self.patience = patience
+        self.min_delta = min_delta
+        self.diversity_floor = diversity_floor
+        self.model_version = None
+        self.reset()
+    
+    def reset(self):
+        """Forget history, e.g. after the fitness landscape changes"""
+        self.best = -math.inf
+        self.avg = -math.inf
+        self.best_stale = 0
+        self.avg_stale = 0
+        self.low_diversity = 0
+    
+    def update(self, best: float, avg: float, diversity: float, model_version: int = None) -> str:
+        """Record one generation; returns a stop reason once the run has stalled, else None"""
+        
+        if not self.patience:
+            return None
+        
+        # Retrained models rescore everything: re-baseline to the new scale, but keep counting stale
+        # generations so periodic retraining does not postpone stopping forever
+        if model_version != self.model_version:
+            if self.model_version is not None:
+                self.best = best
+                self.avg = avg
+            self.model_version = model_version
+        
+        if best > self.best + self.min_delta:
+            self.best = best
+            self.best_stale = 0
+        else:
+            self.best_stale += 1
+        
+        if avg > self.avg + self.min_delta:
+            self.avg = avg
+            self.avg_stale = 0
+        else:
+            self.avg_stale += 1
+        
+        self.low_diversity = self.low_diversity + 1 if diversity <= self.diversity_floor else 0
+        
+        if self.best_stale >= self.patience and self.avg_stale >= self.patience:
+            return 'stagnation'
+        if self.diversity_floor > 0 and self.low_diversity >= self.patience:
+            return 'diversity_collapse'
+        return None
+
+
+class RunHistory:
+    """Bounded per-run statistics: a ring buffer of recent generations plus a progressively downsampled overview"""
+    
+    FIELDS = ('best_fitness', 'avg_fitness', 'diversity')
+    
+    def __init__(self, run_id: str, sector: str, capacity: int = 256):
+        # An even capacity keeps the overview aligned to its stride when it halves
+        capacity = max(2, capacity + capacity % 2)
+        self.run_id = run_id
+        self.sector = sector
+        self.capacity = capacity
+        self.started = time.time()
+        self.finished = None
+        self.stop_reason = None
+        self.count = 0
+        self.last_generation = -1
+        self.latest = np.full(len(self.FIELDS), np.nan)
+        
+        # Most recent generations at full resolution
+        self.recent_generations = np.zeros(capacity, dtype=np.int32)
+        self.recent_values = np.zeros((capacity, len(self.FIELDS)), dtype=np.float32)
+        
+        # Every `stride`-th generation of the whole run; the stride doubles whenever the buffer fills
+        self.overview_generations = np.zeros(capacity, dtype=np.int32)
+        self.overview_values = np.zeros((capacity, len(self.FIELDS)), dtype=np.float32)
+        self.overview_size = 0
+        self.stride = 1
+    
+    def append(self, generation: int, best_fitness: float, avg_fitness: float, diversity: float):
+        """Record one generation in O(1) time and fixed memory"""
+        
+        values = (best_fitness, avg_fitness, diversity)
+        slot = self.count % self.capacity
+        self.recent_generations[slot] = generation
+        self.recent_values[slot] = values
+        self.latest[:] = values
+        
+        if self.count % self.stride == 0:
+            if self.overview_size == self.capacity:
+                kept = self.capacity // 2
+                self.overview_generations[:kept] = self.overview_generations[::2]
+                self.overview_values[:kept] = self.overview_values[::2]
+                self.overview_size = kept
+                self.stride *= 2
+            if self.count % self.stride == 0:
+                self.overview_generations[self.overview_size] = generation
+                self.overview_values[self.overview_size] = values
+                self.overview_size += 1
+        
+        self.count += 1
+        self.last_generation = generation
+    
+    def finish(self, stop_reason: str = None):
+        """Mark the run complete"""
+        self.finished = time.time()
+        self.stop_reason = stop_reason
+    
+    def recent(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Recent generations and their values, oldest first"""
+        
+        size = min(self.count, self.capacity)
+        order = (np.arange(size) + self.count - size) % self.capacity
+        return self.recent_generations[order], self.recent_values[order]
+    
+    def summary(self) -> Dict[str, Any]:
+        """JSON-safe run metadata without the series"""
+        return {
+            'run_id': self.run_id,
+            'sector': self.sector,
+            'started': self.started,
+            'finished': self.finished,
+            'stop_reason': self.stop_reason,
+            'generations': self.count,
+            'last_generation': self.last_generation,
+            'stride': self.stride,
+            **{field: (None if np.isnan(value) else float(value)) for field, value in zip(self.FIELDS, self.latest)}
+        }
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-safe run metadata plus the recent and overview series"""
+        
+        def series(generations, values):
+            return {'generation': generations.tolist(),
+                    **{field: values[:, index].tolist() for index, field in enumerate(self.FIELDS)}}
+        
+        return {
+            **self.summary(),
+            'recent': series(*self.recent()),
+            'overview': series(self.overview_generations[:self.overview_size],
+                               self.overview_values[:self.overview_size])
+        }
+    
+    @classmethod
+    def from_snapshot(cls, run_id: str, snapshot: Dict[str, Any], capacity: int = 256) -> 'RunHistory':
+        """Rebuild a run (e.g. one recorded in a worker process) from its snapshot"""
+        
+        history = cls(run_id, snapshot['sector'], capacity)
+        history.started = snapshot['started']
+        history.finished = snapshot['finished']
+        history.stop_reason = snapshot['stop_reason']
+        history.count = snapshot['generations']
+        history.last_generation = snapshot['last_generation']
+        history.stride = snapshot['stride']
+        history.latest[:] = [np.nan if snapshot[field] is None else snapshot[field] for field in cls.FIELDS]
+        
+        def columns(series):
+            return np.column_stack([series[field] for field in cls.FIELDS]) if series['generation'] else None
+        
+        recent = snapshot['recent']
+        size = min(len(recent['generation']), history.capacity)
+        if size:
+            slots = (np.arange(size) + history.count - size) % history.capacity
+            history.recent_generations[slots] = recent['generation'][-size:]
+            history.recent_values[slots] = columns(recent)[-size:]
+        
+        overview = snapshot['overview']
+        size = min(len(overview['generation']), history.capacity)
+        if size:
+            history.overview_generations[:size] = overview['generation'][:size]
+            history.overview_values[:size] = columns(overview)[:size]
+        history.overview_size = size
+        return history
+
+
+class EvolutionStatsStore:
+    """Thread-safe registry of RunHistory objects, keeping only the most recent `max_runs` runs"""
+    
+    def __init__(self, max_runs: int = 100, capacity: int = 256):
+        self.max_runs = max_runs
+        self.capacity = capacity
+        self._runs = OrderedDict()
+        self._run_ids = itertools.count(1)
+        self._lock = threading.Lock()
+    
+    def start_run(self, sector: str) -> RunHistory:
+        """Register a new run, evicting the oldest ones beyond the retention limit"""
+        
+        with self._lock:
+            history = RunHistory(f"run-{next(self._run_ids)}", sector, self.capacity)
+            self._register(history)
+            return history
+    
+    def import_run(self, snapshot: Dict[str, Any]) -> str:
+        """Adopt a run recorded elsewhere under a new local run id"""
+        
+        with self._lock:
+            history = RunHistory.from_snapshot(f"run-{next(self._run_ids)}", snapshot, self.capacity)
+            self._register(history)
+            return history.run_id
+    
+    def _register(self, history: RunHistory):
+        self._runs[history.run_id] = history
+        while len(self._runs) > max(1, self.max_runs):
+            self._runs.popitem(last=False)
+    
+    def query(self, run_id: str = None) -> Dict[str, Any]:
+        """One run's history, or summaries of every retained run"""
+        
+        with self._lock:
+            if run_id is None:
+                return {'runs': [history.summary() for history in self._runs.values()]}
+            history = self._runs.get(run_id)
+            return history.snapshot() if history else {'run_id': run_id, 'error': 'unknown run'}
+    
+    def latest(self, field: str, default: float = None) -> float:
+        """Most recent value of a statistic across all runs"""
+        
+        with self._lock:
+            for history in reversed(self._runs.values()):
+                if history.count:
+                    return float(history.latest[RunHistory.FIELDS.index(field)])
+        return default
+
+
+class SamplingProfiler:
+    """Stack-sampling profiler for one thread, built on sys._current_frames"""
+    
+    def __init__(self, thread_id: int = None, interval: float = 0.005):
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.samples = 0
+        self.self_counts = {}
+        self.total_counts = {}
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def start(self):
+        """Begin sampling on a background thread"""
+        self._thread = threading.Thread(target=self._sample_loop, name='cypher-profiler', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """Stop sampling and wait for the sampler thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+    
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            
+            self.samples += 1
+            leaf = True
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                location = f"{os.path.basename(code.co_filename)}:{code.co_firstlineno} {code.co_name}"
+                if leaf:
+                    self.self_counts[location] = self.self_counts.get(location, 0) + 1
+                    leaf = False
+                # Count recursive functions once per sample
+                if location not in seen:
+                    seen.add(location)
+                    self.total_counts[location] = self.total_counts.get(location, 0) + 1
+                frame = frame.f_back
+    
+    def report(self, top: int = 25) -> Dict[str, Any]:
+        """Hot spots ranked by self samples, with cumulative samples alongside"""
+        
+        samples = max(self.samples, 1)
+        hotspots = sorted(self.self_counts.items(), key=lambda item: item[1], reverse=True)[:top]
+        cumulative = sorted(self.total_counts.items(), key=lambda item: item[1], reverse=True)[:top]
+        return {
+            'samples': self.samples,
+            'interval_ms': self.interval * 1000,
+            'hotspots': [
+                {'function': location, 'self_samples': count, 'self_pct': 100.0 * count / samples,
+                 'total_samples': self.total_counts[location],
+                 'total_pct': 100.0 * self.total_counts[location] / samples}
+                for location, count in hotspots
+            ],
+            'cumulative': [
+                {'function': location, 'total_samples': count, 'total_pct': 100.0 * count / samples}
+                for location, count in cumulative
+            ]
+        }
+
+
+class FederatedAverager:
+    """Sample-weighted FedAvg over peer state dicts, streamed into one float64 accumulator per sector"""
+    
+    def __init__(self, local_states: Dict[str, Dict[str, Any]], local_weights: Dict[str, float] = None):
+        local_weights = local_weights or {}
+        self.sums = {}
+        self.dtypes = {}
+        self.weights = {}
+        self.peers = {}
+        for sector, state in local_states.items():
+            weight = float(local_weights.get(sector, 0.0))
+            self.sums[sector] = {
+                name: tensor.detach().to(torch.float64) * weight
+                for name, tensor in state.items() if tensor.is_floating_point()
+            }
+            self.dtypes[sector] = {name: state[name].dtype for name in self.sums[sector]}
+            self.weights[sector] = weight
+            self.peers[sector] = 0
+    
+    def accepts(self, sector: str, shapes: Dict[str, Any]) -> bool:
+        """Whether a peer's sector model matches the local architecture tensor for tensor"""
+        
+        sums = self.sums.get(sector)
+        if sums is None:
+            return False
+        return all(name in shapes and tuple(shapes[name]) == tuple(tensor.shape)
+                   for name, tensor in sums.items())
+    
+    def check(self, sector: str, tensors) -> List[Tuple[str, Any]]:
+        """Validate one peer's sector model against the local architecture, returning the tensors to fold in"""
+        
+        sums = self.sums[sector]
+        staged = [(name, tensor) for name, tensor in tensors if name in sums]
+        if len(staged) != len(sums) or {name for name, _ in staged} != set(sums):
+            raise ValueError(f"Incomplete {sector} model from peer")
+        
+        # Check every tensor before touching the sums so a bad peer never leaves them half-updated
+        for name, tensor in staged:
+            if tuple(tensor.shape) != tuple(sums[name].shape):
+                raise ValueError(f"Peer {sector} tensor {name} has shape {tuple(tensor.shape)}, "
+                                 f"expected {tuple(sums[name].shape)}")
+        return staged
+    
+    def add(self, sector: str, tensors, weight: float):
+        """Fold one peer's complete sector model into the running weighted sums"""
+        
+        sums = self.sums[sector]
+        staged = self.check(sector, tensors)
+        
+        # Weighted sums commute, so the result does not depend on the order peers arrive
+        for name, tensor in staged:
+            sums[name].add_(tensor.to(torch.float64), alpha=float(weight))
+        self.weights[sector] += float(weight)
+        self.peers[sector] += 1
+    
+    def averaged_states(self) -> Dict[str, Dict[str, Any]]:
+        """Averaged parameters for every sector that received at least one peer"""
+        
+        return {
+            sector: {
+                name: (total / self.weights[sector]).to(self.dtypes[sector][name])
+                for name, total in sums.items()
+            }
+            for sector, sums in self.sums.items()
+            if self.peers[sector] > 0 and self.weights[sector] > 0
+        }
+
 
-class SecurityPolicyNetwork(nn.Module):
-    """PyTorch neural network for security policy evaluation"""
+def write_state_stream(stream, states: Dict[str, Dict[str, Any]], samples: Dict[str, int]):
+    """Write sector state dicts as a tensor stream: a manifest frame, one frame per tensor, an end frame
     
-    def __init__(self, input_size=64, hidden_sizes=[128, 64, 32], output_size=1):
-        super(SecurityPolicyNetwork, self).__init__()
-        self.layers = nn.ModuleList()
+    Each frame is a 4-byte big-endian header length, a JSON header, then header['nbytes'] raw bytes.
+    """
+    
+    def write_frame(header: Dict[str, Any], payload: bytes = b''):
+        encoded = json.dumps(header, separators=(',', ':')).encode('utf-8')
+        stream.write(struct.pack('>I', len(encoded)) + encoded)
+        if payload:
+            stream.write(payload)
+    
+    write_frame({
+        'type': 'manifest',
+        'samples': samples,
+        'sectors': {
+            sector: {name: list(tensor.shape) for name, tensor in state.items()}
+            for sector, state in states.items()
+        }
+    })
+    for sector, state in states.items():
+        for name, tensor in state.items():
+            data = tensor.detach().contiguous().numpy().tobytes()
+            write_frame({
+                'type': 'tensor',
+                'sector': sector,
+                'name': name,
+                'dtype': str(tensor.dtype).replace('torch.', ''),
+                'shape': list(tensor.shape),
+                'nbytes': len(data)
+            }, data)
+    write_frame({'type': 'end'})
+    stream.flush()
+
+
+# Parameter dtypes a peer may send; anything else in a tensor frame is rejected
+STATE_STREAM_DTYPES = ('float16', 'bfloat16', 'float32', 'float64')
+
+
+def read_state_stream(stream):
+    """Yield (header, tensor) pairs from a tensor stream; tensor is None for manifest and end frames
+    
+    Tensor frames must match the shape the manifest declared for them, so a stream the manifest
+    vouched for cannot deliver differently shaped (or broadcastable) tensors.
+    """
+    
+    def read_exactly(size: int) -> bytearray:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        while view:
+            read = stream.readinto(view)
+            if not read:
+                raise ValueError("Tensor stream ended mid-frame")
+            view = view[read:]
+        return buffer
+    
+    manifest = {}
+    while True:
+        header = json.loads(read_exactly(struct.unpack('>I', read_exactly(4))[0]))
+        if header['type'] == 'manifest':
+            manifest = header['sectors']
+        if header['type'] != 'tensor':
+            yield header, None
+            if header['type'] == 'end':
+                return
+            continue
+        
+        sector, name = header['sector'], header['name']
+        declared = manifest.get(sector, {}).get(name)
+        if declared is None:
+            raise ValueError(f"Tensor {sector}/{name} is not in the stream manifest")
+        if list(header['shape']) != list(declared):
+            raise ValueError(f"Tensor {sector}/{name} has shape {header['shape']}, manifest declared {declared}")
+        if header['dtype'] not in STATE_STREAM_DTYPES:
+            raise ValueError(f"Tensor {sector}/{name} has unsupported dtype {header['dtype']}")
+        
+        dtype = getattr(torch, header['dtype'])
+        expected_bytes = math.prod(declared) * torch.empty((), dtype=dtype).element_size()
+        if header['nbytes'] != expected_bytes:
+            raise ValueError(f"Tensor {sector}/{name} frame is {header['nbytes']} bytes, expected {expected_bytes}")
+        
+        data = read_exactly(expected_bytes)
+        yield header, torch.frombuffer(data, dtype=dtype).reshape(declared)
+
+
+class TrainingCorpus:
+    """A sector's labeled feature matrix, in memory or memory-mapped from .npy files.
+    
+    The last `holdout` fraction of rows is held out for evaluation. Training batches are read one block
+    of rows at a time in shuffled block order, and shuffled within each block, so memory stays flat
+    whatever the corpus size.
+    """
+    
+    # Mini-batch size for memory-mapped corpora when none is configured
+    DEFAULT_BATCH_SIZE = 1024
+    
+    def __init__(self, features: np.ndarray, labels: np.ndarray, holdout: float = 0.1,
+                 block_rows: int = 65536, source: str = None):
+        if features.ndim != 2 or labels.ndim != 1 or len(features) != len(labels):
+            raise ValueError(f"Training corpus needs (N, F) features and (N,) labels, "
+                             f"got {features.shape} and {labels.shape}")
+        
+        self.features = features
+        self.labels = labels
+        self.source = source
+        self.block_rows = max(1, block_rows)
+        self.memory_mapped = isinstance(features, np.memmap)
+        
+        holdout_rows = int(len(labels) * holdout) if len(labels) > 1 else 0
+        self.train_rows = len(labels) - holdout_rows
+    
+    @classmethod
+    def from_directory(cls, directory: str, holdout: float = 0.1, block_rows: int = 65536) -> 'TrainingCorpus':
+        """Memory-map features.npy (float, N x F) and labels.npy (0/1, N) from a directory"""
+        
+        features = np.load(os.path.join(directory, 'features.npy'), mmap_mode='r')
+        labels = np.load(os.path.join(directory, 'labels.npy'), mmap_mode='r')
+        return cls(features, labels, holdout=holdout, block_rows=block_rows, source=directory)
+    
+    def __len__(self) -> int:
+        return len(self.labels)
+    
+    @property
+    def feature_count(self) -> int:
+        return self.features.shape[1]
+    
+    def batches(self, batch_size: int = None, shuffle: bool = True, holdout: bool = False,
+                rng: np.random.Generator = None, prefetch: int = 2):
+        """Yield (inputs, labels) float tensors over the training rows (or the held-out rows).
+        
+        Without a batch size, an in-memory corpus is one full batch and a memory-mapped one uses
+        DEFAULT_BATCH_SIZE. Blocks are read and batched on a background thread, `prefetch` batches ahead.
+        """
+        
+        start, stop = (self.train_rows, len(self)) if holdout else (0, self.train_rows)
+        if stop <= start:
+            return
+        if not batch_size:
+            batch_size = self.DEFAULT_BATCH_SIZE if self.memory_mapped else stop - start
+        block_rows = max(self.block_rows, batch_size)
+        rng = rng or np.random.default_rng()
+        
+        blocks = np.arange(start, stop, block_rows)
+        if shuffle:
+            rng.shuffle(blocks)
+        
+        batches = queue_module.Queue(maxsize=max(1, prefetch))
+        stopped = threading.Event()
+        
+        def offer(item) -> bool:
+            # Give up once the consumer has gone away, so an abandoned loader never blocks
+            while not stopped.is_set():
+                try:
+                    batches.put(item, timeout=0.1)
+                    return True
+                except queue_module.Full:
+                    continue
+            return False
         
-        # Input layer
-        prev_size = input_size
-        for hidden_size in hidden_sizes:
-            self.layers.append(nn.Linear(prev_size, hidden_size))
-            self.layers.append(nn.ReLU())
-            self.layers.append(nn.Dropout(0.2))
-            prev_size = hidden_size
+        def produce():
+            try:
+                for block_start in blocks:
+                    block_stop = min(block_start + block_rows, stop)
+                    # np.array copies the rows out of the memory map in one sequential read
+                    inputs = np.array(self.features[block_start:block_stop], dtype=np.float32)
+                    labels = np.array(self.labels[block_start:block_stop], dtype=np.float32)
+                    order = rng.permutation(len(labels)) if shuffle else np.arange(len(labels))
+                    
+                    for offset in range(0, len(labels), batch_size):
+                        rows = order[offset:offset + batch_size]
+                        if not offer((torch.from_numpy(inputs[rows]), torch.from_numpy(labels[rows]))):
+                            return
+                offer(None)
+            except Exception as e:
+                offer(e)
         
-        # Output layer
-        self.layers.append(nn.Linear(prev_size, output_size))
-        self.layers.append(nn.Sigmoid())
+        producer = threading.Thread(target=produce, name='cypher-corpus-loader', daemon=True)
+        producer.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+                yield batch
+        finally:
+            stopped.set()
+            producer.join()
+
+
+def train_on_corpus(model, optimizer, criterion, corpus: TrainingCorpus, epochs: int,
+                    batch_size: int = None):
+    """Train a model in place for a number of epochs over a corpus's training rows"""
+    
+    model.train()
+    for epoch in range(epochs):
+        for inputs, labels in corpus.batches(batch_size):
+            optimizer.zero_grad()
+            
+            outputs = model(inputs)
+            loss = criterion(outputs.squeeze(-1), labels)
+            
+            loss.backward()
+            optimizer.step()
+
+
+def evaluate_on_corpus(model, criterion, corpus: TrainingCorpus, batch_size: int = None) -> Tuple[float, float]:
+    """Accuracy and mean loss on the held-out rows (the training rows if nothing is held out)"""
+    
+    holdout = corpus.train_rows < len(corpus)
+    correct = 0
+    total_loss = 0.0
+    count = 0
+    
+    model.eval()
+    with torch.no_grad():
+        for inputs, labels in corpus.batches(batch_size, shuffle=False, holdout=holdout):
+            predictions = model(inputs).squeeze(-1)
+            total_loss += float(criterion(predictions, labels)) * len(labels)
+            correct += int(((predictions > 0.5).float() == labels).sum())
+            count += len(labels)
     
-    def forward(self, x):
-        for layer in self.layers:
-            x = layer(x)
-        return x
+    if not count:
+        return 0.0, float('inf')
+    return correct / count, total_loss / count
+
 
 class CypherAIGeneticEngine:
     """Main genetic algorithm engine using DEAP framework"""
     
+    # Sector-specific false positive multipliers
+    SECTOR_FP_MULTIPLIERS = {
+        'FERPA': 0.8,   # Education needs balance
+        'FISMA': 0.6,   # Government can be stricter
+        'CIPA': 0.9,    # Schools need careful filtering
+        'GENERAL': 0.7  # General purpose
+    }
+    
+    SECTORS = ('FERPA', 'FISMA', 'CIPA', 'GENERAL')
+    
+    # Default search space for network architectures
+    NAS_SEARCH_SPACE = (
+        [64, 32],
+        [128, 64, 32],
+        [256, 128, 64, 32],
+        [128, 64],
+        [64, 32, 16]
+    )
+    GENOME_LENGTH = 64
+    POPULATION_BACKENDS = ('deap', 'numpy')
+    SELECTION_MODES = ('tournament', 'nsga2')
+    MIGRATION_TOPOLOGIES = ('ring', 'all', 'random')
+    INFERENCE_BACKENDS = ('eager', 'scripted', 'quantized')
+    
     def __init__(self):
         self.population_size = 100
         self.generation = 0
         self.max_generations = 1000
         self.target_fitness = 99.2
         
-        # Initialize DEAP framework
-        self.setup_deap()
+        # Early stopping once best/average fitness stop improving (patience 0 disables)
+        self.stagnation_patience = int(os.getenv('CYPHER_AI_STAGNATION_PATIENCE', '50'))
+        self.stagnation_min_delta = 1e-3
+        self.diversity_floor = float(os.getenv('CYPHER_AI_DIVERSITY_FLOOR', '0'))
         
-        # Initialize PyTorch models for different sectors
-        self.sector_models = {}
-        self.setup_neural_networks()
+        # Score whole populations as one tensor per sector model
+        self.batch_evaluation = True
         
-        # Evolution statistics
-        self.evolution_stats = {
-            'best_fitness': [],
-            'avg_fitness': [],
-            'diversity': []
-        }
+        # Population backend: 'deap' (list individuals) or 'numpy' (bit-packed arrays)
+        self.population_backend = 'deap'
+        self.rng = np.random.default_rng()
+        
+        # Genetic operator parameters
+        self.crossover_probability = 0.8
+        self.mutation_probability = 0.1
+        self.mutation_indpb = 0.1
+        self.tournament_size = 3
+        
+        # 'tournament' compares (accuracy, FP rate) lexicographically; 'nsga2' selects on Pareto rank and crowding
+        self.selection_mode = os.getenv('CYPHER_AI_SELECTION', 'tournament')
+        
+        # Genomes sampled for the diversity metric (None = exact over the whole population)
+        self.diversity_sample_size = None
+        
+        # Fitness cache, invalidated whenever a sector model changes
+        self.model_version = 0
+        self.fitness_cache = FitnessCache(max_size=100000)
+        
+        # Guards sector models against concurrent jobs training and scoring them
+        self.model_lock = threading.RLock()
+        self._job_context = threading.local()
+        
+        # Periodic training runs on model copies in the background and is swapped in between generations
+        self.training_interval = 10
+        self.background_training = os.getenv('CYPHER_AI_BACKGROUND_TRAINING', '1') != '0'
+        self.training_batch_size = int(os.getenv('CYPHER_AI_TRAINING_BATCH_SIZE', '0')) or None
+        
+        # Labeled corpora: <dir>/<sector>/features.npy + labels.npy, memory-mapped; synthetic data otherwise
+        self.training_data_dir = os.getenv('CYPHER_AI_TRAINING_DATA')
+        self.holdout_fraction = float(os.getenv('CYPHER_AI_HOLDOUT_FRACTION', '0.1'))
+        self._training_executor = None
+        self._pending_training = None
+        self._training_lock = threading.Lock()
+        
+        # Fitness scoring runs frozen TorchScript exports of the sector models, rebuilt when they change
+        self.inference_backend = os.getenv('CYPHER_AI_INFERENCE', 'scripted')
+        self.inference_threads = int(os.getenv('CYPHER_AI_INFERENCE_THREADS', '0')) or None
+        self._inference_models = {}
+        
+        # Protocol output: channel, EVOLUTION throttling (seconds, 0 = every generation) and genome encoding
+        self.progress_channel = ProgressChannel.from_env()
+        self.progress_interval = float(os.getenv('CYPHER_AI_PROGRESS_INTERVAL', '0'))
+        self.genome_encoding = os.getenv('CYPHER_AI_GENOME_ENCODING', 'list')
+        
+        # Per-generation PROFILE messages with phase timings (opt-in)
+        self.profile_phases = os.getenv('CYPHER_AI_PROFILE', '0') == '1'
+        
+        # On-disk checkpoints of sector models and per-sector halls of fame (interval 0 = end of run only)
+        self.checkpoint_dir = os.getenv('CYPHER_AI_CHECKPOINT_DIR')
+        self.checkpoint_interval = int(os.getenv('CYPHER_AI_CHECKPOINT_INTERVAL', '50'))
+        self.hall_of_fame = {}
+        
+        # Warm starts: share of each new population drawn from the sector's elite archive
+        self.elite_ratio = float(os.getenv('CYPHER_AI_ELITE_RATIO', '0.2'))
+        self.elite_archive_size = int(os.getenv('CYPHER_AI_ELITE_ARCHIVE_SIZE', '50'))
+        self._checkpoint_lock = threading.Lock()
+        
+        # DEAP toolbox and PyTorch sector models are built lazily (see ensure_initialized)
+        self._toolbox = None
+        self._sector_models = {}
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self.startup_timings = {}
+        
+        # Evolution statistics: bounded per-run histories, queryable with the history command
+        self.evolution_stats = EvolutionStatsStore(
+            max_runs=int(os.getenv('CYPHER_AI_STATS_RUNS', '100')),
+            capacity=int(os.getenv('CYPHER_AI_STATS_CAPACITY', '256'))
+        )
         
-        print("READY: Cypher AI Genetic Engine initialized")
+        self.startup_timings['ready_ms'] = (time.perf_counter() - _IMPORT_STARTED) * 1000
+        print("READY: Cypher AI Genetic Engine accepting commands")
         sys.stdout.flush()
     
+    @property
+    def toolbox(self):
+        """DEAP toolbox, built on first use"""
+        self.ensure_initialized()
+        return self._toolbox
+    
+    @property
+    def sector_models(self) -> Dict[str, Dict[str, Any]]:
+        """Per-sector PyTorch models, built on first use"""
+        self.ensure_initialized()
+        return self._sector_models
+    
+    def ensure_initialized(self):
+        """Import frameworks and build the DEAP toolbox and sector models exactly once"""
+        
+        if self._initialized:
+            return
+        
+        with self._init_lock:
+            if self._initialized:
+                return
+            
+            started = time.perf_counter()
+            
+            _load_frameworks()
+            if self.inference_threads:
+                torch.set_num_threads(self.inference_threads)
+            frameworks_loaded = time.perf_counter()
+            
+            # Initialize DEAP framework
+            self.setup_deap()
+            deap_ready = time.perf_counter()
+            
+            # Initialize PyTorch models for different sectors
+            self.setup_neural_networks()
+            models_ready = time.perf_counter()
+            
+            # Resume from the last checkpoint, if any
+            checkpoint_path = self.checkpoint_path()
+            if checkpoint_path and os.path.exists(checkpoint_path):
+                self._load_checkpoint(checkpoint_path)
+            restored = time.perf_counter()
+            
+            self.startup_timings.update({
+                'import_frameworks_ms': (frameworks_loaded - started) * 1000,
+                'setup_deap_ms': (deap_ready - frameworks_loaded) * 1000,
+                'setup_neural_networks_ms': (models_ready - deap_ready) * 1000,
+                'restore_checkpoint_ms': (restored - models_ready) * 1000,
+                'initialize_ms': (restored - started) * 1000,
+                'total_ms': (restored - _IMPORT_STARTED) * 1000
+            })
+            self._initialized = True
+        
+        self.emit_message('STARTUP', self.startup_report())
+    
+    def start_background_warmup(self) -> threading.Thread:
+        """Build frameworks and sector models on a background thread"""
+        
+        def warm_up():
+            try:
+                self.ensure_initialized()
+            except Exception as e:
+                print(f"ERROR: Engine warm-up failed: {str(e)}", file=sys.stderr)
+                sys.stderr.flush()
+        
+        thread = threading.Thread(target=warm_up, name='cypher-warmup', daemon=True)
+        thread.start()
+        return thread
+    
+    def startup_report(self) -> Dict[str, Any]:
+        """Startup time breakdown in milliseconds"""
+        
+        return {
+            'initialized': self._initialized,
+            **self.startup_timings
+        }
+    
     def setup_deap(self):
         """Setup DEAP genetic algorithm framework"""
         
@@ -80,43 +1138,60 @@ class CypherAIGeneticEngine:
         creator.create("FitnessMulti", base.Fitness, weights=(1.0, -1.0))
         creator.create("Individual", list, fitness=creator.FitnessMulti)
         
-        self.toolbox = base.Toolbox()
+        toolbox = base.Toolbox()
         
         # Genetic operators
-        self.toolbox.register("attr_bool", random.randint, 0, 1)
-        self.toolbox.register("individual", tools.initRepeat, 
-                             creator.Individual, self.toolbox.attr_bool, 64)
-        self.toolbox.register("population", tools.initRepeat, 
-                             list, self.toolbox.individual)
+        toolbox.register("attr_bool", random.randint, 0, 1)
+        toolbox.register("individual", tools.initRepeat, 
+                         creator.Individual, toolbox.attr_bool, self.GENOME_LENGTH)
+        toolbox.register("population", tools.initRepeat, 
+                         list, toolbox.individual)
         
         # Evolution operators
-        self.toolbox.register("evaluate", self.evaluate_individual)
-        self.toolbox.register("mate", tools.cxTwoPoint)
-        self.toolbox.register("mutate", tools.mutFlipBit, indpb=0.1)
-        self.toolbox.register("select", tools.selTournament, tournsize=3)
+        toolbox.register("evaluate", self.evaluate_individual)
+        toolbox.register("mate", tools.cxTwoPoint)
+        toolbox.register("mutate", tools.mutFlipBit, indpb=self.mutation_indpb)
+        toolbox.register("select", tools.selTournament, tournsize=self.tournament_size)
+        
+        self._toolbox = toolbox
         
         print("✅ DEAP framework configured")
     
     def setup_neural_networks(self):
         """Setup PyTorch neural networks for each sector"""
         
-        sectors = ['FERPA', 'FISMA', 'CIPA', 'GENERAL']
-        
-        for sector in sectors:
+        for sector in self.SECTORS:
             model = SecurityPolicyNetwork()
             optimizer = optim.Adam(model.parameters(), lr=0.001)
             criterion = nn.BCELoss()
             
-            self.sector_models[sector] = {
+            self._sector_models[sector] = {
                 'model': model,
                 'optimizer': optimizer,
                 'criterion': criterion,
-                'training_data': self.generate_training_data(sector),
+                'training_data': self.load_training_corpus(sector),
                 'accuracy': 0.0
             }
         
         print("✅ PyTorch neural networks initialized for all sectors")
     
+    def load_training_corpus(self, sector: str) -> TrainingCorpus:
+        """The sector's on-disk corpus if one is configured, else a synthetic in-memory one"""
+        
+        if self.training_data_dir:
+            directory = os.path.join(self.training_data_dir, sector.lower())
+            if os.path.exists(os.path.join(directory, 'features.npy')):
+                corpus = TrainingCorpus.from_directory(directory, holdout=self.holdout_fraction)
+                if corpus.feature_count != self.GENOME_LENGTH:
+                    raise ValueError(f"{directory}: expected {self.GENOME_LENGTH} features, "
+                                     f"got {corpus.feature_count}")
+                print(f"📚 Memory-mapped {len(corpus)} training rows for {sector} from {directory}")
+                return corpus
+        
+        training_data = self.generate_training_data(sector)
+        return TrainingCorpus(training_data['inputs'].numpy(), training_data['labels'].numpy(),
+                              holdout=self.holdout_fraction)
+    
     def generate_training_data(self, sector: str) -> Dict[str, torch.Tensor]:
         """Generate synthetic training data for sector-specific policies"""
         
@@ -162,6 +1237,21 @@ class CypherAIGeneticEngine:
     def evaluate_individual(self, individual: List[int]) -> Tuple[float, float]:
         """Evaluate an individual's fitness using neural network prediction"""
         
+        self.ensure_initialized()
+        cache_key = self.fitness_cache.genome_key(individual)
+        cached = self.fitness_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        version = self.fitness_cache.model_version
+        with self.model_lock:
+            fitness = self._evaluate_individual_uncached(individual)
+        self.fitness_cache.put(cache_key, fitness, version)
+        return fitness
+    
+    def _evaluate_individual_uncached(self, individual: List[int]) -> Tuple[float, float]:
+        """Run every sector model on a single genome"""
+        
         # Convert individual to PyTorch tensor
         genome_tensor = torch.tensor(individual, dtype=torch.float32).unsqueeze(0)
         
@@ -169,11 +1259,10 @@ class CypherAIGeneticEngine:
         sector_scores = []
         false_positives = []
         
-        for sector, model_data in self.sector_models.items():
-            model = model_data['model']
-            model.eval()
+        for sector in self.sector_models:
+            model = self.inference_model(sector)
             
-            with torch.no_grad():
+            with torch.inference_mode():
                 prediction = model(genome_tensor)
                 
                 # Simulate threat detection accuracy
@@ -191,68 +1280,308 @@ class CypherAIGeneticEngine:
         
         return (overall_accuracy, overall_fp_rate)
     
+    def evaluate_population(self, population: List[List[int]]) -> List[Tuple[float, float]]:
+        """Evaluate a whole population in one batched pass and assign DEAP fitness values"""
+        
+        if not population:
+            return []
+        
+        genomes = np.asarray(population, dtype=np.uint8)
+        packed = np.packbits(genomes, axis=1)
+        
+        # Serve cached genomes and batch each distinct uncached genome once
+        fitnesses = [None] * len(population)
+        pending = {}
+        for index, row in enumerate(packed):
+            key = row.tobytes()
+            if key in pending:
+                pending[key].append(index)
+                continue
+            
+            cached = self.fitness_cache.get(key)
+            if cached is not None:
+                fitnesses[index] = cached
+            else:
+                pending[key] = [index]
+        
+        if pending:
+            version = self.fitness_cache.model_version
+            rows = [indices[0] for indices in pending.values()]
+            accuracies, fp_rates = self.score_genomes(genomes[rows])
+            for (key, indices), acc, fp in zip(pending.items(), accuracies, fp_rates):
+                fitness = (float(acc), float(fp))
+                self.fitness_cache.put(key, fitness, version)
+                for index in indices:
+                    fitnesses[index] = fitness
+        
+        for ind, fit in zip(population, fitnesses):
+            ind.fitness.values = fit
+        
+        return fitnesses
+    
+    def evaluate_packed(self, packed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Evaluate a bit-packed population, scoring each distinct uncached genome once"""
+        
+        unique_rows, inverse = np.unique(packed, axis=0, return_inverse=True)
+        accuracies = np.empty(len(unique_rows))
+        fp_rates = np.empty(len(unique_rows))
+        
+        missing = []
+        for index, row in enumerate(unique_rows):
+            cached = self.fitness_cache.get(row.tobytes())
+            if cached is None:
+                missing.append(index)
+            else:
+                accuracies[index], fp_rates[index] = cached
+        
+        if missing:
+            version = self.fitness_cache.model_version
+            missing_rows = unique_rows[missing]
+            scored_acc, scored_fp = self.score_genomes(
+                unpack_genomes(missing_rows, self.GENOME_LENGTH)
+            )
+            accuracies[missing] = scored_acc
+            fp_rates[missing] = scored_fp
+            for row, acc, fp in zip(missing_rows, scored_acc, scored_fp):
+                self.fitness_cache.put(row.tobytes(), (float(acc), float(fp)), version)
+        
+        inverse = inverse.reshape(-1)
+        return accuracies[inverse], fp_rates[inverse]
+    
+    def score_genomes(self, genomes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Score an (N, 64) genome matrix, returning accuracy (%) and false positive rate arrays"""
+        
+        self.ensure_initialized()
+        genome_tensor = torch.from_numpy(np.ascontiguousarray(genomes, dtype=np.float32))
+        
+        # One forward pass per sector model over the whole batch
+        sector_scores = []
+        with self.model_lock:
+            for sector in self.sector_models:
+                model = self.inference_model(sector)
+                
+                with torch.inference_mode():
+                    predictions = model(genome_tensor).reshape(-1)
+                sector_scores.append(predictions.numpy())
+        
+        overall_accuracy = np.mean(sector_scores, axis=0, dtype=np.float64) * 100
+        overall_fp_rate = self.calculate_false_positive_rates(genomes).mean(axis=1)
+        
+        return overall_accuracy, overall_fp_rate
+    
+    def calculate_false_positive_rates(self, genomes: np.ndarray) -> np.ndarray:
+        """Vectorized false positive rates, returning an (N, num_sectors) array"""
+        
+        strictness = np.asarray(genomes, dtype=np.float64).mean(axis=1)
+        multipliers = np.array([
+            self.SECTOR_FP_MULTIPLIERS.get(sector, 0.7) for sector in self.sector_models
+        ])
+        
+        base_fp_rate = strictness * 0.15
+        return np.minimum(0.3, base_fp_rate[:, None] * multipliers[None, :])
+    
     def calculate_false_positive_rate(self, individual: List[int], sector: str) -> float:
         """Calculate false positive rate based on individual's genome and sector"""
         
         # Count number of 1s in genome (policy strictness)
         strictness = sum(individual) / len(individual)
         
-        # Sector-specific false positive calculation
-        sector_multipliers = {
-            'FERPA': 0.8,   # Education needs balance
-            'FISMA': 0.6,   # Government can be stricter
-            'CIPA': 0.9,    # Schools need careful filtering
-            'GENERAL': 0.7  # General purpose
-        }
-        
         base_fp_rate = strictness * 0.15  # Base false positive rate
-        sector_fp_rate = base_fp_rate * sector_multipliers.get(sector, 0.7)
+        sector_fp_rate = base_fp_rate * self.SECTOR_FP_MULTIPLIERS.get(sector, 0.7)
         
         return min(0.3, sector_fp_rate)  # Cap at 30%
     
-    def train_neural_networks(self, generation: int):
+    def train_neural_networks(self, generation: int, background: bool = None):
         """Train neural networks periodically during evolution"""
         
-        if generation % 10 != 0:
+        if not self.training_interval or generation % self.training_interval != 0:
+            return
+        
+        if background is None:
+            background = self.background_training
+        
+        if background:
+            self.start_background_training(generation)
             return
         
         print(f"🧠 Training neural networks at generation {generation}")
         
+        with self.model_lock:
+            self._train_sector_models()
+        
+        print(f"✅ Neural network training completed")
+    
+    def _train_sector_models(self):
+        """Run one training pass over every sector model"""
+        
         for sector, model_data in self.sector_models.items():
-            model = model_data['model']
-            optimizer = model_data['optimizer']
-            criterion = model_data['criterion']
-            training_data = model_data['training_data']
+            model_data['accuracy'] = self._fit_sector_model(
+                model_data['model'], model_data['optimizer'],
+                model_data['criterion'], model_data['training_data']
+            )
+        
+        self.mark_models_updated()
+    
+    def _fit_sector_model(self, model, optimizer, criterion, training_data: TrainingCorpus,
+                          epochs: int = 10) -> float:
+        """Train one sector model in place, returning its accuracy on the held-out rows"""
+        
+        # Full batch for in-memory corpora unless a mini-batch size is configured
+        train_on_corpus(model, optimizer, criterion, training_data, epochs, self.training_batch_size)
+        accuracy, _ = evaluate_on_corpus(model, criterion, training_data, self.training_batch_size)
+        return accuracy
+
+    def start_background_training(self, generation: int) -> bool:
+        """Train copies of the sector models on a background thread; False if a pass is already running"""
+        
+        with self._training_lock:
+            if self._pending_training is not None:
+                return False
             
-            model.train()
+            # Snapshot each model together with its optimizer so the copied optimizer tracks the copied weights,
+            # and note its weight revision so in-place updates made meanwhile are not overwritten by the swap
+            with self.model_lock:
+                snapshot = {
+                    sector: ((model_data['model'], model_data.get('revision', 0)), copy.deepcopy((
+                        model_data['model'], model_data['optimizer'], model_data['criterion']
+                    )))
+                    for sector, model_data in self.sector_models.items()
+                }
             
-            # Training loop
-            for epoch in range(10):
-                optimizer.zero_grad()
+            if self._training_executor is None:
+                self._training_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cypher-train')
+            
+            print(f"🧠 Training neural networks at generation {generation} (background)")
+            self._pending_training = self._training_executor.submit(self._train_model_copies, snapshot)
+            return True
+    
+    def _train_model_copies(self, snapshot: Dict[str, Tuple]) -> Dict[str, Tuple]:
+        """Background trainer: fit each copied model without touching the live ones"""
+        
+        trained = {}
+        for sector, (source, (model, optimizer, criterion)) in snapshot.items():
+            training_data = self._sector_models[sector]['training_data']
+            accuracy = self._fit_sector_model(model, optimizer, criterion, training_data)
+            trained[sector] = (source, model, optimizer, accuracy)
+        return trained
+    
+    def swap_trained_models(self) -> bool:
+        """Install finished background training at a generation boundary; True if models changed"""
+        
+        with self._training_lock:
+            future = self._pending_training
+            if future is None or not future.done():
+                return False
+            self._pending_training = None
+        
+        try:
+            trained = future.result()
+        except Exception as e:
+            print(f"ERROR: Background training failed: {e}", file=sys.stderr)
+            sys.stderr.flush()
+            return False
+        
+        # Swap every sector in one critical section so scoring never sees a mix of old and new models
+        swapped = 0
+        with self.model_lock:
+            for sector, ((source_model, revision), model, optimizer, accuracy) in trained.items():
+                model_data = self._sector_models.get(sector)
                 
-                outputs = model(training_data['inputs'])
-                loss = criterion(outputs.squeeze(), training_data['labels'])
+                # Skip sectors whose live model was replaced (NAS, restore) or updated in place (federated
+                # averaging) since the snapshot; the trained copy descends from weights that no longer exist
+                if (model_data is None or model_data['model'] is not source_model
+                        or model_data.get('revision', 0) != revision):
+                    continue
                 
-                loss.backward()
-                optimizer.step()
+                model_data['model'] = model
+                model_data['optimizer'] = optimizer
+                model_data['accuracy'] = accuracy
+                swapped += 1
             
-            # Evaluate model accuracy
+            if swapped:
+                self.mark_models_updated()
+        
+        if swapped:
+            print(f"✅ Neural network training completed (swapped {swapped} sector models)")
+        return bool(swapped)
+
+    def inference_model(self, sector: str):
+        """Scoring module for a sector, exported on first use after each model change (call under model_lock)"""
+        
+        if self.inference_backend not in self.INFERENCE_BACKENDS:
+            raise ValueError(f"Unknown inference backend: {self.inference_backend}")
+        
+        model = self._sector_models[sector]['model']
+        if self.inference_backend == 'eager':
             model.eval()
-            with torch.no_grad():
-                predictions = model(training_data['inputs'])
-                predicted_labels = (predictions.squeeze() > 0.5).float()
-                accuracy = (predicted_labels == training_data['labels']).float().mean()
-                model_data['accuracy'] = float(accuracy)
+            return model
         
-        print(f"✅ Neural network training completed")
+        cached = self._inference_models.get(sector)
+        if cached is None or cached[0] is not model:
+            try:
+                cached = (model, model.inference_module(quantize=self.inference_backend == 'quantized'))
+            except Exception as e:
+                print(f"⚠️ Inference export failed for {sector} ({e}), scoring with the eager model")
+                model.eval()
+                cached = (model, model)
+            self._inference_models[sector] = cached
+        return cached[1]
     
-    def run_evolution(self, sector: str = 'GENERAL'):
+    def _bump_revision(self, sector: str):
+        """Record that a sector's weights changed outside training (call under model_lock)"""
+        model_data = self._sector_models[sector]
+        model_data['revision'] = model_data.get('revision', 0) + 1
+    
+    def mark_models_updated(self):
+        """Bump the model version after any sector model changes, invalidating cached fitness and exports"""
+        
+        self.model_version += 1
+        self.fitness_cache.invalidate(self.model_version)
+        self._inference_models = {}
+    
+    def run_evolution(self, sector: str = 'GENERAL', batch_evaluation: bool = None,
+                      backend: str = None, population_size: int = None,
+                      cancel_event: threading.Event = None, generation_callback=None,
+                      max_generations: int = None, profile: bool = None,
+                      deadline_seconds: float = None, max_evaluations: int = None,
+                      stagnation_patience: int = None, seed_genomes: List[Any] = None,
+                      elite_ratio: float = None, selection: str = None):
         """Run genetic algorithm evolution for a specific sector"""
         
+        if batch_evaluation is None:
+            batch_evaluation = self.batch_evaluation
+        if backend is None:
+            backend = self.population_backend
+        if population_size is None:
+            population_size = self.population_size
+        if max_generations is None:
+            max_generations = self.max_generations
+        if stagnation_patience is None:
+            stagnation_patience = self.stagnation_patience
+        if profile is None:
+            profile = self.profile_phases
+        if selection is None:
+            selection = self.selection_mode
+        
+        if backend not in self.POPULATION_BACKENDS:
+            raise ValueError(f"Unknown population backend: {backend}")
+        if selection not in self.SELECTION_MODES:
+            raise ValueError(f"Unknown selection mode: {selection}")
+        if backend == 'numpy':
+            return self.run_packed_evolution(sector, population_size, cancel_event=cancel_event,
+                                             max_generations=max_generations, profile=profile,
+                                             deadline_seconds=deadline_seconds,
+                                             max_evaluations=max_evaluations,
+                                             stagnation_patience=stagnation_patience,
+                                             seed_genomes=seed_genomes, elite_ratio=elite_ratio,
+                                             selection=selection)
+        
         print(f"🚀 Starting evolution for sector: {sector}")
         
-        # Create initial population
-        population = self.toolbox.population(n=self.population_size)
+        # Create initial population: seeds and archived elites first, random individuals for the rest
+        warm_start = self.warm_start_genomes(sector, population_size, seed_genomes, elite_ratio)
+        population = [creator.Individual(genome.tolist()) for genome in warm_start]
+        population += self.toolbox.population(n=population_size - len(population))
         
         # Evolution statistics
         stats = tools.Statistics(lambda ind: ind.fitness.values)
@@ -261,29 +1590,66 @@ class CypherAIGeneticEngine:
         stats.register("min", np.min, axis=0)
         stats.register("max", np.max, axis=0)
         
-        # Hall of fame for best individuals
-        hof = tools.HallOfFame(10)
+        # Hall of fame for best individuals; under NSGA-II, every non-dominated individual seen
+        hof = tools.ParetoFront() if selection == 'nsga2' else tools.HallOfFame(10)
+        
+        cache_start = self.fitness_cache.thread_stats()
+        evaluated_version = None
+        parents = None
+        mutation_indpb = self.mutation_indpb
+        progress = ProgressThrottle(self.emit_message, 'EVOLUTION', self.progress_interval)
+        timer = PhaseTimer()
+        monitor = ConvergenceMonitor(stagnation_patience, self.stagnation_min_delta, self.diversity_floor)
+        deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+        stop_reason = 'max_generations'
+        history = self.evolution_stats.start_run(sector)
         
         # Run evolution
-        for generation in range(self.max_generations):
+        for generation in range(max_generations):
             self.generation = generation
+            timer.start()
+            self.swap_trained_models()
+            timer.mark('model_swap')
             
-            # Evaluate population
-            fitnesses = list(map(self.toolbox.evaluate, population))
-            for ind, fit in zip(population, fitnesses):
-                ind.fitness.values = fit
+            # NSGA-II survival competes last generation's parents against their offspring
+            if parents is not None:
+                population[:] = parents + population
+            
+            # Evaluate population; unmodified clones keep their fitness unless the models changed
+            if evaluated_version == self.model_version:
+                invalid = [ind for ind in population if not ind.fitness.valid]
+            else:
+                invalid = population
+            
+            # Fitness scored from here on reflects at least this version of the models
+            scoring_version = self.model_version
+            if batch_evaluation:
+                self.evaluate_population(invalid)
+            else:
+                fitnesses = list(map(self.toolbox.evaluate, invalid))
+                for ind, fit in zip(invalid, fitnesses):
+                    ind.fitness.values = fit
+            evaluated_version = scoring_version
+            timer.mark('evaluation')
             
             # Update hall of fame
-            hof.update(population)
+            if selection == 'nsga2':
+                ranks, fronts = self.rank_pareto(*self.fitness_arrays(population))
+                survivors = np.argsort(-ranks)[:population_size]
+                population[:] = [population[index] for index in survivors]
+                hof.update([population[index] for index in np.flatnonzero(fronts[survivors] == 0)])
+            else:
+                hof.update(population)
+            timer.mark('hall_of_fame')
             
             # Record statistics
             record = stats.compile(population)
-            self.evolution_stats['best_fitness'].append(record['max'][0])
-            self.evolution_stats['avg_fitness'].append(record['avg'][0])
+            timer.mark('statistics')
             
             # Calculate population diversity
             diversity = self.calculate_diversity(population)
-            self.evolution_stats['diversity'].append(diversity)
+            history.append(generation, record['max'][0], record['avg'][0], diversity)
+            timer.mark('diversity')
             
             # Send progress update
             progress_data = {
@@ -292,44 +1658,274 @@ class CypherAIGeneticEngine:
                 'best_fitness': record['max'][0],
                 'avg_fitness': record['avg'][0],
                 'diversity': diversity,
-                'population_size': len(population)
+                'population_size': len(population),
+                **self.cache_progress(cache_start)
             }
             
-            print(f"EVOLUTION:{json.dumps(progress_data)}")
-            sys.stdout.flush()
+            progress.update(progress_data)
+            timer.mark('progress')
+            
+            # Hook for island migration; may replace individuals in place
+            if generation_callback is not None:
+                generation_callback(generation, population, hof, record)
+                timer.mark('migration')
             
             # Check if target fitness reached
             if record['max'][0] >= self.target_fitness:
                 print(f"🎯 Target fitness {self.target_fitness}% reached in generation {generation}")
+                stop_reason = 'target_reached'
+                break
+            
+            if cancel_event is not None and cancel_event.is_set():
+                print(f"⏹️ Evolution cancelled for {sector} at generation {generation}")
+                stop_reason = 'cancelled'
+                break
+            
+            # Budgets and convergence
+            reason = self.evolution_stop_reason(monitor, record['max'][0], record['avg'][0], diversity,
+                                                progress_data['cache_misses'], deadline, max_evaluations)
+            if reason:
+                print(f"⏹️ Evolution stopped for {sector} at generation {generation}: {reason}")
+                stop_reason = reason
                 break
             
             # Selection and reproduction
-            offspring = self.toolbox.select(population, len(population))
+            if selection == 'nsga2':
+                parents = list(population)
+                ranks, _ = self.rank_pareto(*self.fitness_arrays(population))
+                offspring = [population[index] for index in self.packed_tournament_selection(ranks, len(population))]
+            else:
+                offspring = self.toolbox.select(population, len(population))
             offspring = list(map(self.toolbox.clone, offspring))
+            timer.mark('selection')
             
             # Crossover
             for child1, child2 in zip(offspring[::2], offspring[1::2]):
-                if random.random() < 0.8:  # Crossover probability
+                if random.random() < self.crossover_probability:
                     self.toolbox.mate(child1, child2)
                     del child1.fitness.values
                     del child2.fitness.values
+            timer.mark('crossover')
             
             # Mutation
             for mutant in offspring:
-                if random.random() < 0.1:  # Mutation probability
-                    self.toolbox.mutate(mutant)
+                if random.random() < self.mutation_probability:
+                    self.toolbox.mutate(mutant, indpb=mutation_indpb)
                     del mutant.fitness.values
             
             # Replace population
             population[:] = offspring
+            timer.mark('mutation')
+            
+            # Train neural networks periodically
+            self.train_neural_networks(generation)
+            timer.mark('training')
+            
+            # Checkpoint models and hall of fame periodically
+            if self.checkpoint_due(generation):
+                self.archive_hall_of_fame(sector, hof)
+                self.save_checkpoint()
+            timer.mark('checkpoint')
+            
+            # Adaptive parameter adjustment
+            mutation_indpb = self.adaptive_parameter_adjustment(generation, record, diversity)
+            timer.mark('adaptation')
+            
+            if profile:
+                self.emit_phase_profile(sector, generation, timer)
+        
+        # Final results
+        progress.flush()
+        history.finish(stop_reason)
+        if profile:
+            self.emit_phase_profile(sector, generation, timer, run=True)
+        self.archive_hall_of_fame(sector, hof)
+        if self.checkpoint_dir:
+            self.save_checkpoint()
+        
+        best_individual = hof[0]
+        final_fitness = self.toolbox.evaluate(best_individual)
+        
+        print(f"🏆 Evolution completed for {sector}")
+        print(f"   Best fitness: {final_fitness[0]:.2f}%")
+        print(f"   False positive rate: {final_fitness[1]:.3f}")
+        
+        return {
+            'best_individual': best_individual,
+            'fitness': final_fitness,
+            'generation': generation,
+            'hall_of_fame': list(hof),
+            'phase_ms': PhaseTimer.as_ms(timer.totals),
+            'stop_reason': stop_reason,
+            'evaluations': self.cache_progress(cache_start)['cache_misses'],
+            'run_id': history.run_id,
+            'selection': selection
+        }
+    
+    def run_packed_evolution(self, sector: str = 'GENERAL', population_size: int = None,
+                             cancel_event: threading.Event = None, max_generations: int = None,
+                             profile: bool = None, deadline_seconds: float = None,
+                             max_evaluations: int = None, stagnation_patience: int = None,
+                             seed_genomes: List[Any] = None, elite_ratio: float = None,
+                             selection: str = None):
+        """Run evolution on a bit-packed NumPy population with vectorized operators"""
+        
+        if population_size is None:
+            population_size = self.population_size
+        if max_generations is None:
+            max_generations = self.max_generations
+        if stagnation_patience is None:
+            stagnation_patience = self.stagnation_patience
+        if profile is None:
+            profile = self.profile_phases
+        if selection is None:
+            selection = self.selection_mode
+        if selection not in self.SELECTION_MODES:
+            raise ValueError(f"Unknown selection mode: {selection}")
+        
+        self.ensure_initialized()
+        print(f"🚀 Starting packed evolution for sector: {sector}")
+        
+        # Whole generation lives in one (N, L/8) uint8 array; seeds and archived elites come first
+        warm_start = self.warm_start_genomes(sector, population_size, seed_genomes, elite_ratio)
+        population = pack_genomes(np.concatenate([
+            warm_start,
+            self.rng.integers(0, 2, size=(population_size - len(warm_start), self.GENOME_LENGTH), dtype=np.uint8)
+        ]))
+        
+        # Hall of fame for best individuals; under NSGA-II, every non-dominated individual seen
+        hof = tools.ParetoFront() if selection == 'nsga2' else tools.HallOfFame(10)
+        
+        cache_start = self.fitness_cache.thread_stats()
+        mutation_indpb = self.mutation_indpb
+        parents = None
+        progress = ProgressThrottle(self.emit_message, 'EVOLUTION', self.progress_interval)
+        timer = PhaseTimer()
+        monitor = ConvergenceMonitor(stagnation_patience, self.stagnation_min_delta, self.diversity_floor)
+        deadline = time.monotonic() + deadline_seconds if deadline_seconds else None
+        stop_reason = 'max_generations'
+        history = self.evolution_stats.start_run(sector)
+        
+        for generation in range(max_generations):
+            self.generation = generation
+            timer.start()
+            self.swap_trained_models()
+            timer.mark('model_swap')
+            
+            # NSGA-II survival competes last generation's parents (cache hits) against their offspring
+            if parents is not None:
+                population = np.concatenate([parents, population])
+            
+            # Evaluate population
+            genes = unpack_genomes(population, self.GENOME_LENGTH)
+            accuracies, fp_rates = self.evaluate_packed(population)
+            if selection == 'nsga2':
+                ranks, fronts = self.rank_pareto(accuracies, fp_rates)
+                survivors = np.argsort(-ranks)[:population_size]
+                population, genes = population[survivors], genes[survivors]
+                accuracies, fp_rates = accuracies[survivors], fp_rates[survivors]
+                ranks, fronts = ranks[survivors], fronts[survivors]
+            else:
+                ranks = self.rank_fitness(accuracies, fp_rates)
+            timer.mark('evaluation')
+            
+            # Only the generation's top individuals (or its Pareto front) can enter the hall of fame
+            if selection == 'nsga2':
+                front = np.flatnonzero(fronts == 0)
+                hof.update(self.packed_to_individuals(genes[front], accuracies[front], fp_rates[front],
+                                                      ranks[front], len(front)))
+            else:
+                hof.update(self.packed_to_individuals(genes, accuracies, fp_rates, ranks, hof.maxsize))
+            timer.mark('hall_of_fame')
+            
+            # Record statistics
+            best_fitness = float(accuracies.max())
+            avg_fitness = float(accuracies.mean())
+            record = {
+                'avg': np.array([avg_fitness, fp_rates.mean()]),
+                'std': np.array([accuracies.std(), fp_rates.std()]),
+                'min': np.array([accuracies.min(), fp_rates.min()]),
+                'max': np.array([best_fitness, fp_rates.max()])
+            }
+            timer.mark('statistics')
+            
+            # Calculate population diversity
+            diversity = self.calculate_diversity(genes)
+            history.append(generation, best_fitness, avg_fitness, diversity)
+            timer.mark('diversity')
+            
+            # Send progress update
+            progress_data = {
+                'sector': sector,
+                'generation': generation,
+                'best_fitness': best_fitness,
+                'avg_fitness': avg_fitness,
+                'diversity': diversity,
+                'population_size': len(population),
+                **self.cache_progress(cache_start)
+            }
+            
+            progress.update(progress_data)
+            timer.mark('progress')
+            
+            # Check if target fitness reached
+            if best_fitness >= self.target_fitness:
+                print(f"🎯 Target fitness {self.target_fitness}% reached in generation {generation}")
+                stop_reason = 'target_reached'
+                break
+            
+            if cancel_event is not None and cancel_event.is_set():
+                print(f"⏹️ Evolution cancelled for {sector} at generation {generation}")
+                stop_reason = 'cancelled'
+                break
+            
+            # Budgets and convergence
+            reason = self.evolution_stop_reason(monitor, best_fitness, avg_fitness, diversity,
+                                                progress_data['cache_misses'], deadline, max_evaluations)
+            if reason:
+                print(f"⏹️ Evolution stopped for {sector} at generation {generation}: {reason}")
+                stop_reason = reason
+                break
+            
+            # Selection and reproduction (fancy indexing copies the selected rows)
+            if selection == 'nsga2':
+                parents = population
+            offspring = population[self.packed_tournament_selection(ranks, len(population))]
+            timer.mark('selection')
+            self.packed_crossover(offspring)
+            timer.mark('crossover')
+            self.packed_mutation(offspring, mutation_indpb)
+            
+            # Replace population
+            population = offspring
+            timer.mark('mutation')
             
             # Train neural networks periodically
             self.train_neural_networks(generation)
+            timer.mark('training')
+            
+            # Checkpoint models and hall of fame periodically
+            if self.checkpoint_due(generation):
+                self.archive_hall_of_fame(sector, hof)
+                self.save_checkpoint()
+            timer.mark('checkpoint')
             
             # Adaptive parameter adjustment
-            self.adaptive_parameter_adjustment(generation, record)
+            mutation_indpb = self.adaptive_parameter_adjustment(generation, record, diversity)
+            timer.mark('adaptation')
+            
+            if profile:
+                self.emit_phase_profile(sector, generation, timer)
         
         # Final results
+        progress.flush()
+        history.finish(stop_reason)
+        if profile:
+            self.emit_phase_profile(sector, generation, timer, run=True)
+        self.archive_hall_of_fame(sector, hof)
+        if self.checkpoint_dir:
+            self.save_checkpoint()
+        
         best_individual = hof[0]
         final_fitness = self.toolbox.evaluate(best_individual)
         
@@ -341,169 +1937,1676 @@ class CypherAIGeneticEngine:
             'best_individual': best_individual,
             'fitness': final_fitness,
             'generation': generation,
-            'hall_of_fame': list(hof)
+            'hall_of_fame': list(hof),
+            'phase_ms': PhaseTimer.as_ms(timer.totals),
+            'stop_reason': stop_reason,
+            'evaluations': self.cache_progress(cache_start)['cache_misses'],
+            'run_id': history.run_id,
+            'selection': selection
+        }
+    
+    def warm_start_genomes(self, sector: str, population_size: int, seed_genomes: List[Any] = None,
+                           elite_ratio: float = None) -> np.ndarray:
+        """Starting genomes from explicit seeds, then the sector's elite archive; callers fill the rest randomly"""
+        
+        if elite_ratio is None:
+            elite_ratio = self.elite_ratio
+        
+        rows = [self.normalize_seed_genome(genome) for genome in (seed_genomes or [])[:population_size]]
+        seeded = len(rows)
+        
+        elite_count = min(int(round(elite_ratio * population_size)), population_size - seeded)
+        if elite_count > 0:
+            with self._checkpoint_lock:
+                archive = list(self.hall_of_fame.get(sector, []))
+            rows.extend(np.asarray(individual, dtype=np.uint8) for individual in archive[:elite_count])
+        
+        if not rows:
+            return np.zeros((0, self.GENOME_LENGTH), dtype=np.uint8)
+        
+        print(f"🌱 Warm start for {sector}: {seeded} seeds, {len(rows) - seeded} archived elites")
+        return np.stack(rows)
+    
+    def normalize_seed_genome(self, genome) -> np.ndarray:
+        """0/1 genome from a bit list, a list of [0, 1] floats, packed hex, or a record with a 'genome' key"""
+        
+        if isinstance(genome, dict):
+            genome = genome['genome']
+        if isinstance(genome, str):
+            genome = self.decode_genome(genome)
+        
+        genes = np.asarray(genome, dtype=np.float64).reshape(-1)
+        if len(genes) != self.GENOME_LENGTH:
+            raise ValueError(f"Seed genome has {len(genes)} genes, expected {self.GENOME_LENGTH}")
+        return (genes > 0.5).astype(np.uint8)
+    
+    def load_seed_genomes(self, path: str) -> List[Any]:
+        """Read seed genomes from a .npy matrix (0/1 or bit-packed) or a JSON list / {"genomes": [...]} file"""
+        
+        if not os.path.exists(path):
+            raise ValueError(f"Seed file not found: {path}")
+        
+        if path.endswith('.npy'):
+            genomes = np.load(path)
+            if genomes.dtype == np.uint8 and genomes.ndim == 2 and genomes.shape[1] == self.GENOME_LENGTH // 8:
+                genomes = unpack_genomes(genomes, self.GENOME_LENGTH)
+            return list(genomes)
+        
+        with open(path) as seed_file:
+            data = json.load(seed_file)
+        if isinstance(data, dict):
+            data = data.get('genomes', data.get('individuals', []))
+        return list(data)
+    
+    def evolution_stop_reason(self, monitor: ConvergenceMonitor, best_fitness: float, avg_fitness: float,
+                              diversity: float, evaluations: int, deadline: float = None,
+                              max_evaluations: int = None) -> str:
+        """Why a run should stop after this generation (budget or convergence), or None to continue"""
+        
+        convergence = monitor.update(best_fitness, avg_fitness, diversity, self.model_version)
+        if deadline is not None and time.monotonic() >= deadline:
+            return 'deadline'
+        if max_evaluations and evaluations >= max_evaluations:
+            return 'evaluation_budget'
+        return convergence
+    
+    def emit_phase_profile(self, sector: str, generation: int, timer: PhaseTimer, run: bool = False):
+        """Emit a PROFILE message with one generation's (or the whole run's) phase timings"""
+        
+        phases = PhaseTimer.as_ms(timer.totals if run else timer.generation)
+        total_ms = sum(phases.values())
+        payload = {
+            'sector': sector,
+            'scope': 'run' if run else 'generation',
+            'generation': generation,
+            'phases_ms': phases,
+            'total_ms': total_ms
+        }
+        if run:
+            payload['mean_generation_ms'] = total_ms / (generation + 1)
+        self.emit_message('PROFILE', payload)
+    
+    def profile_evolution(self, sector: str = 'GENERAL', max_generations: int = 50,
+                          population_size: int = None, backend: str = None,
+                          interval_ms: float = 5.0, top: int = 25,
+                          cancel_event: threading.Event = None) -> Dict[str, Any]:
+        """Run one evolution under the sampling profiler and report its hot spots"""
+        
+        self.ensure_initialized()
+        profiler = SamplingProfiler(interval=interval_ms / 1000)
+        started = time.perf_counter()
+        
+        profiler.start()
+        try:
+            result = self.run_evolution(sector, backend=backend, population_size=population_size,
+                                        cancel_event=cancel_event, max_generations=max_generations)
+        finally:
+            profiler.stop()
+        
+        return {
+            'sector': sector,
+            'scope': 'sampling',
+            'generations': result['generation'] + 1,
+            'elapsed_ms': (time.perf_counter() - started) * 1000,
+            'phases_ms': result['phase_ms'],
+            **profiler.report(top)
+        }
+    
+    def emit_message(self, kind: str, payload: Dict[str, Any]):
+        """Write a protocol message (EVOLUTION, FITNESS, ...) to the progress channel"""
+        
+        job_id = getattr(self._job_context, 'job_id', None)
+        if job_id is not None:
+            payload = {'job_id': job_id, **payload}
+        
+        self.progress_channel.write(kind, payload)
+    
+    @contextmanager
+    def fork_guard(self):
+        """Hold every engine lock across a fork so no child inherits one mid-update"""
+        
+        # Job threads may be scoring, training or printing while another job forks its workers.
+        # Acquired in the order the engine nests them: training, checkpoint, models, then leaf locks.
+        self.ensure_initialized()
+        locks = [self._training_lock, self._checkpoint_lock, self.model_lock, self.fitness_cache._lock,
+                 self.evolution_stats._lock, self.progress_channel._lock]
+        if isinstance(sys.stdout, _LineSynchronizedWriter):
+            locks.append(sys.stdout._lock)
+        
+        with ExitStack() as stack:
+            for lock in locks:
+                stack.enter_context(lock)
+            yield
+    
+    def reset_locks_after_fork(self):
+        """Replace the locks a forked child inherited in the held state from fork_guard"""
+        
+        self._training_lock = threading.Lock()
+        self._checkpoint_lock = threading.Lock()
+        self.model_lock = threading.RLock()
+        self.fitness_cache._lock = threading.Lock()
+        self.evolution_stats._lock = threading.Lock()
+        self.progress_channel._lock = threading.Lock()
+        _reset_stdout_lock_after_fork()
+    
+    def run_all_sectors(self, sectors: List[str] = None, max_workers: int = None,
+                        cancel_event: threading.Event = None,
+                        **evolution_options) -> Dict[str, Any]:
+        """Evolve several sectors concurrently, one worker process per sector"""
+        
+        sectors = list(sectors or self.SECTORS)
+        unknown = [sector for sector in sectors if sector not in self.sector_models]
+        if unknown:
+            raise ValueError(f"Unknown sectors: {unknown}")
+        
+        cpu_count = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers or cpu_count, len(sectors)))
+        start_time = time.time()
+        
+        print(f"🚀 Starting evolution for {len(sectors)} sectors on {max_workers} workers")
+        
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            # Without fork the workers could not share the parent's models; run in series
+            results = {}
+            for sector in sectors:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                result = self.sector_result_payload(
+                    sector, self.run_evolution(sector, cancel_event=cancel_event, **evolution_options)
+                )
+                self.emit_message('FITNESS', result)
+                results[sector] = result
+            return {'sectors': results, 'workers': 1, 'elapsed': time.time() - start_time}
+        
+        # Forked workers share the parent's model weights copy-on-write
+        context = multiprocessing.get_context('fork')
+        queue = context.Queue()
+        threads_per_worker = max(1, cpu_count // max_workers)
+        
+        pending = list(sectors)
+        running = {}
+        results = {}
+        
+        sys.stdout.flush()
+        while pending or running:
+            if cancel_event is not None and cancel_event.is_set():
+                pending.clear()
+                for sector, worker in running.items():
+                    worker.terminate()
+                    worker.join()
+                    results[sector] = {'sector': sector, 'error': 'cancelled'}
+                running.clear()
+                break
+            
+            while pending and len(running) < max_workers:
+                sector = pending.pop(0)
+                worker = context.Process(
+                    target=_evolve_sector_worker,
+                    args=(self, sector, evolution_options, queue, threads_per_worker),
+                    daemon=True
+                )
+                with self.fork_guard():
+                    worker.start()
+                running[sector] = worker
+            
+            try:
+                message_type, sector, payload = queue.get(timeout=1.0)
+            except queue_module.Empty:
+                # A worker that died without reporting (e.g. OOM-killed) never sends a result
+                for sector, worker in list(running.items()):
+                    if not worker.is_alive() and queue.empty():
+                        results[sector] = {
+                            'sector': sector,
+                            'error': f"worker exited with code {worker.exitcode}"
+                        }
+                        running.pop(sector).join()
+                continue
+            
+            if message_type == 'message':
+                kind, data = payload
+                self.emit_message(kind, data)
+                continue
+            
+            if message_type == 'output':
+                sys.stdout.write(f"{payload}\n")
+                sys.stdout.flush()
+                continue
+            
+            if message_type == 'result':
+                # The worker's run history lives on here under a parent-side run id
+                payload['run_id'] = self.evolution_stats.import_run(payload.pop('history'))
+                results[sector] = payload
+                self.emit_message('FITNESS', payload)
+            else:
+                print(f"ERROR: Evolution failed for {sector}: {payload}", file=sys.stderr)
+                sys.stderr.flush()
+                results[sector] = {'sector': sector, 'error': payload}
+            
+            if sector in running:
+                running.pop(sector).join()
+        
+        self.archive_sector_results(results)
+        if self.checkpoint_dir:
+            self.save_checkpoint()
+        
+        print(f"🏆 Multi-sector evolution completed in {time.time() - start_time:.1f}s")
+        
+        return {
+            'sectors': results,
+            'workers': max_workers,
+            'elapsed': time.time() - start_time
+        }
+    
+    def run_island_evolution(self, sector: str = 'GENERAL', islands: int = None,
+                             migration_interval: int = 10, migration_size: int = 2,
+                             topology: str = 'ring', population_size: int = None,
+                             batch_evaluation: bool = None,
+                             cancel_event: threading.Event = None, max_generations: int = None,
+                             deadline_seconds: float = None, max_evaluations: int = None,
+                             stagnation_patience: int = None, seed_genomes: List[Any] = None,
+                             elite_ratio: float = None, selection: str = None) -> Dict[str, Any]:
+        """Evolve one sector as K island sub-populations in worker processes with periodic migration"""
+        
+        if topology not in self.MIGRATION_TOPOLOGIES:
+            raise ValueError(f"Unknown migration topology: {topology}")
+        if population_size is None:
+            population_size = self.population_size
+        
+        cpu_count = os.cpu_count() or 1
+        islands = max(1, islands or cpu_count)
+        island_size = max(2, population_size // islands)
+        
+        if islands == 1 or 'fork' not in multiprocessing.get_all_start_methods():
+            # A single island (or no fork) is just a panmictic run
+            return self.run_evolution(sector, batch_evaluation=batch_evaluation, backend='deap',
+                                      population_size=population_size, cancel_event=cancel_event,
+                                      max_generations=max_generations, deadline_seconds=deadline_seconds,
+                                      max_evaluations=max_evaluations,
+                                      stagnation_patience=stagnation_patience,
+                                      seed_genomes=seed_genomes, elite_ratio=elite_ratio,
+                                      selection=selection)
+        
+        self.ensure_initialized()
+        start_time = time.time()
+        print(f"🏝️ Starting island evolution for {sector}: {islands} islands x {island_size} individuals, "
+              f"{topology} migration of {migration_size} every {migration_interval} generations")
+        
+        # Every island scores against the parent's models as forked, so migrant fitness stays comparable
+        context = multiprocessing.get_context('fork')
+        outbox = context.Queue()
+        inboxes = [context.Queue() for _ in range(islands)]
+        threads_per_worker = max(1, cpu_count // islands)
+        options = {
+            'islands': islands,
+            'population_size': island_size,
+            'batch_evaluation': batch_evaluation,
+            'migration_interval': migration_interval,
+            'migration_size': migration_size,
+            'max_generations': max_generations,
+            'deadline': time.time() + deadline_seconds if deadline_seconds else None,
+            'max_evaluations': max(1, max_evaluations // islands) if max_evaluations else None,
+            'stagnation_patience': stagnation_patience,
+            'seed_genomes': list(seed_genomes or []),
+            'elite_ratio': elite_ratio,
+            'selection': selection or self.selection_mode
+        }
+        
+        sys.stdout.flush()
+        workers = []
+        for island in range(islands):
+            worker = context.Process(
+                target=_island_worker,
+                args=(self, sector, island, options, inboxes[island], outbox, threads_per_worker),
+                daemon=True
+            )
+            with self.fork_guard():
+                worker.start()
+            workers.append(worker)
+        
+        progress = ProgressThrottle(self.emit_message, 'EVOLUTION', self.progress_interval)
+        history = self.evolution_stats.start_run(sector)
+        pending = {}
+        last_generation = {}
+        finished = {}
+        results = {}
+        migrations = 0
+        next_generation = 0
+        stopping = False
+        stop_reason = None
+        
+        def stop_islands():
+            for island in range(islands):
+                if island not in finished:
+                    inboxes[island].put(('stop',))
+        
+        while len(finished) < islands:
+            if not stopping and cancel_event is not None and cancel_event.is_set():
+                print(f"⏹️ Island evolution cancelled for {sector}")
+                stopping = True
+                stop_reason = 'cancelled'
+                stop_islands()
+            
+            try:
+                message_type, island, payload = outbox.get(timeout=1.0)
+            except queue_module.Empty:
+                # An island that died without reporting (e.g. OOM-killed) never sends a result
+                for island, worker in enumerate(workers):
+                    if island not in finished and not worker.is_alive() and outbox.empty():
+                        print(f"ERROR: Island {island} exited with code {worker.exitcode}", file=sys.stderr)
+                        sys.stderr.flush()
+                        finished[island] = last_generation.get(island, -1)
+                payload = None
+                message_type = None
+            
+            if message_type == 'generation':
+                pending.setdefault(payload['generation'], []).append(payload)
+                last_generation[island] = payload['generation']
+                if not stopping and payload['best_fitness'] >= self.target_fitness:
+                    stopping = True
+                    stop_reason = 'target_reached'
+                    stop_islands()
+            
+            elif message_type == 'migrants':
+                for target in self.migration_targets(island, islands, topology):
+                    if target not in finished:
+                        inboxes[target].put(('migrants', payload))
+                        migrations += 1
+            
+            elif message_type == 'output':
+                sys.stdout.write(f"{payload}\n")
+                sys.stdout.flush()
+            
+            elif message_type == 'result':
+                results[island] = payload
+                finished[island] = last_generation.get(island, -1)
+            
+            elif message_type == 'error':
+                print(f"ERROR: Island {island} failed: {payload}", file=sys.stderr)
+                sys.stderr.flush()
+                finished[island] = last_generation.get(island, -1)
+            
+            # Report each generation once every island still running at that generation has reached it
+            while next_generation in pending:
+                expected = sum(1 for island in range(islands)
+                               if island not in finished or finished[island] >= next_generation)
+                if len(pending[next_generation]) < expected:
+                    break
+                progress.update(self.island_progress(sector, pending.pop(next_generation), migrations, history))
+                next_generation += 1
+        
+        for generation in sorted(pending):
+            progress.update(self.island_progress(sector, pending[generation], migrations, history))
+        progress.flush()
+        
+        for worker in workers:
+            worker.join()
+        for inbox in inboxes:
+            inbox.cancel_join_thread()
+        
+        if not results:
+            raise RuntimeError(f"All islands failed for {sector}")
+        
+        stop_reason = stop_reason or Counter(
+            result.get('stop_reason', 'max_generations') for result in results.values()
+        ).most_common(1)[0][0]
+        history.finish(stop_reason)
+        
+        # Global hall of fame: island halls of fame re-scored against the parent's models
+        individuals = [creator.Individual(self.decode_genome(genome))
+                       for result in results.values() for genome in result['hall_of_fame']]
+        self.evaluate_population(individuals)
+        hof = tools.ParetoFront() if options['selection'] == 'nsga2' else tools.HallOfFame(10)
+        hof.update(individuals)
+        
+        self.archive_hall_of_fame(sector, hof)
+        if self.checkpoint_dir:
+            self.save_checkpoint()
+        
+        best_individual = hof[0]
+        final_fitness = self.toolbox.evaluate(best_individual)
+        
+        print(f"🏆 Island evolution completed for {sector} in {time.time() - start_time:.1f}s")
+        print(f"   Best fitness: {final_fitness[0]:.2f}%")
+        print(f"   False positive rate: {final_fitness[1]:.3f}")
+        
+        return {
+            'best_individual': best_individual,
+            'fitness': final_fitness,
+            'generation': max(result['generation'] for result in results.values()),
+            'hall_of_fame': list(hof),
+            'islands': islands,
+            'migrations': migrations,
+            'stop_reason': stop_reason,
+            'evaluations': sum(result.get('evaluations', 0) for result in results.values()),
+            'run_id': history.run_id,
+            'selection': options['selection']
+        }
+    
+    def migration_targets(self, island: int, islands: int, topology: str) -> List[int]:
+        """Islands that receive an island's emigrants under a migration topology"""
+        
+        if topology == 'ring':
+            return [(island + 1) % islands]
+        if topology == 'random':
+            return [random.choice([other for other in range(islands) if other != island])]
+        return [other for other in range(islands) if other != island]
+    
+    def island_progress(self, sector: str, reports: List[Dict[str, Any]], migrations: int,
+                        history: RunHistory) -> Dict[str, Any]:
+        """Aggregate one generation's island reports into a global EVOLUTION payload"""
+        
+        population_size = sum(report['population_size'] for report in reports)
+        allele_counts = np.sum([report['allele_counts'] for report in reports], axis=0)
+        best_fitness = max(report['best_fitness'] for report in reports)
+        avg_fitness = sum(report['avg_fitness'] * report['population_size'] for report in reports) / population_size
+        diversity = self.diversity_from_allele_counts(allele_counts, population_size)
+        
+        history.append(reports[0]['generation'], best_fitness, avg_fitness, diversity)
+        
+        return {
+            'sector': sector,
+            'generation': reports[0]['generation'],
+            'best_fitness': best_fitness,
+            'avg_fitness': avg_fitness,
+            'diversity': diversity,
+            'population_size': population_size,
+            'islands': len(reports),
+            'migrations': migrations,
+            'cache_hits': sum(report['cache_hits'] for report in reports),
+            'cache_misses': sum(report['cache_misses'] for report in reports),
+            'cache_size': sum(report['cache_size'] for report in reports)
+        }
+    
+    def integrate_migrants(self, population: List, migrants: List[Tuple[List[int], Tuple[float, float]]]):
+        """Replace an island's worst individuals with already-scored immigrants (in place)"""
+        
+        migrants = migrants[:len(population)]
+        worst = sorted(range(len(population)), key=lambda index: population[index].fitness)[:len(migrants)]
+        for index, (genome, fitness) in zip(worst, migrants):
+            immigrant = creator.Individual(genome)
+            immigrant.fitness.values = tuple(fitness)
+            population[index] = immigrant
+    
+    def archive_sector_results(self, results: Dict[str, Dict[str, Any]]):
+        """Archive worker halls of fame, re-scored against the parent's models"""
+        
+        for sector, result in results.items():
+            if 'hall_of_fame' not in result:
+                continue
+            individuals = [creator.Individual(self.decode_genome(genome)) for genome in result['hall_of_fame']]
+            self.evaluate_population(individuals)
+            self.archive_hall_of_fame(sector, individuals)
+    
+    def sector_result_payload(self, sector: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Plain, sector-tagged copy of a run_evolution result"""
+        
+        payload = {
+            'sector': sector,
+            'best_individual': self.encode_genome(result['best_individual']),
+            'fitness': [float(value) for value in result['fitness']],
+            'generation': result['generation'],
+            'hall_of_fame': [self.encode_genome(individual) for individual in result['hall_of_fame']]
+        }
+        for key in ('islands', 'migrations', 'phase_ms', 'stop_reason', 'evaluations', 'run_id', 'selection'):
+            if key in result:
+                payload[key] = result[key]
+        if result.get('selection') == 'nsga2':
+            payload['pareto_front'] = [
+                {'genome': self.encode_genome(individual),
+                 'fitness': [float(value) for value in individual.fitness.values]}
+                for individual in result['hall_of_fame']
+            ]
+        if self.genome_encoding != 'list':
+            payload['genome_encoding'] = self.genome_encoding
+        return payload
+    
+    def encode_genome(self, genome) -> Any:
+        """Genome as a 0/1 list, or as packed bits in hex (16 characters for 64 genes)"""
+        
+        if self.genome_encoding == 'hex':
+            return np.packbits(np.asarray(genome, dtype=np.uint8)).tobytes().hex()
+        return [int(gene) for gene in genome]
+    
+    def decode_genome(self, encoded) -> List[int]:
+        """Inverse of encode_genome; accepts either encoding"""
+        
+        if isinstance(encoded, str):
+            packed = np.frombuffer(bytes.fromhex(encoded), dtype=np.uint8)
+            return np.unpackbits(packed, count=self.GENOME_LENGTH).tolist()
+        return list(encoded)
+    
+    def cache_progress(self, cache_start: Dict[str, int]) -> Dict[str, int]:
+        """This run's fitness cache hits/misses (misses are its evaluations), for progress and budgets"""
+        
+        # Counted per thread, so concurrent scheduler jobs do not spend each other's evaluation budgets
+        run_stats = self.fitness_cache.thread_stats()
+        return {
+            'cache_hits': run_stats['hits'] - cache_start['hits'],
+            'cache_misses': run_stats['misses'] - cache_start['misses'],
+            'cache_size': self.fitness_cache.stats()['size']
         }
     
-    def calculate_diversity(self, population) -> float:
-        """Calculate genetic diversity of the population"""
+    def rank_fitness(self, accuracies: np.ndarray, fp_rates: np.ndarray) -> np.ndarray:
+        """Rank individuals the way DEAP compares FitnessMulti (higher rank is fitter)"""
+        
+        # Lexicographic on weighted values: maximize accuracy, then minimize FP rate
+        order = np.lexsort((-fp_rates, accuracies))
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        return ranks
+    
+    def rank_pareto(self, accuracies: np.ndarray, fp_rates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """NSGA-II crowded-comparison ranks (higher rank is fitter) and the Pareto front of each individual"""
+        
+        fronts = pareto_fronts(accuracies, fp_rates)
+        crowding = crowding_distances(fronts, np.column_stack([accuracies, fp_rates]))
+        
+        # Lower front first, then the less crowded individual
+        order = np.lexsort((crowding, -fronts))
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        return ranks, fronts
+    
+    def fitness_arrays(self, individuals: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """Accuracy and false positive rate arrays of evaluated DEAP individuals"""
+        
+        values = np.array([individual.fitness.values for individual in individuals], dtype=np.float64)
+        return values[:, 0], values[:, 1]
+    
+    def packed_tournament_selection(self, ranks: np.ndarray, k: int) -> np.ndarray:
+        """Vectorized tournament selection, returning the indices of the k winners"""
+        
+        contestants = self.rng.integers(0, len(ranks), size=(k, self.tournament_size))
+        winners = np.argmax(ranks[contestants], axis=1)
+        return contestants[np.arange(k), winners]
+    
+    def packed_crossover(self, offspring: np.ndarray):
+        """Vectorized two-point crossover on consecutive pairs of packed genomes (in place)"""
+        
+        num_pairs = len(offspring) // 2
+        mating = np.flatnonzero(self.rng.random(num_pairs) < self.crossover_probability)
+        if len(mating) == 0:
+            return
+        
+        # Same cut point distribution as tools.cxTwoPoint
+        size = self.GENOME_LENGTH
+        point1 = self.rng.integers(1, size + 1, size=len(mating))
+        point2 = self.rng.integers(1, size, size=len(mating))
+        point2 = np.where(point2 >= point1, point2 + 1, point2)
+        low = np.minimum(point1, point2)
+        high = np.maximum(point1, point2)
+        
+        loci = np.arange(size)
+        swap_mask = pack_genomes((loci >= low[:, None]) & (loci < high[:, None]))
+        
+        first = 2 * mating
+        second = first + 1
+        swapped = (offspring[first] ^ offspring[second]) & swap_mask
+        offspring[first] ^= swapped
+        offspring[second] ^= swapped
+    
+    def packed_mutation(self, offspring: np.ndarray, indpb: float = None):
+        """Vectorized bit-flip mutation on packed genomes (in place)"""
+        
+        if indpb is None:
+            indpb = self.mutation_indpb
+        
+        mutants = np.flatnonzero(self.rng.random(len(offspring)) < self.mutation_probability)
+        if len(mutants) == 0:
+            return
+        
+        flips = self.rng.random((len(mutants), self.GENOME_LENGTH)) < indpb
+        offspring[mutants] ^= pack_genomes(flips)
+    
+    def packed_to_individuals(self, genes: np.ndarray, accuracies: np.ndarray,
+                              fp_rates: np.ndarray, ranks: np.ndarray, count: int) -> List[Any]:
+        """Convert the top-ranked rows of a packed generation into DEAP individuals"""
+        
+        top = np.argsort(ranks)[::-1][:count]
+        individuals = []
+        for index in top:
+            individual = creator.Individual(genes[index].tolist())
+            individual.fitness.values = (float(accuracies[index]), float(fp_rates[index]))
+            individuals.append(individual)
+        return individuals
+    
+    def calculate_diversity(self, population, sample_size: int = None) -> float:
+        """Calculate genetic diversity as the mean pairwise Hamming distance per locus"""
+        
+        if sample_size is None:
+            sample_size = self.diversity_sample_size
         
         if len(population) < 2:
             return 0.0
         
-        total_distance = 0
-        comparisons = 0
+        genomes = np.asarray(population, dtype=np.uint8)
+        if sample_size and len(genomes) > sample_size:
+            genomes = genomes[self.rng.choice(len(genomes), size=sample_size, replace=False)]
+        
+        return self.diversity_from_allele_counts(genomes.sum(axis=0, dtype=np.int64), len(genomes))
+    
+    @staticmethod
+    def diversity_from_allele_counts(ones, num_genomes: int) -> float:
+        """Mean pairwise Hamming distance per locus from per-locus counts of 1 alleles"""
+        
+        if num_genomes < 2:
+            return 0.0
         
-        for i in range(len(population)):
-            for j in range(i + 1, len(population)):
-                # Hamming distance between genomes
-                distance = sum(a != b for a, b in zip(population[i], population[j]))
-                total_distance += distance
-                comparisons += 1
+        # A locus with c ones among n genomes differs in exactly c * (n - c) pairs,
+        # so the exact mean over all pairs needs only per-locus allele counts
+        ones = np.asarray(ones, dtype=np.int64)
+        total_distance = int((ones * (num_genomes - ones)).sum())
+        comparisons = num_genomes * (num_genomes - 1) // 2
         
-        return (total_distance / comparisons) / len(population[0]) if comparisons > 0 else 0.0
+        return (total_distance / comparisons) / len(ones)
     
-    def adaptive_parameter_adjustment(self, generation: int, stats: Dict):
-        """Adaptively adjust genetic algorithm parameters based on evolution progress"""
+    def adaptive_parameter_adjustment(self, generation: int, stats: Dict,
+                                      diversity: float = None) -> float:
+        """Adaptively adjust genetic algorithm parameters, returning the run's next mutation indpb"""
         
         # Adjust mutation rate based on diversity
-        current_diversity = self.evolution_stats['diversity'][-1]
+        current_diversity = diversity
+        if current_diversity is None:
+            current_diversity = self.evolution_stats.latest('diversity', 0.3)
         
         if current_diversity < 0.1:  # Low diversity, increase mutation
-            self.toolbox.unregister("mutate")
-            self.toolbox.register("mutate", tools.mutFlipBit, indpb=0.15)
+            return 0.15
         elif current_diversity > 0.5:  # High diversity, decrease mutation
-            self.toolbox.unregister("mutate")
-            self.toolbox.register("mutate", tools.mutFlipBit, indpb=0.05)
+            return 0.05
         else:  # Normal diversity
-            self.toolbox.unregister("mutate")
-            self.toolbox.register("mutate", tools.mutFlipBit, indpb=0.1)
-    
-    def neural_architecture_search(self, sector: str):
-        """Perform Neural Architecture Search (NAS) for optimal network structure"""
+            return 0.1
+
+    def neural_architecture_search(self, sector: str, cancel_event: threading.Event = None,
+                                   architectures: List[List[int]] = None, max_epochs: int = 20,
+                                   min_epochs: int = 5, reduction_factor: int = 2,
+                                   max_workers: int = None):
+        """Perform Neural Architecture Search (NAS) with successive halving on a process pool"""
         
+        self.ensure_initialized()
         print(f"🔍 Starting Neural Architecture Search for {sector}")
         
-        # Define search space for network architectures
-        hidden_layer_options = [
-            [64, 32],
-            [128, 64, 32],
-            [256, 128, 64, 32],
-            [128, 64],
-            [64, 32, 16]
+        if reduction_factor < 2:
+            raise ValueError("reduction_factor must be at least 2")
+        
+        # One shared training corpus for every candidate
+        training_data = self.sector_models[sector]['training_data']
+        candidates = [
+            {'architecture': list(architecture), 'model_state': None,
+             'optimizer_state': None, 'epochs': 0, 'accuracy': 0.0, 'loss': float('inf')}
+            for architecture in (architectures or self.NAS_SEARCH_SPACE)
         ]
         
-        best_architecture = None
-        best_accuracy = 0.0
+        cpu_count = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers or cpu_count, len(candidates)))
+        threads_per_worker = max(1, cpu_count // max_workers)
         
-        for architecture in hidden_layer_options:
-            # Create and train model with this architecture
-            model = SecurityPolicyNetwork(
-                input_size=64,
-                hidden_sizes=architecture,
-                output_size=1
+        # Workers read the corpus from process globals; the serial path passes it per call instead
+        executor = None
+        if max_workers > 1 and 'fork' in multiprocessing.get_all_start_methods():
+            # Forked workers inherit the corpus (and its memory maps) instead of receiving a pickled copy
+            sys.stdout.flush()
+            executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context('fork'),
+                initializer=_init_nas_worker,
+                initargs=(training_data, self.training_batch_size, threads_per_worker)
             )
-            
-            optimizer = optim.Adam(model.parameters(), lr=0.001)
-            criterion = nn.BCELoss()
-            
-            # Quick training
-            training_data = self.generate_training_data(sector)
-            model.train()
-            
-            for epoch in range(20):
-                optimizer.zero_grad()
-                outputs = model(training_data['inputs'])
-                loss = criterion(outputs.squeeze(), training_data['labels'])
-                loss.backward()
-                optimizer.step()
-            
-            # Evaluate
-            model.eval()
-            with torch.no_grad():
-                predictions = model(training_data['inputs'])
-                predicted_labels = (predictions.squeeze() > 0.5).float()
-                accuracy = (predicted_labels == training_data['labels']).float().mean()
-            
-            print(f"   Architecture {architecture}: {accuracy:.3f} accuracy")
-            
-            if accuracy > best_accuracy:
-                best_accuracy = accuracy
-                best_architecture = architecture
         
+        budget = min(min_epochs, max_epochs)
+        round_number = 1
+        try:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    print(f"⏹️ Neural Architecture Search cancelled for {sector}")
+                    break
+                
+                # Continue every surviving candidate from its own weights up to the round budget
+                jobs = [
+                    (candidate['architecture'], candidate['model_state'],
+                     candidate['optimizer_state'], budget - candidate['epochs'])
+                    for candidate in candidates
+                ]
+                if executor is not None:
+                    # The pool forks its workers on first submission
+                    with self.fork_guard():
+                        outcomes = executor.map(_train_nas_candidate, *zip(*jobs))
+                    outcomes = list(outcomes)
+                else:
+                    outcomes = [
+                        _train_nas_candidate(*job, training_data=training_data,
+                                             batch_size=self.training_batch_size)
+                        for job in jobs
+                    ]
+                
+                for candidate, (model_state, optimizer_state, accuracy, loss) in zip(candidates, outcomes):
+                    candidate.update({
+                        'model_state': model_state,
+                        'optimizer_state': optimizer_state,
+                        'epochs': budget,
+                        'accuracy': accuracy,
+                        'loss': loss
+                    })
+                    print(f"   Round {round_number} ({budget} epochs) "
+                          f"architecture {candidate['architecture']}: {accuracy:.3f} accuracy")
+                
+                candidates.sort(key=lambda candidate: (-candidate['accuracy'], candidate['loss']))
+                if budget >= max_epochs:
+                    break
+                
+                # Successive halving: keep the top 1/reduction_factor and grow the budget
+                candidates = candidates[:max(1, math.ceil(len(candidates) / reduction_factor))]
+                budget = min(max_epochs, budget * reduction_factor)
+                round_number += 1
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+        
+        best = candidates[0] if candidates and candidates[0]['model_state'] is not None else None
+        if best is None:
+            return None, 0.0
+        
+        best_architecture = best['architecture']
+        best_accuracy = best['accuracy']
         print(f"🏆 Best architecture for {sector}: {best_architecture} (Accuracy: {best_accuracy:.3f})")
         
-        # Update sector model with best architecture
-        self.sector_models[sector]['model'] = SecurityPolicyNetwork(
+        # Install the trained winner, weights and optimizer state included
+        model = SecurityPolicyNetwork(
             input_size=64,
             hidden_sizes=best_architecture,
             output_size=1
         )
+        model.load_state_dict(best['model_state'])
+        optimizer = optim.Adam(model.parameters(), lr=0.001)
+        optimizer.load_state_dict(best['optimizer_state'])
+        
+        with self.model_lock:
+            self.sector_models[sector].update({
+                'model': model,
+                'optimizer': optimizer,
+                'accuracy': best_accuracy
+            })
+            self.mark_models_updated()
         
         return best_architecture, best_accuracy
     
+    def checkpoint_path(self, path: str = None) -> str:
+        """Checkpoint file location, or None when checkpointing is not configured"""
+        
+        if path:
+            return path
+        if not self.checkpoint_dir:
+            return None
+        return os.path.join(self.checkpoint_dir, 'genetic_engine.pt')
+    
+    def archive_hall_of_fame(self, sector: str, individuals):
+        """Merge a run's best individuals into the sector's persistent hall of fame"""
+        
+        with self._checkpoint_lock:
+            if sector not in self.hall_of_fame:
+                self.hall_of_fame[sector] = tools.HallOfFame(self.elite_archive_size)
+            self.hall_of_fame[sector].update(list(individuals))
+    
+    def checkpoint_due(self, generation: int) -> bool:
+        """Whether a periodic checkpoint falls on this generation"""
+        
+        if not self.checkpoint_dir or not self.checkpoint_interval or generation <= 0:
+            return False
+        return generation % self.checkpoint_interval == 0
+    
+    def save_checkpoint(self, path: str = None) -> Dict[str, Any]:
+        """Save sector models, optimizer state and halls of fame to a single torch file"""
+        
+        path = self.checkpoint_path(path)
+        if not path:
+            raise ValueError("No checkpoint path configured (set CYPHER_AI_CHECKPOINT_DIR)")
+        
+        started = time.perf_counter()
+        
+        with self.model_lock:
+            sectors = {
+                sector: {
+                    'architecture': model_data['model'].architecture,
+                    'model': model_data['model'].state_dict(),
+                    'optimizer': model_data['optimizer'].state_dict(),
+                    'accuracy': float(model_data['accuracy']),
+                    'samples': self.sector_sample_count(sector)
+                }
+                for sector, model_data in self.sector_models.items()
+            }
+        
+        with self._checkpoint_lock:
+            hall_of_fame = {
+                sector: {
+                    'genomes': torch.from_numpy(pack_genomes(np.asarray(list(hof), dtype=np.uint8))),
+                    'fitness': torch.tensor([ind.fitness.values for ind in hof], dtype=torch.float64)
+                }
+                for sector, hof in self.hall_of_fame.items() if len(hof) > 0
+            }
+            
+            checkpoint = {
+                'format_version': 1,
+                'saved_at': datetime.now().isoformat(),
+                'genome_length': self.GENOME_LENGTH,
+                'sectors': sectors,
+                'hall_of_fame': hall_of_fame
+            }
+            
+            # Write-then-rename so a crash never leaves a truncated checkpoint
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            temp_path = f"{path}.tmp"
+            torch.save(checkpoint, temp_path)
+            os.replace(temp_path, path)
+        
+        return {
+            'path': path,
+            'sectors': list(sectors),
+            'hall_of_fame': {sector: len(hof) for sector, hof in self.hall_of_fame.items()},
+            'elapsed_ms': (time.perf_counter() - started) * 1000
+        }
+    
+    def load_checkpoint(self, path: str = None) -> Dict[str, Any]:
+        """Restore sector models, optimizer state and halls of fame from a checkpoint"""
+        
+        self.ensure_initialized()
+        return self._load_checkpoint(path)
+    
+    def _load_checkpoint(self, path: str = None) -> Dict[str, Any]:
+        """Checkpoint restore, callable while the engine is still initializing"""
+        
+        path = self.checkpoint_path(path)
+        if not path or not os.path.exists(path):
+            raise ValueError(f"Checkpoint not found: {path}")
+        
+        started = time.perf_counter()
+        
+        # Memory-mapped, weights-only load: tensors are paged in lazily and nothing is unpickled
+        checkpoint = torch.load(path, map_location='cpu', mmap=True, weights_only=True)
+        
+        with self.model_lock:
+            for sector, saved in checkpoint['sectors'].items():
+                model = SecurityPolicyNetwork(**saved['architecture'])
+                model.load_state_dict(saved['model'], assign=True)
+                optimizer = optim.Adam(model.parameters(), lr=0.001)
+                optimizer.load_state_dict(saved['optimizer'])
+                
+                model_data = self._sector_models.setdefault(sector, {
+                    'criterion': nn.BCELoss(),
+                    'training_data': self.load_training_corpus(sector)
+                })
+                model_data.update({
+                    'model': model,
+                    'optimizer': optimizer,
+                    'accuracy': saved['accuracy']
+                })
+                self._bump_revision(sector)
+            self.mark_models_updated()
+        
+        genome_length = checkpoint.get('genome_length', self.GENOME_LENGTH)
+        with self._checkpoint_lock:
+            for sector, saved in checkpoint['hall_of_fame'].items():
+                genomes = unpack_genomes(saved['genomes'].numpy(), genome_length)
+                individuals = []
+                for genome, fitness in zip(genomes, saved['fitness'].tolist()):
+                    individual = creator.Individual(genome.tolist())
+                    individual.fitness.values = tuple(fitness)
+                    individuals.append(individual)
+                
+                self.hall_of_fame[sector] = tools.HallOfFame(self.elite_archive_size)
+                self.hall_of_fame[sector].update(individuals)
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"💾 Restored checkpoint {path} in {elapsed_ms:.0f} ms")
+        
+        return {
+            'path': path,
+            'saved_at': checkpoint.get('saved_at'),
+            'sectors': list(checkpoint['sectors']),
+            'hall_of_fame': {sector: len(hof) for sector, hof in self.hall_of_fame.items()},
+            'elapsed_ms': elapsed_ms
+        }
+    
     def federated_learning_update(self, external_models: Dict[str, Any]):
         """Update local models with federated learning from other nodes"""
         
         print("🌐 Performing federated learning update")
         
-        for sector, model_data in self.sector_models.items():
-            if sector in external_models:
-                # Simple federated averaging (in practice, would be more sophisticated)
-                local_model = model_data['model']
-                external_model = external_models[sector]
+        # Equal-weight FedAvg of the local model with every external model (modules or state dicts)
+        with self.model_lock:
+            averager = FederatedAverager(
+                {sector: model_data['model'].state_dict() for sector, model_data in self.sector_models.items()},
+                {sector: 1.0 for sector in self.sector_models}
+            )
+            for sector, external in external_models.items():
+                externals = external if isinstance(external, (list, tuple)) else [external]
+                for external_model in externals:
+                    state = external_model.state_dict() if hasattr(external_model, 'state_dict') else external_model
+                    averager.add(sector, state.items(), 1.0)
+            
+            self.install_averaged_states(averager.averaged_states())
+        print("✅ Federated learning update completed")
+    
+    def federated_aggregate(self, paths: List[Any] = None, socket_path: str = None, peers: int = None,
+                            include_local: bool = True, timeout: float = 60.0,
+                            cancel_event: threading.Event = None) -> Dict[str, Any]:
+        """Sample-weighted FedAvg of peer sector models streamed from checkpoint files and/or a Unix socket"""
+        
+        self.ensure_initialized()
+        started = time.perf_counter()
+        print("🌐 Performing federated aggregation")
+        
+        with self.model_lock:
+            averager = FederatedAverager(
+                {sector: model_data['model'].state_dict() for sector, model_data in self._sector_models.items()},
+                {sector: self.sector_sample_count(sector) if include_local else 0.0
+                 for sector in self._sector_models}
+            )
+        
+        skipped = []
+        for peer in paths or []:
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            self._fold_checkpoint_peer(averager, peer if isinstance(peer, dict) else {'path': peer}, skipped)
+        
+        received = 0
+        if socket_path:
+            received = self._fold_socket_peers(averager, socket_path, peers, timeout, cancel_event, skipped)
+        
+        with self.model_lock:
+            installed = self.install_averaged_states(averager.averaged_states(), skipped)
+        
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        print(f"✅ Federated aggregation completed for {len(installed)} sectors in {elapsed_ms:.0f} ms")
+        
+        return {
+            'sectors': {
+                sector: {'peers': averager.peers[sector], 'samples': averager.weights[sector]}
+                for sector in installed
+            },
+            'files': len(paths or []),
+            'socket_peers': received,
+            'skipped': skipped,
+            'elapsed_ms': elapsed_ms
+        }
+    
+    def sector_sample_count(self, sector: str) -> float:
+        """Local training samples behind a sector model, its weight in FedAvg"""
+        return float(self._sector_models[sector]['training_data'].train_rows)
+    
+    def install_averaged_states(self, states: Dict[str, Dict[str, Any]], skipped: List = None) -> List[str]:
+        """Copy averaged parameters into the live sector models in place (call under model_lock)"""
+        
+        installed = []
+        with torch.no_grad():
+            for sector, state in states.items():
+                live_state = self._sector_models[sector]['model'].state_dict()
                 
-                # Average parameters
-                for local_param, external_param in zip(local_model.parameters(), external_model.parameters()):
-                    local_param.data = (local_param.data + external_param.data) / 2
+                # The live model may have been replaced (e.g. by NAS) while peers were streaming
+                if any(name not in live_state or live_state[name].shape != tensor.shape
+                       for name, tensor in state.items()):
+                    if skipped is not None:
+                        skipped.append({'sector': sector, 'error': 'local architecture changed'})
+                    continue
+                
+                for name, tensor in state.items():
+                    live_state[name].copy_(tensor)
+                self._bump_revision(sector)
+                installed.append(sector)
         
-        print("✅ Federated learning update completed")
+        if installed:
+            self.mark_models_updated()
+        return installed
+    
+    def _fold_checkpoint_peer(self, averager: FederatedAverager, peer: Dict[str, Any], skipped: List):
+        """Fold a peer's engine checkpoint into the average, paging tensors in from a memory map"""
+        
+        path = peer['path']
+        try:
+            checkpoint = torch.load(path, map_location='cpu', mmap=True, weights_only=True)
+        except Exception as e:
+            skipped.append({'peer': path, 'error': str(e)})
+            return
+        
+        for sector, saved in checkpoint.get('sectors', {}).items():
+            state = saved['model']
+            if not averager.accepts(sector, {name: tensor.shape for name, tensor in state.items()}):
+                skipped.append({'peer': path, 'sector': sector, 'error': 'architecture mismatch'})
+                continue
+            averager.add(sector, state.items(), self.peer_sample_weight(peer.get('samples'), sector, saved))
+    
+    def _fold_socket_peers(self, averager: FederatedAverager, socket_path: str, peers: int,
+                           timeout: float, cancel_event: threading.Event, skipped: List) -> int:
+        """Accept peers on a Unix socket and fold each streamed model in; returns peers received"""
+        
+        # Replace a stale socket from an earlier run, but never some other file at that path
+        if os.path.lexists(socket_path):
+            if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+                raise ValueError(f"{socket_path} exists and is not a socket")
+            os.unlink(socket_path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen()
+        server.settimeout(1.0)
+        print(f"🌐 Waiting for {peers or 'any'} federated peers on {socket_path}")
+        
+        deadline = time.monotonic() + timeout
+        received = 0
+        try:
+            while peers is None or received < peers:
+                if cancel_event is not None and cancel_event.is_set():
+                    break
+                if time.monotonic() > deadline:
+                    if peers is not None:
+                        print(f"⚠️ Federated aggregation timed out with {received}/{peers} peers")
+                    break
+                
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    continue
+                
+                received += 1
+                with connection:
+                    connection.settimeout(timeout)
+                    try:
+                        self._fold_stream_peer(averager, connection.makefile('rb'), f"socket-{received}", skipped)
+                    except (OSError, ValueError, KeyError) as e:
+                        skipped.append({'peer': f"socket-{received}", 'error': str(e)})
+        finally:
+            server.close()
+            if os.path.lexists(socket_path) and stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+                os.unlink(socket_path)
+        
+        return received
+    
+    def _fold_stream_peer(self, averager: FederatedAverager, stream, peer: str, skipped: List):
+        """Fold one tensor stream (see write_state_stream) into the average"""
+        
+        frames = read_state_stream(stream)
+        manifest, _ = next(frames)
+        if manifest['type'] != 'manifest':
+            raise ValueError("Tensor stream must start with a manifest")
+        
+        accepted = set()
+        for sector, shapes in manifest['sectors'].items():
+            if averager.accepts(sector, shapes):
+                accepted.add(sector)
+            else:
+                skipped.append({'peer': peer, 'sector': sector, 'error': 'architecture mismatch'})
+        
+        # Only one peer's tensors are held at a time; they are folded in once the stream is complete
+        staged = {sector: {} for sector in accepted}
+        for header, tensor in frames:
+            if tensor is not None and header['sector'] in staged:
+                if header['name'] in staged[header['sector']]:
+                    raise ValueError(f"Duplicate tensor {header['sector']}/{header['name']} in stream")
+                staged[header['sector']][header['name']] = tensor
+        
+        # Check every sector before adding any, so a peer with one bad sector contributes nothing
+        checked = {
+            sector: (averager.check(sector, tensors.items()),
+                     self.peer_sample_weight(manifest.get('samples'), sector))
+            for sector, tensors in staged.items()
+        }
+        for sector, (tensors, weight) in checked.items():
+            averager.add(sector, tensors, weight)
+    
+    @staticmethod
+    def peer_sample_weight(samples, sector: str, saved: Dict[str, Any] = None) -> float:
+        """FedAvg weight for a peer sector: explicit samples (number or per-sector map), saved count, or 1"""
+        
+        if isinstance(samples, dict):
+            samples = samples.get(sector)
+        if samples is None and saved is not None:
+            samples = saved.get('samples')
+        return float(samples if samples is not None else 1.0)
+    
+    def send_federated_state(self, socket_path: str) -> Dict[str, Any]:
+        """Stream this engine's sector models to an aggregator listening on a Unix socket"""
+        
+        self.ensure_initialized()
+        with self.model_lock:
+            states = {sector: {name: tensor.clone() for name, tensor in model_data['model'].state_dict().items()}
+                      for sector, model_data in self._sector_models.items()}
+            samples = {sector: self.sector_sample_count(sector) for sector in self._sector_models}
+        
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(socket_path)
+            with connection.makefile('wb') as stream:
+                write_state_stream(stream, states, samples)
+        
+        print(f"🌐 Sent {len(states)} sector models to {socket_path}")
+        return {'socket': socket_path, 'sectors': list(states), 'samples': samples}
+
+
+class _QueueLineWriter:
+    """Minimal stdout replacement that forwards complete lines to a parent process"""
+    
+    def __init__(self, queue, sector: str):
+        self.queue = queue
+        self.sector = sector
+        self._buffer = ''
+    
+    def write(self, text: str) -> int:
+        self._buffer += text
+        while '\n' in self._buffer:
+            line, self._buffer = self._buffer.split('\n', 1)
+            self.queue.put(('output', self.sector, line))
+        return len(text)
+    
+    def flush(self):
+        pass
+
+
+def _reset_forked_engine(engine: CypherAIGeneticEngine, num_threads: int):
+    """Per-process state a forked evolution worker must not share with its parent"""
+    
+    # Locks were held across the fork by fork_guard; the child gets fresh ones
+    engine.reset_locks_after_fork()
+    
+    # Forked children inherit identical RNG states; reseed so workers evolve independently
+    random.seed()
+    engine.rng = np.random.default_rng()
+    torch.seed()
+    torch.set_num_threads(engine.inference_threads or num_threads)
+    
+    # The parent checkpoints once all workers finish; workers must not race on the file
+    engine.checkpoint_dir = None
+    
+    # Workers hand their run history back with the result; start from an empty store
+    engine.evolution_stats = EvolutionStatsStore(engine.evolution_stats.max_runs, engine.evolution_stats.capacity)
+    
+    # The parent's trainer thread does not survive fork; each worker starts its own
+    engine._training_executor = None
+    engine._pending_training = None
+
+
+def _evolve_sector_worker(engine: CypherAIGeneticEngine, sector: str, options: Dict[str, Any],
+                          queue, num_threads: int):
+    """Worker process entry point for run_all_sectors"""
+    
+    _reset_forked_engine(engine, num_threads)
+    
+    # Route all output through the parent so stdout lines never interleave
+    sys.stdout = _QueueLineWriter(queue, sector)
+    
+    def emit_message(kind, payload):
+        queue.put(('message', sector, (kind, {'sector': sector, **payload})))
+    engine.emit_message = emit_message
+    
+    try:
+        result = engine.run_evolution(sector, **options)
+        payload = engine.sector_result_payload(sector, result)
+        payload['history'] = engine.evolution_stats.query(result['run_id'])
+        queue.put(('result', sector, payload))
+    except Exception as e:
+        queue.put(('error', sector, str(e)))
+
+
+def _island_worker(engine: CypherAIGeneticEngine, sector: str, island: int, options: Dict[str, Any],
+                   inbox, outbox, num_threads: int):
+    """Worker process entry point for run_island_evolution"""
+    
+    _reset_forked_engine(engine, num_threads)
+    
+    # Islands keep the forked models fixed so fitness values from different islands compare
+    engine.training_interval = 0
+    
+    # Output goes through the parent; the parent emits the aggregated EVOLUTION stream
+    sys.stdout = _QueueLineWriter(outbox, island)
+    engine.emit_message = lambda kind, payload: None
+    
+    stop = threading.Event()
+    cache_start = engine.fitness_cache.thread_stats()
+    migration_interval = options['migration_interval']
+    migration_size = options['migration_size']
+    
+    def migrate(generation, population, hof, record):
+        while True:
+            try:
+                message = inbox.get_nowait()
+            except queue_module.Empty:
+                break
+            if message[0] == 'stop':
+                stop.set()
+            else:
+                engine.integrate_migrants(population, message[1])
+        
+        outbox.put(('generation', island, {
+            'generation': generation,
+            'best_fitness': float(record['max'][0]),
+            'avg_fitness': float(record['avg'][0]),
+            'population_size': len(population),
+            'allele_counts': np.asarray(population, dtype=np.uint8).sum(axis=0).tolist(),
+            **engine.cache_progress(cache_start)
+        }))
+        
+        if migration_interval and generation > 0 and generation % migration_interval == 0:
+            emigrants = tools.selBest(population, migration_size)
+            outbox.put(('migrants', island, [(list(ind), ind.fitness.values) for ind in emigrants]))
+    
+    try:
+        result = engine.run_evolution(
+            sector,
+            batch_evaluation=options['batch_evaluation'],
+            backend='deap',
+            population_size=options['population_size'],
+            cancel_event=stop,
+            generation_callback=migrate,
+            max_generations=options['max_generations'],
+            deadline_seconds=max(0.0, options['deadline'] - time.time()) if options['deadline'] else None,
+            max_evaluations=options['max_evaluations'],
+            stagnation_patience=options['stagnation_patience'],
+            seed_genomes=options['seed_genomes'][island::options['islands']],
+            elite_ratio=options['elite_ratio'],
+            selection=options['selection']
+        )
+        outbox.put(('result', island, engine.sector_result_payload(sector, result)))
+    except Exception as e:
+        outbox.put(('error', island, str(e)))
+
+
+class _LineSynchronizedWriter:
+    """stdout wrapper that writes each thread's output a whole line at a time"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        # Reentrant: fork_guard holds it while multiprocessing flushes stdio before forking
+        self._lock = threading.RLock()
+        self._local = threading.local()
+    
+    def write(self, text: str) -> int:
+        buffered = getattr(self._local, 'buffer', '') + text
+        if '\n' in buffered:
+            complete, buffered = buffered.rsplit('\n', 1)
+            with self._lock:
+                self.stream.write(complete + '\n')
+        self._local.buffer = buffered
+        return len(text)
+    
+    def flush(self):
+        with self._lock:
+            self.stream.flush()
+    
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def _reset_stdout_lock_after_fork():
+    """A forked child inherits the line writer's lock as held by the forking parent"""
+    if isinstance(sys.stdout, _LineSynchronizedWriter):
+        sys.stdout._lock = threading.RLock()
+
+
+class JobScheduler:
+    """Runs stdio commands as concurrent jobs on a bounded worker pool"""
+    
+    JOB_COMMANDS = ('evolve', 'evolve_all', 'nas', 'checkpoint', 'restore', 'federate', 'federate_push',
+                    'profile')
+    
+    def __init__(self, engine: CypherAIGeneticEngine, max_workers: int = 2):
+        self.engine = engine
+        self.max_workers = max_workers
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='cypher-job')
+        self.jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._job_ids = itertools.count(1)
+    
+    def submit(self, command_data: Dict[str, Any]) -> str:
+        """Queue a job command, returning its job id"""
+        
+        job_id = str(command_data.get('job_id') or f"job-{next(self._job_ids)}")
+        with self._lock:
+            if job_id in self.jobs and self.jobs[job_id]['state'] in ('queued', 'running'):
+                raise ValueError(f"Job {job_id} is already active")
+            
+            job = {
+                'job_id': job_id,
+                'command': command_data.get('command'),
+                'sector': command_data.get('sector'),
+                'state': 'queued',
+                'submitted': time.time(),
+                'started': None,
+                'finished': None,
+                'error': None,
+                'cancel_event': threading.Event()
+            }
+            self.jobs[job_id] = job
+            job['future'] = self.executor.submit(self._run_job, job, command_data)
+        
+        self.emit_job_state(job)
+        return job_id
+    
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job or ask a running job to stop at its next checkpoint"""
+        
+        with self._lock:
+            job = self.jobs.get(job_id)
+            if job is None or job['state'] not in ('queued', 'running'):
+                return False
+            
+            job['cancel_event'].set()
+            if job['future'].cancel():
+                job['state'] = 'cancelled'
+                job['finished'] = time.time()
+        
+        self.emit_job_state(job)
+        return True
+    
+    def status(self, job_id: str = None) -> Dict[str, Any]:
+        """Snapshot of one job or of every known job"""
+        
+        with self._lock:
+            if job_id is not None:
+                job = self.jobs.get(job_id)
+                return self.job_summary(job) if job else {'job_id': job_id, 'state': 'unknown'}
+            
+            return {
+                'max_workers': self.max_workers,
+                'engine': self.engine.startup_report(),
+                'jobs': [self.job_summary(job) for job in self.jobs.values()]
+            }
+    
+    def shutdown(self):
+        """Cancel outstanding jobs and wait for running ones to stop"""
+        
+        for job_id in list(self.jobs):
+            self.cancel(job_id)
+        self.executor.shutdown(wait=True)
+    
+    def job_summary(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-safe view of a job record"""
+        
+        now = time.time()
+        started = job['started']
+        summary = {
+            'job_id': job['job_id'],
+            'command': job['command'],
+            'sector': job['sector'],
+            'state': job['state'],
+            'cancel_requested': job['cancel_event'].is_set(),
+            'queued_seconds': (started or job['finished'] or now) - job['submitted'],
+            'elapsed_seconds': ((job['finished'] or now) - started) if started else 0.0
+        }
+        if job['error']:
+            summary['error'] = job['error']
+        return summary
+    
+    def emit_job_state(self, job: Dict[str, Any]):
+        """Report a job state transition"""
+        self.engine.emit_message('JOB', self.job_summary(job))
+    
+    def _run_job(self, job: Dict[str, Any], command_data: Dict[str, Any]):
+        """Executor entry point: run one job with its id attached to every progress message"""
+        
+        with self._lock:
+            cancelled = job['cancel_event'].is_set()
+            if cancelled:
+                # Cancelled after the executor picked the job up but before it started
+                job['state'] = 'cancelled'
+                job['finished'] = time.time()
+            else:
+                job['state'] = 'running'
+                job['started'] = time.time()
+        self.emit_job_state(job)
+        if cancelled:
+            return
+        
+        self.engine._job_context.job_id = job['job_id']
+        try:
+            self.execute(command_data, job['cancel_event'])
+            state = 'cancelled' if job['cancel_event'].is_set() else 'completed'
+        except Exception as e:
+            job['error'] = str(e)
+            state = 'failed'
+            print(f"ERROR: Job {job['job_id']} failed: {e}", file=sys.stderr)
+            sys.stderr.flush()
+        finally:
+            self.engine._job_context.job_id = None
+        
+        with self._lock:
+            job['state'] = state
+            job['finished'] = time.time()
+        self.emit_job_state(job)
+    
+    def evolution_options(self, command_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Per-request stopping budgets and warm-start seeds from an evolve/evolve_all command"""
+        
+        seed_genomes = list(command_data.get('seed_population') or [])
+        if command_data.get('seed_file'):
+            seed_genomes += self.engine.load_seed_genomes(command_data['seed_file'])
+        
+        options = {
+            'max_generations': command_data.get('max_generations'),
+            'deadline_seconds': command_data.get('deadline_seconds'),
+            'max_evaluations': command_data.get('max_evaluations'),
+            'stagnation_patience': command_data.get('stagnation_patience'),
+            'seed_genomes': seed_genomes or None,
+            'elite_ratio': command_data.get('elite_ratio'),
+            'selection': command_data.get('selection')
+        }
+        return {key: value for key, value in options.items() if value is not None}
+    
+    def execute(self, command_data: Dict[str, Any], cancel_event: threading.Event = None):
+        """Run a job command against the engine and emit its result message"""
+        
+        engine = self.engine
+        command = command_data.get('command')
+        
+        if command == 'evolve':
+            sector = command_data.get('sector', 'GENERAL')
+            options = self.evolution_options(command_data)
+            if command_data.get('islands'):
+                result = engine.run_island_evolution(
+                    sector,
+                    islands=command_data.get('islands'),
+                    migration_interval=command_data.get('migration_interval', 10),
+                    migration_size=command_data.get('migration_size', 2),
+                    topology=command_data.get('topology', 'ring'),
+                    population_size=command_data.get('population_size'),
+                    batch_evaluation=command_data.get('batch_evaluation'),
+                    cancel_event=cancel_event,
+                    **options
+                )
+            else:
+                result = engine.run_evolution(
+                    sector,
+                    batch_evaluation=command_data.get('batch_evaluation'),
+                    backend=command_data.get('backend'),
+                    population_size=command_data.get('population_size'),
+                    cancel_event=cancel_event,
+                    profile=command_data.get('profile'),
+                    **options
+                )
+            engine.emit_message('FITNESS', engine.sector_result_payload(sector, result))
+        
+        elif command == 'evolve_all':
+            result = engine.run_all_sectors(
+                sectors=command_data.get('sectors'),
+                max_workers=command_data.get('max_workers'),
+                cancel_event=cancel_event,
+                batch_evaluation=command_data.get('batch_evaluation'),
+                backend=command_data.get('backend'),
+                population_size=command_data.get('population_size'),
+                **self.evolution_options(command_data)
+            )
+            summary = {
+                'sectors': {
+                    sector: {key: value for key, value in sector_result.items()
+                             if key not in ('best_individual', 'hall_of_fame', 'pareto_front')}
+                    for sector, sector_result in result['sectors'].items()
+                },
+                'workers': result['workers'],
+                'elapsed': result['elapsed']
+            }
+            engine.emit_message('EVOLVE_ALL', summary)
+        
+        elif command == 'nas':
+            sector = command_data.get('sector', 'GENERAL')
+            architecture, accuracy = engine.neural_architecture_search(
+                sector,
+                cancel_event=cancel_event,
+                architectures=command_data.get('architectures'),
+                max_epochs=command_data.get('max_epochs', 20),
+                min_epochs=command_data.get('min_epochs', 5),
+                reduction_factor=command_data.get('reduction_factor', 2),
+                max_workers=command_data.get('max_workers')
+            )
+            result = {
+                'sector': sector,
+                'best_architecture': architecture,
+                'accuracy': float(accuracy)
+            }
+            engine.emit_message('NAS', result)
+        
+        elif command == 'checkpoint':
+            engine.emit_message('CHECKPOINT', engine.save_checkpoint(command_data.get('path')))
+        
+        elif command == 'restore':
+            engine.emit_message('RESTORE', engine.load_checkpoint(command_data.get('path')))
+        
+        elif command == 'federate':
+            result = engine.federated_aggregate(
+                paths=command_data.get('paths'),
+                socket_path=command_data.get('socket'),
+                peers=command_data.get('peers'),
+                include_local=command_data.get('include_local', True),
+                timeout=float(command_data.get('timeout', 60.0)),
+                cancel_event=cancel_event
+            )
+            engine.emit_message('FEDERATED', result)
+        
+        elif command == 'profile':
+            result = engine.profile_evolution(
+                command_data.get('sector', 'GENERAL'),
+                max_generations=command_data.get('generations', 50),
+                population_size=command_data.get('population_size'),
+                backend=command_data.get('backend'),
+                interval_ms=float(command_data.get('interval_ms', 5.0)),
+                top=command_data.get('top', 25),
+                cancel_event=cancel_event
+            )
+            engine.emit_message('PROFILE', result)
+        
+        elif command == 'federate_push':
+            engine.emit_message('FEDERATED', engine.send_federated_state(command_data['socket']))
+        
+        else:
+            raise ValueError(f"Unknown job command: {command}")
+
+
+# Set only inside NAS pool worker processes, by _init_nas_worker
+_nas_training_data = None
+_nas_batch_size = None
+
+
+def _init_nas_worker(training_data: TrainingCorpus, batch_size: int, num_threads: int):
+    """Process pool initializer: share the NAS training corpus with each worker"""
+    global _nas_training_data, _nas_batch_size
+    
+    _reset_stdout_lock_after_fork()
+    _nas_training_data = training_data
+    _nas_batch_size = batch_size
+    torch.set_num_threads(num_threads)
+
+
+def _train_nas_candidate(architecture: List[int], model_state: Dict[str, Any],
+                         optimizer_state: Dict[str, Any], epochs: int, training_data: TrainingCorpus = None,
+                         batch_size: int = None) -> Tuple[Any, Any, float, float]:
+    """Train one NAS candidate for a number of epochs, resuming from saved state"""
+    
+    # Pool workers fall back to the corpus their initializer installed
+    if training_data is None:
+        training_data, batch_size = _nas_training_data, _nas_batch_size
+    
+    model = SecurityPolicyNetwork(input_size=64, hidden_sizes=architecture, output_size=1)
+    optimizer = optim.Adam(model.parameters(), lr=0.001)
+    criterion = nn.BCELoss()
+    if model_state is not None:
+        model.load_state_dict(model_state)
+        optimizer.load_state_dict(optimizer_state)
+    
+    train_on_corpus(model, optimizer, criterion, training_data, epochs, batch_size)
+    
+    # Evaluate on the held-out rows
+    accuracy, eval_loss = evaluate_on_corpus(model, criterion, training_data, batch_size)
+    
+    return model.state_dict(), optimizer.state_dict(), float(accuracy), float(eval_loss)
+
 
 def main():
     """Main execution loop"""
     
+    # Job threads and forked workers all report through one line-synchronized stdout
+    sys.stdout = _LineSynchronizedWriter(sys.stdout)
+    
+    # Forked workers close sys.stdin as they start, which takes the buffer lock this thread holds while
+    # blocked reading commands. Commands are read through a separate handle so children never wait on it.
+    commands = sys.stdin
+    sys.stdin = open(os.devnull)
+    
     try:
         engine = CypherAIGeneticEngine()
+        if os.getenv('CYPHER_AI_WARMUP', '1') != '0':
+            engine.start_background_warmup()
+        scheduler = JobScheduler(engine, max_workers=int(os.getenv('CYPHER_AI_MAX_JOBS', '2')))
         
-        # Wait for commands from TypeScript backend
+        # Block on commands from TypeScript backend; EOF means the parent went away
         while True:
             try:
-                line = sys.stdin.readline().strip()
+                line = commands.readline()
+                if not line:
+                    break
+                
+                line = line.strip()
                 if not line:
-                    time.sleep(0.1)
                     continue
                 
                 command_data = json.loads(line)
                 command = command_data.get('command')
                 
-                if command == 'evolve':
-                    sector = command_data.get('sector', 'GENERAL')
-                    result = engine.run_evolution(sector)
-                    print(f"FITNESS:{json.dumps(result)}")
-                    sys.stdout.flush()
+                if command in JobScheduler.JOB_COMMANDS:
+                    try:
+                        scheduler.submit(command_data)
+                    except ValueError as e:
+                        # Tell the caller which submission was refused; its job id is still active
+                        engine.emit_message('JOB', {
+                            'job_id': str(command_data.get('job_id')),
+                            'command': command,
+                            'sector': command_data.get('sector'),
+                            'state': 'rejected',
+                            'error': str(e)
+                        })
+                        print(f"ERROR: {str(e)}", file=sys.stderr)
+                        sys.stderr.flush()
+                
+                elif command == 'status':
+                    engine.emit_message('STATUS', scheduler.status(command_data.get('job_id')))
+                
+                elif command == 'history':
+                    engine.emit_message('HISTORY', engine.evolution_stats.query(command_data.get('run_id')))
                 
-                elif command == 'nas':
-                    sector = command_data.get('sector', 'GENERAL')
-                    architecture, accuracy = engine.neural_architecture_search(sector)
-                    result = {
-                        'sector': sector,
-                        'best_architecture': architecture,
-                        'accuracy': accuracy
-                    }
-                    print(f"NAS:{json.dumps(result)}")
-                    sys.stdout.flush()
+                elif command == 'cancel':
+                    job_id = str(command_data.get('job_id'))
+                    if not scheduler.cancel(job_id):
+                        engine.emit_message('STATUS', scheduler.status(job_id))
                 
                 elif command == 'shutdown':
-                    print("🛑 Shutting down Python genetic engine")
                     break
-                
+            
             except json.JSONDecodeError:
                 continue
+            except ValueError as e:
+                print(f"ERROR: {str(e)}", file=sys.stderr)
+                sys.stderr.flush()
             except KeyboardInterrupt:
                 break
+        
+        print("🛑 Shutting down Python genetic engine")
+        scheduler.shutdown()
     
     except Exception as e:
         print(f"ERROR: {str(e)}", file=sys.stderr)
         sys.stderr.flush()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Cypher AI Security Policy Network
+PyTorch model used by the genetic engine to score security policy genomes
+"""
+
+import copy
+import warnings
+import torch
+import torch.nn as nn
+
+
+# Deprecation notices torch raises on every export; anything else (tracing, numerics) still surfaces
+_EXPORT_DEPRECATIONS = (
+    (FutureWarning, r'`torch\.jit\.(script|freeze|optimize_for_inference)` is deprecated'),
+    (DeprecationWarning, r'torch\.ao\.quantization is deprecated'),
+    (UserWarning, r'torch\.quantize_per_tensor, torch\.quantize_per_channel .* are deprecated'),
+)
+
+
+class SecurityPolicyNetwork(nn.Module):
+    """PyTorch neural network for security policy evaluation"""
+    
+    def __init__(self, input_size=64, hidden_sizes=[128, 64, 32], output_size=1):
+        super(SecurityPolicyNetwork, self).__init__()
+        self.layers = nn.ModuleList()
+        
+        # Architecture, kept so checkpoints can rebuild the network
+        self.architecture = {
+            'input_size': input_size,
+            'hidden_sizes': list(hidden_sizes),
+            'output_size': output_size
+        }
+        
+        # Input layer
+        prev_size = input_size
+        for hidden_size in hidden_sizes:
+            self.layers.append(nn.Linear(prev_size, hidden_size))
+            self.layers.append(nn.ReLU())
+            self.layers.append(nn.Dropout(0.2))
+            prev_size = hidden_size
+        
+        # Output layer
+        self.layers.append(nn.Linear(prev_size, output_size))
+        self.layers.append(nn.Sigmoid())
+    
+    def forward(self, x):
+        for layer in self.layers:
+            x = layer(x)
+        return x
+    
+    def inference_module(self, quantize: bool = False):
+        """Frozen TorchScript copy for scoring: Dropout stripped, Linear layers optionally dynamic int8"""
+        
+        layers = [copy.deepcopy(layer) for layer in self.layers if not isinstance(layer, nn.Dropout)]
+        module = nn.Sequential(*layers).eval()
+        
+        # The export runs after every training pass; keep TorchScript/quantization deprecation notices off stderr
+        with warnings.catch_warnings():
+            for category, message in _EXPORT_DEPRECATIONS:
+                warnings.filterwarnings('ignore', message=message, category=category)
+            
+            if quantize:
+                module = torch.ao.quantization.quantize_dynamic(module, {nn.Linear}, dtype=torch.qint8)
+            
+            # Freezing inlines the weights; optimize_for_inference then fuses Linear + activation where supported
+            scripted = torch.jit.freeze(torch.jit.script(module))
+            return torch.jit.optimize_for_inference(scripted)
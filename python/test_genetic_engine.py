@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Cypher AI Genetic Engine - Regression Tests
+
+Covers interactions between concurrent jobs that the benchmark suite does not exercise.
+
+Usage:
+    python -m pytest python/test_genetic_engine.py
+    python python/test_genetic_engine.py
+"""
+
+import io
+import os
+import sys
+import struct
+import threading
+import unittest
+
+ENGINE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, ENGINE_DIR)
+
+import genetic_engine
+from genetic_engine import CypherAIGeneticEngine, FederatedAverager, JobScheduler, write_state_stream
+
+
+class BackgroundTrainingTest(unittest.TestCase):
+    """Background training must not overwrite weights that changed after its snapshot"""
+    
+    def setUp(self):
+        os.environ['CYPHER_AI_WARMUP'] = '0'
+        self.engine = CypherAIGeneticEngine()
+        self.engine.ensure_initialized()
+    
+    def test_federated_update_during_background_training(self):
+        engine = self.engine
+        torch = genetic_engine.torch
+        
+        # Hold the trainer until the federated update has been installed
+        release = threading.Event()
+        fit = engine._fit_sector_model
+        
+        def slow_fit(*args):
+            release.wait(10)
+            return fit(*args)
+        engine._fit_sector_model = slow_fit
+        
+        ferpa_before = engine.sector_models['FERPA']['model']
+        self.assertTrue(engine.start_background_training(generation=10))
+        
+        with engine.model_lock:
+            live = engine.sector_models['GENERAL']['model']
+            averaged = {name: torch.full_like(tensor, 0.5) for name, tensor in live.state_dict().items()}
+            self.assertEqual(engine.install_averaged_states({'GENERAL': averaged}), ['GENERAL'])
+        
+        release.set()
+        engine._pending_training.result(timeout=60)
+        engine.swap_trained_models()
+        
+        live_state = engine.sector_models['GENERAL']['model'].state_dict()
+        for name, tensor in averaged.items():
+            self.assertTrue(torch.equal(live_state[name], tensor), f"{name} lost the federated weights")
+        
+        # Sectors the federated update did not touch still take the trained copies
+        self.assertIsNot(engine.sector_models['FERPA']['model'], ferpa_before)
+
+
+
+class FitnessCacheTest(unittest.TestCase):
+    """Fitness scored against models that changed mid-evaluation must not be cached"""
+    
+    def setUp(self):
+        os.environ['CYPHER_AI_WARMUP'] = '0'
+        self.engine = CypherAIGeneticEngine()
+        self.engine.ensure_initialized()
+    
+    def test_model_update_during_scoring(self):
+        engine = self.engine
+        genome = [1, 0] * (engine.GENOME_LENGTH // 2)
+        score = engine._evaluate_individual_uncached
+        
+        # A federated install or background swap lands while the genome is being scored
+        def racing_score(individual):
+            fitness = score(individual)
+            engine.mark_models_updated()
+            return fitness
+        engine._evaluate_individual_uncached = racing_score
+        
+        engine.evaluate_individual(genome)
+        self.assertIsNone(engine.fitness_cache.get(engine.fitness_cache.genome_key(genome)))
+        
+        engine._evaluate_individual_uncached = score
+        fitness = engine.evaluate_individual(genome)
+        self.assertEqual(engine.fitness_cache.get(engine.fitness_cache.genome_key(genome)), fitness)
+
+
+class FederatedStreamTest(unittest.TestCase):
+    """A peer stream is folded into the average whole or not at all"""
+    
+    def setUp(self):
+        os.environ['CYPHER_AI_WARMUP'] = '0'
+        self.engine = CypherAIGeneticEngine()
+        self.engine.ensure_initialized()
+    
+    @staticmethod
+    def stream_bytes(states):
+        stream = io.BytesIO()
+        write_state_stream(stream, states, {sector: 10 for sector in states})
+        return stream.getvalue()
+    
+    def test_incomplete_sector(self):
+        engine = self.engine
+        states = {sector: engine.sector_models[sector]['model'].state_dict() for sector in ('GENERAL', 'FERPA')}
+        full = self.stream_bytes(states)
+        manifest_size = 4 + struct.unpack('>I', full[:4])[0]
+        
+        # Sectors fold in no fixed order, so truncate each in turn: the complete one must not be folded in either
+        for incomplete in states:
+            with self.subTest(incomplete=incomplete):
+                averager = FederatedAverager(states, {sector: 1.0 for sector in states})
+                
+                # The manifest vouches for every tensor, but the stream ends without one of them
+                truncated = dict(states)
+                truncated[incomplete] = dict(states[incomplete])
+                truncated[incomplete].pop(next(reversed(truncated[incomplete])))
+                partial = self.stream_bytes(truncated)
+                partial_manifest_size = 4 + struct.unpack('>I', partial[:4])[0]
+                stream = io.BytesIO(full[:manifest_size] + partial[partial_manifest_size:])
+                
+                with self.assertRaises(ValueError):
+                    engine._fold_stream_peer(averager, stream, 'peer', [])
+                self.assertEqual(averager.peers, {'GENERAL': 0, 'FERPA': 0})
+                self.assertEqual(averager.weights, {'GENERAL': 1.0, 'FERPA': 1.0})
+
+class JobSchedulerTest(unittest.TestCase):
+    """Every job the scheduler accepts must reach a terminal state"""
+    
+    def setUp(self):
+        os.environ['CYPHER_AI_WARMUP'] = '0'
+        self.engine = CypherAIGeneticEngine()
+        self.messages = []
+        self.engine.emit_message = lambda kind, data: self.messages.append((kind, dict(data)))
+        self.scheduler = JobScheduler(self.engine, max_workers=1)
+    
+    def tearDown(self):
+        self.scheduler.executor.shutdown(wait=True)
+    
+    def test_cancel_before_job_starts(self):
+        # Cancelled between the executor picking the job up and the job taking the scheduler lock
+        job = {'job_id': 'job-x', 'command': 'evolve', 'sector': 'GENERAL', 'state': 'queued',
+               'submitted': 0.0, 'started': None, 'finished': None, 'error': None,
+               'cancel_event': threading.Event()}
+        self.scheduler.jobs['job-x'] = job
+        job['cancel_event'].set()
+        
+        self.scheduler._run_job(job, {'command': 'evolve', 'sector': 'GENERAL'})
+        
+        self.assertEqual(job['state'], 'cancelled')
+        self.assertIsNotNone(job['finished'])
+        self.assertIsNone(job['started'])
+        self.assertEqual(self.messages[-1][0], 'JOB')
+        self.assertEqual(self.messages[-1][1]['state'], 'cancelled')
+
+
+if __name__ == '__main__':
+    unittest.main()
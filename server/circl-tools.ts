@@ -3,11 +3,20 @@
  * Integrates various CIRCL cybersecurity tools and services
  */
 
-import { exec } from 'child_process';
-import { promisify } from 'util';
+import { spawn, ChildProcess } from 'child_process';
 import fetch from 'node-fetch';
 
-const execAsync = promisify(exec);
+interface PendingPyMISPRequest {
+  resolve: (value: any) => void;
+  reject: (error: Error) => void;
+  timer: NodeJS.Timeout;
+}
+
+interface PyMISPServiceProcess {
+  child: ChildProcess;
+  pending: Map<number, PendingPyMISPRequest>;
+  buffer: string;
+}
 
 export interface CIRCLToolsConfig {
   bgpRankingUrl?: string;
@@ -67,7 +76,10 @@ export interface AILLeakResult {
 
 export class CIRCLToolsService {
   private config: CIRCLToolsConfig;
-  
+  private pymispService: PyMISPServiceProcess | null = null;
+  private pymispReady: Promise<PyMISPServiceProcess> | null = null;
+  private pymispRequestId = 0;
+
   constructor(config: CIRCLToolsConfig = {}) {
     this.config = {
       bgpRankingUrl: config.bgpRankingUrl || 'https://bgpranking-ng.circl.lu',
@@ -183,30 +195,151 @@ export class CIRCLToolsService {
    */
   async getPyMISPThreatIntelligence(): Promise<any> {
     try {
-      console.log('🐍 Executing enhanced PyMISP service...');
-      const { stdout, stderr } = await execAsync('python3 server/pymisp-service.py');
-      
-      if (stderr) {
-        console.warn('PyMISP service warnings:', stderr);
-      }
-
-      // Parse JSON output from Python service
-      const lines = stdout.trim().split('\n');
-      const jsonStart = lines.findIndex(line => line.includes('='));
-      
-      if (jsonStart !== -1 && jsonStart < lines.length - 1) {
-        const jsonOutput = lines.slice(jsonStart + 1).join('\n');
-        return JSON.parse(jsonOutput);
-      }
-
-      console.log('PyMISP service output:', stdout);
-      return { error: 'No JSON output from PyMISP service' };
-      
+      return await this.requestPyMISP('fetch_threat_intelligence');
     } catch (error: any) {
       console.error('Error executing PyMISP service:', error);
       return { error: error.message };
     }
   }
+  
+  /**
+   * Status of the PyMISP service and its configured feeds
+   */
+  async getPyMISPFeedStatus(): Promise<any> {
+    try {
+      return await this.requestPyMISP('get_feed_status');
+    } catch (error: any) {
+      console.error('Error querying PyMISP feed status:', error);
+      return { error: error.message };
+    }
+  }
+  
+  /**
+   * Search MISP attributes for an indicator value
+   */
+  async searchPyMISPIndicators(iocValue: string, iocType?: string): Promise<any> {
+    try {
+      return await this.requestPyMISP('search_indicators', { ioc_value: iocValue, ioc_type: iocType ?? null });
+    } catch (error: any) {
+      console.error('Error searching PyMISP indicators:', error);
+      return { error: error.message };
+    }
+  }
+  
+  /**
+   * Send one request to the long-running PyMISP service, starting it on first use
+   */
+  private async requestPyMISP(command: string, params: Record<string, any> = {}, timeoutMs = 120000): Promise<any> {
+    const service = await this.startPyMISPService();
+    
+    const id = ++this.pymispRequestId;
+    return new Promise((resolve, reject) => {
+      const timer = setTimeout(() => {
+        service.pending.delete(id);
+        reject(new Error(`PyMISP request ${command} timed out after ${timeoutMs}ms`));
+      }, timeoutMs);
+      
+      service.pending.set(id, { resolve, reject, timer });
+      service.child.stdin?.write(JSON.stringify({ id, command, params }) + '\n');
+    });
+  }
+  
+  /**
+   * Spawn pymisp-service.py in --serve mode; one process (and MISP session) serves every request
+   */
+  private startPyMISPService(startupTimeoutMs = 60000): Promise<PyMISPServiceProcess> {
+    if (this.pymispReady) {
+      return this.pymispReady;
+    }
+    
+    console.log('🐍 Starting enhanced PyMISP service...');
+    const child = spawn('python3', ['server/pymisp-service.py', '--serve'], {
+      stdio: ['pipe', 'pipe', 'pipe'],
+      env: { ...process.env }
+    });
+    
+    // Requests are tracked per process, so one that dies only fails the requests sent to it
+    const service: PyMISPServiceProcess = { child, pending: new Map(), buffer: '' };
+    this.pymispService = service;
+    
+    this.pymispReady = new Promise((resolve, reject) => {
+      child.stdout?.on('data', (data: Buffer) => {
+        service.buffer += data.toString();
+        const lines = service.buffer.split('\n');
+        service.buffer = lines.pop() ?? '';
+        
+        for (const line of lines) {
+          if (!line.trim()) continue;
+          
+          let message: any;
+          try {
+            message = JSON.parse(line);
+          } catch {
+            console.warn('PyMISP service output:', line);
+            continue;
+          }
+          
+          if (message.event === 'ready') {
+            console.log('🐍 PyMISP service ready');
+            clearTimeout(startupTimer);
+            resolve(service);
+            continue;
+          }
+          
+          const pending = service.pending.get(message.id);
+          if (!pending) continue;
+          service.pending.delete(message.id);
+          clearTimeout(pending.timer);
+          
+          if (message.error !== undefined) {
+            pending.resolve({ error: message.error });
+          } else {
+            pending.resolve(message.result);
+          }
+        }
+      });
+      
+      child.stderr?.on('data', (data: Buffer) => {
+        console.warn('PyMISP service warnings:', data.toString());
+      });
+      
+      const failAll = (error: Error) => {
+        clearTimeout(startupTimer);
+        // The next request starts a fresh process
+        if (this.pymispService === service) {
+          this.pymispService = null;
+          this.pymispReady = null;
+        }
+        for (const [id, pending] of service.pending) {
+          clearTimeout(pending.timer);
+          pending.reject(error);
+          service.pending.delete(id);
+        }
+        reject(error);
+      };
+      
+      child.on('error', (error: Error) => failAll(error));
+      child.on('exit', (code) => failAll(new Error(`PyMISP service exited with code ${code}`)));
+      
+      // A process that hangs before reporting ready would otherwise block every caller forever
+      const startupTimer = setTimeout(() => {
+        failAll(new Error(`PyMISP service did not become ready within ${startupTimeoutMs}ms`));
+        child.kill();
+      }, startupTimeoutMs);
+    });
+    
+    return this.pymispReady;
+  }
+  
+  /**
+   * Stop the long-running PyMISP service
+   */
+  stopPyMISPService(): void {
+    if (this.pymispService) {
+      this.pymispService.child.stdin?.write(JSON.stringify({ command: 'shutdown' }) + '\n');
+      this.pymispService.child.stdin?.end();
+    }
+  }
 
   /**
    * Comprehensive threat assessment combining all CIRCL tools
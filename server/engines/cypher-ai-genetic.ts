@@ -53,6 +53,35 @@ export interface FederatedLearningNode {
   contribution: number;
 }
 
+/**
+ * FITNESS message from the Python backend, with genomes decoded to 0/1 arrays
+ */
+export interface PythonFitnessUpdate {
+  sector: string;
+  best_individual: number[];
+  fitness: number[];
+  generation: number;
+  hall_of_fame: number[][];
+  pareto_front?: { genome: number[]; fitness: number[] }[];
+  [key: string]: any;
+}
+
+/**
+ * EVOLUTION message; when throttled, one update covers `coalesced` generations
+ */
+export interface PythonEvolutionUpdate {
+  sector: string;
+  generation: number;
+  best_fitness: number;
+  coalesced?: number;
+  window_best_fitness?: number;
+  [key: string]: any;
+}
+
+// Descriptor the Python backend writes length-prefixed progress frames to (CYPHER_AI_PROGRESS_FD)
+const PROGRESS_FD = 3;
+const GENOME_LENGTH = 64;
+
 export interface CypherAIGeneticEngineOptions {
   dbProvider?: DbProvider;
   geneticMemoryStore?: GeneticMemoryStore;
@@ -313,20 +342,53 @@ export class CypherAIGeneticEngine extends EventEmitter {
     return new Promise((resolve, reject) => {
       const pythonScriptPath = path.join(import.meta.dirname, '../../python/genetic_engine.py');
       
+      // Progress messages go to a separate pipe so they never interleave with log output on stdout
       this.pythonProcess = spawn('python3', [pythonScriptPath], {
-        stdio: ['pipe', 'pipe', 'pipe'],
-        env: { ...process.env }
+        stdio: ['pipe', 'pipe', 'pipe', 'pipe'],
+        env: {
+          ...process.env,
+          CYPHER_AI_PROGRESS_FD: String(PROGRESS_FD),
+          CYPHER_AI_PROGRESS_CODEC: 'json'
+        }
       });
-
+      
+      // stdout chunks can split or join lines; only complete lines are parsed
+      let stdoutBuffer = '';
       this.pythonProcess.stdout?.on('data', (data: Buffer) => {
-        const message = data.toString().trim();
-        if (message.startsWith('READY')) {
-          console.log('🐍 Python genetic engine backend ready');
-          resolve();
-        } else if (message.startsWith('FITNESS:')) {
-          this.handleFitnessUpdate(message);
-        } else if (message.startsWith('EVOLUTION:')) {
-          this.handleEvolutionUpdate(message);
+        stdoutBuffer += data.toString();
+        const lines = stdoutBuffer.split('\n');
+        stdoutBuffer = lines.pop() ?? '';
+        
+        for (const line of lines) {
+          const message = line.trim();
+          if (message.startsWith('READY')) {
+            console.log('🐍 Python genetic engine backend ready');
+            resolve();
+          } else if (message.startsWith('FITNESS:')) {
+            this.handleProgressLine('FITNESS', message.substring(8));
+          } else if (message.startsWith('EVOLUTION:')) {
+            this.handleProgressLine('EVOLUTION', message.substring(10));
+          }
+        }
+      });
+      
+      // Frames: 4-byte big-endian body length, then a JSON {type, data} body
+      let frameBuffer = Buffer.alloc(0);
+      this.pythonProcess.stdio[PROGRESS_FD]?.on('data', (data: Buffer) => {
+        frameBuffer = Buffer.concat([frameBuffer, data]);
+        
+        while (frameBuffer.length >= 4) {
+          const length = frameBuffer.readUInt32BE(0);
+          if (frameBuffer.length < 4 + length) break;
+          
+          const body = frameBuffer.subarray(4, 4 + length).toString('utf8');
+          frameBuffer = frameBuffer.subarray(4 + length);
+          try {
+            const frame = JSON.parse(body);
+            this.handleProgressMessage(frame.type, frame.data);
+          } catch (error) {
+            console.error('Error parsing progress frame:', error);
+          }
         }
       });
 
@@ -762,27 +824,68 @@ export class CypherAIGeneticEngine extends EventEmitter {
   }
 
   /**
-   * Handle fitness updates from Python backend
+   * Handle a KIND:{json} progress line from the Python backend's stdout
    */
-  private handleFitnessUpdate(message: string): void {
+  private handleProgressLine(kind: string, json: string): void {
     try {
-      const data = JSON.parse(message.substring(8)); // Remove 'FITNESS:' prefix
-      this.emit('fitnessUpdate', data);
+      this.handleProgressMessage(kind, JSON.parse(json));
     } catch (error) {
-      console.error('Error parsing fitness update:', error);
+      console.error(`Error parsing ${kind.toLowerCase()} update:`, error);
     }
   }
-
+  
+  /**
+   * Dispatch a progress message, whichever channel it arrived on
+   */
+  private handleProgressMessage(kind: string, data: any): void {
+    if (kind === 'FITNESS') {
+      this.handleFitnessUpdate(data);
+    } else if (kind === 'EVOLUTION') {
+      this.handleEvolutionUpdate(data);
+    }
+  }
+  
+  /**
+   * Handle fitness updates from Python backend
+   */
+  private handleFitnessUpdate(data: any): void {
+    const update: PythonFitnessUpdate = {
+      ...data,
+      best_individual: this.decodeGenome(data.best_individual),
+      hall_of_fame: (data.hall_of_fame || []).map((genome: number[] | string) => this.decodeGenome(genome))
+    };
+    if (data.pareto_front) {
+      update.pareto_front = data.pareto_front.map((entry: { genome: number[] | string; fitness: number[] }) => ({
+        genome: this.decodeGenome(entry.genome),
+        fitness: entry.fitness
+      }));
+    }
+    delete update.genome_encoding;
+    
+    this.emit('fitnessUpdate', update);
+  }
+  
   /**
    * Handle evolution updates from Python backend
    */
-  private handleEvolutionUpdate(message: string): void {
-    try {
-      const data = JSON.parse(message.substring(10)); // Remove 'EVOLUTION:' prefix
-      this.emit('evolutionUpdate', data);
-    } catch (error) {
-      console.error('Error parsing evolution update:', error);
+  private handleEvolutionUpdate(data: PythonEvolutionUpdate): void {
+    this.emit('evolutionUpdate', data);
+  }
+  
+  /**
+   * Genomes arrive as 0/1 arrays or, with CYPHER_AI_GENOME_ENCODING=hex, as packed bits in hex
+   */
+  private decodeGenome(encoded: number[] | string): number[] {
+    if (typeof encoded !== 'string') return encoded;
+    
+    const genome: number[] = [];
+    for (let i = 0; i < encoded.length; i += 2) {
+      const byte = parseInt(encoded.substring(i, i + 2), 16);
+      for (let bit = 7; bit >= 0; bit--) {
+        genome.push((byte >> bit) & 1);
+      }
     }
+    return genome.slice(0, GENOME_LENGTH);
   }
 
   /**
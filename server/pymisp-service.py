@@ -7,10 +7,17 @@ Integrates CIRCL feeds and provides advanced threat intelligence capabilities
 import os
 import json
 import sys
+import time
+import argparse
+import threading
 import requests
 import logging
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlsplit, urlunsplit
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -31,6 +38,122 @@ except ImportError as e:
     PYMISP_AVAILABLE = False
 
 
+class IndicatorStore:
+    """Deduplicated IOCs keyed by normalized value, with the sources that reported each one
+    
+    Lookups and inserts are O(1) dict operations, and values are normalized before they are compared,
+    so '203.0.113.5' and '203.0.113.005', or 'Evil.Example.' and 'evil.example', count once.
+    """
+    
+    # MISP attribute / feed indicator type -> IOC category
+    TYPE_CATEGORIES = {
+        'ip-src': 'ips', 'ip-dst': 'ips', 'ip-src|port': 'ips', 'ip-dst|port': 'ips',
+        'domain': 'domains', 'hostname': 'domains',
+        'url': 'urls', 'link': 'urls',
+        'md5': 'hashes', 'sha1': 'hashes', 'sha256': 'hashes', 'sha512': 'hashes',
+        'filename|md5': 'hashes', 'filename|sha1': 'hashes', 'filename|sha256': 'hashes',
+        'filename|sha512': 'hashes'
+    }
+    CATEGORIES = ('ips', 'domains', 'urls', 'hashes')
+    HASH_TYPES = {32: 'md5', 40: 'sha1', 64: 'sha256', 128: 'sha512'}
+    
+    def __init__(self):
+        # Dicts keep first-seen order, so serialized lists come out in the order indicators arrived
+        self._indicators = {category: {} for category in self.CATEGORIES}
+    
+    def __len__(self) -> int:
+        return sum(len(values) for values in self._indicators.values())
+    
+    def add(self, ioc_type: str, value: str, source: str) -> bool:
+        """Record one indicator; True if it was not already known"""
+        category = self.TYPE_CATEGORIES.get(ioc_type)
+        if category is None or not value:
+            return False
+        
+        normalized = self.normalize(category, ioc_type, str(value))
+        if normalized is None:
+            logger.debug(f"Rejected malformed {ioc_type} indicator from {source}: {value!r}")
+            return False
+        
+        indicators = self._indicators[category]
+        sources = indicators.get(normalized)
+        if sources is None:
+            indicators[normalized] = {source}
+            return True
+        sources.add(source)
+        return False
+    
+    def normalize(self, category: str, ioc_type: str, value: str) -> Optional[str]:
+        """Canonical form of an indicator value, or None if it is malformed"""
+        value = value.strip()
+        if '|' in ioc_type:
+            # Composite types: 'ip|port' keeps the left part, 'filename|hash' the right
+            parts = value.split('|')
+            value = parts[0] if category == 'ips' else parts[-1]
+        
+        if category == 'ips':
+            # Dotted quads are canonicalized by hand (fast, and tolerant of leading zeros); IPv6 via ipaddress
+            address, slash, prefix = value.partition('/')
+            ipv4 = self._normalize_ipv4(address)
+            try:
+                if slash:
+                    # CIDR ranges ('198.51.100.7/24', '2001:db8::/32') are stored as their network
+                    return str(ipaddress.ip_network(f"{ipv4 or address}/{prefix}", strict=False))
+                return ipv4 or str(ipaddress.ip_address(value))
+            except ValueError:
+                return None
+        if category == 'domains':
+            return value.rstrip('.').lower() or None
+        if category == 'urls':
+            try:
+                parts = urlsplit(value)
+            except ValueError:
+                return value
+            # Scheme and host are case-insensitive; the path and query are not
+            return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, parts.fragment))
+        
+        value = value.lower()
+        if self.hash_type(value) is None or any(char not in '0123456789abcdef' for char in value):
+            return None
+        return value
+    
+    @staticmethod
+    def _normalize_ipv4(value: str) -> Optional[str]:
+        """Canonical dotted quad, also for leading zeros ('010.000.000.001') that ipaddress rejects"""
+        octets = value.split('.')
+        # isdigit() alone accepts characters like '²' that int() rejects
+        if len(octets) != 4 or not all(octet.isascii() and octet.isdigit() and int(octet) <= 255 for octet in octets):
+            return None
+        return '.'.join(str(int(octet)) for octet in octets)
+    
+    @staticmethod
+    def hash_type(value: str) -> Optional[str]:
+        """md5 / sha1 / sha256 / sha512, detected from the hex digest length"""
+        return IndicatorStore.HASH_TYPES.get(len(value))
+    
+    def merge(self, other: 'IndicatorStore'):
+        """Fold another store (e.g. one source's) into this one"""
+        for category, values in other._indicators.items():
+            indicators = self._indicators[category]
+            for value, sources in values.items():
+                known = indicators.get(value)
+                if known is None:
+                    indicators[value] = set(sources)
+                else:
+                    known.update(sources)
+    
+    def to_iocs(self) -> Dict[str, List[str]]:
+        """The results['iocs'] shape: category -> list of unique values"""
+        return {category: list(values) for category, values in self._indicators.items()}
+    
+    def to_provenance(self) -> Dict[str, Dict[str, List[str]]]:
+        """category -> value -> sorted source names"""
+        return {
+            category: {value: sorted(sources) for value, sources in values.items()}
+            for category, values in self._indicators.items()
+        }
+
+
 class EnhancedMISPService:
     """Enhanced MISP service using PyMISP for better threat intelligence"""
     
@@ -40,6 +163,27 @@ class EnhancedMISPService:
         self.misp = None
         self.circl_feeds = []
         
+        # MISP ingestion: 'stream' pages through attributes/restSearch over the whole date window;
+        # 'events' is the PyMISP event search (first 10 of at most 50 events)
+        self.misp_ingestion = os.getenv('MISP_INGESTION', 'stream')
+        self.misp_page_size = int(os.getenv('MISP_PAGE_SIZE', '1000'))
+        self.misp_window_days = int(os.getenv('MISP_WINDOW_DAYS', '7'))
+        self.misp_max_pages = int(os.getenv('MISP_MAX_PAGES', '0'))
+        
+        # Per-source deadline for fetch_threat_intelligence (a feed's own 'timeout' overrides it)
+        self.source_timeout = float(os.getenv('THREAT_INTEL_SOURCE_TIMEOUT', '30'))
+        
+        # One keep-alive connection pool for MISP REST requests, shared by all fetches
+        self.http = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        
+        # Sources are fetched concurrently; a source that misses its deadline keeps its worker until it returns.
+        # Each source's deadline runs from when a worker picks it up, so concurrent requests queueing on the
+        # pool do not time each other out.
+        self.fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='threat-intel-source')
+        
         if PYMISP_AVAILABLE and self.misp_url and self.misp_key:
             try:
                 self.misp = PyMISP(
@@ -92,7 +236,8 @@ class EnhancedMISPService:
         ]
         logger.info(f"📊 Configured {len(self.circl_feeds)} enhanced CIRCL feeds")
     
-    def fetch_threat_intelligence(self) -> Dict[str, Any]:
+    def fetch_threat_intelligence(self, include_provenance: bool = False, days: int = None,
+                                  page_size: int = None) -> Dict[str, Any]:
         """Enhanced threat intelligence fetching with PyMISP"""
         results = {
             'timestamp': datetime.now().isoformat(),
@@ -106,94 +251,232 @@ class EnhancedMISPService:
             'total_indicators': 0,
             'pymisp_available': PYMISP_AVAILABLE
         }
+        store = IndicatorStore()
         
-        if self.misp:
-            try:
-                # Fetch recent events from MISP
-                recent_events = self.misp.search(
-                    published=True,
-                    limit=50,
-                    date_from=(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-                )
-                
-                if recent_events:
-                    logger.info(f"🔍 Retrieved {len(recent_events)} recent MISP events")
-                    results['sources'].append({
-                        'name': 'PyMISP Direct',
-                        'events': len(recent_events),
-                        'status': 'success'
-                    })
-                    
-                    # Extract IOCs from events
-                    for event in recent_events[:10]:  # Process first 10 events
-                        if isinstance(event, dict) and 'Event' in event:
-                            event_data = event['Event']
-                            if 'Attribute' in event_data:
-                                for attr in event_data['Attribute']:
-                                    self._extract_ioc_from_attribute(attr, results)
-                
-            except Exception as e:
-                logger.error(f"Error fetching from PyMISP: {e}")
-                results['sources'].append({
-                    'name': 'PyMISP Direct',
-                    'status': 'error',
-                    'error': str(e)
-                })
-        
-        # Fetch from enhanced CIRCL feeds
+        # Query every source at once; end-to-end latency is bounded by the slowest deadline, not the sum
+        # A streaming source publishes each completed page's store, so a deadline still keeps what it read
+        tasks = []
+        if self.misp_ingestion == 'stream' and self.misp_url and self.misp_key:
+            misp_pages = []
+            tasks.append(('MISP Attribute Stream', self.source_timeout, self._stream_misp_attributes,
+                          (days, page_size, self.source_timeout, misp_pages), misp_pages))
+        elif self.misp:
+            tasks.append(('PyMISP Direct', self.source_timeout, self._fetch_misp_events, (), None))
         for feed in self.circl_feeds:
             if feed['enabled']:
-                try:
-                    feed_data = self._fetch_circl_feed(feed)
-                    if feed_data:
-                        results['sources'].append({
-                            'name': feed['name'],
-                            'indicators': len(feed_data.get('indicators', [])),
-                            'status': 'success'
-                        })
-                        # Merge indicators
-                        self._merge_feed_indicators(feed_data, results)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch {feed['name']}: {e}")
-                    results['sources'].append({
-                        'name': feed['name'],
-                        'status': 'error',
-                        'error': str(e)
-                    })
+                tasks.append((feed['name'], feed.get('timeout', self.source_timeout), self._fetch_feed_source,
+                              (feed,), None))
+        
+        submitted = time.monotonic()
+        futures = []
+        for name, timeout, fetch, args, published in tasks:
+            start = {'event': threading.Event(), 'at': None}
+            future = self.fetch_executor.submit(self._timed_fetch, start, fetch, *args)
+            futures.append((name, timeout, start, future, published))
+        
+        # Each source fills its own store on its worker; merging happens on this thread in source order
+        for name, timeout, start, future, published in futures:
+            try:
+                source, source_store = self._await_source(future, start, timeout, submitted)
+            except FutureTimeoutError as e:
+                pages = list(published or ())
+                logger.warning(f"{name} missed its {timeout:.0f}s deadline; continuing with partial results")
+                source = {
+                    'name': name,
+                    'status': 'partial' if pages else 'timeout',
+                    'error': str(e) or f"no response within {timeout:.0f}s",
+                    'latency_ms': round((time.monotonic() - (start['at'] or submitted)) * 1000, 1)
+                }
+                if published is not None:
+                    source['pages'] = len(pages)
+                results['sources'].append(source)
+                for page_store in pages:
+                    store.merge(page_store)
+                continue
+            except Exception as e:
+                # One failing source is reported, never allowed to fail the whole aggregation
+                logger.error(f"Error fetching {name}: {e}")
+                results['sources'].append({'name': name, 'status': 'error', 'error': str(e)})
+                continue
+            
+            results['sources'].append(source)
+            if source_store is not None:
+                store.merge(source_store)
         
         # Calculate totals
-        results['total_indicators'] = (
-            len(results['iocs']['ips']) +
-            len(results['iocs']['domains']) +
-            len(results['iocs']['urls']) +
-            len(results['iocs']['hashes'])
-        )
+        results['iocs'] = store.to_iocs()
+        results['total_indicators'] = len(store)
+        if include_provenance:
+            results['provenance'] = store.to_provenance()
         
         logger.info(f"✅ Aggregated {results['total_indicators']} total indicators from {len(results['sources'])} sources")
         return results
     
-    def _extract_ioc_from_attribute(self, attr: Dict[str, Any], results: Dict[str, Any]):
+    def _timed_fetch(self, start: Dict[str, Any], fetch, *args):
+        """Run one source fetch, recording when it started and stamping its latency on the source entry"""
+        start['at'] = time.monotonic()
+        start['event'].set()
+        source, source_store = fetch(*args)
+        source['latency_ms'] = round((time.monotonic() - start['at']) * 1000, 1)
+        return source, source_store
+    
+    def _await_source(self, future, start: Dict[str, Any], timeout: float, submitted: float):
+        """Result of one source fetch, allowing it `timeout` seconds from when a worker picked it up
+        
+        A source still queued after a full timeout (the pool is busy with other requests) is cancelled.
+        """
+        if not start['event'].wait(max(0.0, submitted + timeout - time.monotonic())):
+            if future.cancel():
+                raise FutureTimeoutError(f"not started within {timeout:.0f}s (fetch pool busy)")
+            # Picked up just now; wait for it to record its start time
+            start['event'].wait()
+        
+        return future.result(timeout=max(0.0, start['at'] + timeout - time.monotonic()))
+    
+    def iter_misp_attributes(self, days: int = None, page_size: int = None, deadline: float = None,
+                             progress: Dict[str, Any] = None) -> Iterator[Dict[str, Any]]:
+        """Attributes from every page of iter_misp_attribute_pages, one at a time"""
+        for attributes in self.iter_misp_attribute_pages(days, page_size, deadline, progress):
+            yield from attributes
+    
+    def iter_misp_attribute_pages(self, days: int = None, page_size: int = None, deadline: float = None,
+                                  progress: Dict[str, Any] = None) -> Iterator[List[Dict[str, Any]]]:
+        """Page through MISP attributes/restSearch for the last `days` days, holding one page at a time
+        
+        Stops early (progress['truncated']) at the monotonic `deadline` or after MISP_MAX_PAGES pages.
+        """
+        days = days or self.misp_window_days
+        page_size = page_size or self.misp_page_size
+        if progress is None:
+            progress = {}
+        progress.update(pages=0, attributes=0, truncated=False)
+        
+        url = f"{self.misp_url.rstrip('/')}/attributes/restSearch"
+        headers = {
+            'Authorization': self.misp_key,
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        }
+        query = {
+            'returnFormat': 'json',
+            'published': True,
+            'from': (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d'),
+            # Only the attribute types the indicator store keeps, without event context
+            'type': list(IndicatorStore.TYPE_CATEGORIES),
+            'includeContext': False,
+            'limit': page_size
+        }
+        
+        page = 1
+        while True:
+            timeout = self.source_timeout
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    progress['truncated'] = True
+                    return
+            
+            response = self.http.post(url, json={**query, 'page': page}, headers=headers, timeout=timeout)
+            response.raise_for_status()
+            data = response.json().get('response', {})
+            attributes = data.get('Attribute', []) if isinstance(data, dict) else []
+            
+            progress['pages'] += 1
+            progress['attributes'] += len(attributes)
+            yield attributes
+            
+            if len(attributes) < page_size:
+                return
+            if self.misp_max_pages and page >= self.misp_max_pages:
+                progress['truncated'] = True
+                return
+            page += 1
+    
+    def _stream_misp_attributes(self, days: int = None, page_size: int = None, timeout: float = None,
+                                published: List[IndicatorStore] = None):
+        """Ingest the MISP date window page by page, returned as (source entry, store)
+        
+        Each page's indicators are appended to `published` as soon as the page is parsed. If a slow page
+        keeps this worker past the caller's deadline, the caller merges those pages instead of losing them.
+        """
+        name = 'MISP Attribute Stream'
+        pages = published if published is not None else []
+        progress = {}
+        
+        # Stop paging a little before the source deadline so the pages already read still count
+        deadline = time.monotonic() + 0.9 * (timeout or self.source_timeout)
+        try:
+            for attributes in self.iter_misp_attribute_pages(days, page_size, deadline=deadline, progress=progress):
+                page_store = IndicatorStore()
+                for attr in attributes:
+                    self._extract_ioc_from_attribute(attr, page_store, name)
+                pages.append(page_store)
+        except Exception as e:
+            logger.error(f"Error streaming MISP attributes: {e}")
+            source = {'name': name, 'status': 'partial' if pages else 'error', 'error': str(e)}
+        else:
+            source = {'name': name, 'status': 'partial' if progress['truncated'] else 'success'}
+        
+        store = IndicatorStore()
+        for page_store in list(pages):
+            store.merge(page_store)
+        
+        logger.info(f"🔍 Streamed {progress.get('attributes', 0)} MISP attributes in {progress.get('pages', 0)} pages")
+        source.update(pages=progress.get('pages', 0), attributes=progress.get('attributes', 0), indicators=len(store))
+        return source, store
+    
+    def _fetch_misp_events(self):
+        """Recent published MISP events, returned as (source entry, store)"""
+        store = IndicatorStore()
+        try:
+            # Fetch recent events from MISP
+            recent_events = self.misp.search(
+                published=True,
+                limit=50,
+                date_from=(datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+            )
+        except Exception as e:
+            logger.error(f"Error fetching from PyMISP: {e}")
+            return {'name': 'PyMISP Direct', 'status': 'error', 'error': str(e)}, None
+        
+        # PyMISP reports server-side failures as {'errors': ...} rather than raising
+        if isinstance(recent_events, dict) and 'errors' in recent_events:
+            logger.error(f"Error fetching from PyMISP: {recent_events['errors']}")
+            return {'name': 'PyMISP Direct', 'status': 'error', 'error': str(recent_events['errors'])}, None
+        
+        recent_events = recent_events or []
+        logger.info(f"🔍 Retrieved {len(recent_events)} recent MISP events")
+        
+        # Extract IOCs from events
+        for event in recent_events[:10]:  # Process first 10 events
+            if isinstance(event, dict) and 'Event' in event:
+                for attr in event['Event'].get('Attribute', []):
+                    self._extract_ioc_from_attribute(attr, store, 'PyMISP Direct')
+        
+        return {'name': 'PyMISP Direct', 'events': len(recent_events), 'status': 'success'}, store
+    
+    def _fetch_feed_source(self, feed: Dict[str, Any]):
+        """One CIRCL feed, returned as (source entry, store)"""
+        try:
+            feed_data = self._fetch_circl_feed(feed)
+        except Exception as e:
+            logger.warning(f"Failed to fetch {feed['name']}: {e}")
+            return {'name': feed['name'], 'status': 'error', 'error': str(e)}, None
+        
+        if not feed_data:
+            return {'name': feed['name'], 'status': 'empty'}, None
+        
+        store = IndicatorStore()
+        self._merge_feed_indicators(feed_data, store, feed['name'])
+        return {
+            'name': feed['name'],
+            'indicators': len(feed_data.get('indicators', [])),
+            'status': 'success'
+        }, store
+    
+    def _extract_ioc_from_attribute(self, attr: Dict[str, Any], store: IndicatorStore, source: str):
         """Extract IOCs from MISP attributes"""
-        attr_type = attr.get('type', '')
-        value = attr.get('value', '')
-        
-        if not value:
-            return
-        
-        # Categorize indicators
-        if attr_type in ['ip-src', 'ip-dst']:
-            if value not in results['iocs']['ips']:
-                results['iocs']['ips'].append(value)
-        elif attr_type in ['domain', 'hostname']:
-            if value not in results['iocs']['domains']:
-                results['iocs']['domains'].append(value)
-        elif attr_type in ['url', 'link']:
-            if value not in results['iocs']['urls']:
-                results['iocs']['urls'].append(value)
-        elif attr_type in ['md5', 'sha1', 'sha256', 'filename|md5', 'filename|sha1', 'filename|sha256']:
-            hash_value = value.split('|')[-1] if '|' in value else value
-            if hash_value not in results['iocs']['hashes']:
-                results['iocs']['hashes'].append(hash_value)
+        store.add(attr.get('type', ''), attr.get('value', ''), source)
     
     def _fetch_circl_feed(self, feed: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Fetch data from CIRCL feeds"""
@@ -261,33 +544,22 @@ class EnhancedMISPService:
             'timestamp': datetime.now().isoformat()
         }
     
-    def _merge_feed_indicators(self, feed_data: Dict[str, Any], results: Dict[str, Any]):
+    def _merge_feed_indicators(self, feed_data: Dict[str, Any], store: IndicatorStore, source: str):
         """Merge indicators from feed into results"""
         for indicator in feed_data.get('indicators', []):
-            ind_type = indicator.get('type', '')
-            value = indicator.get('value', '')
-            
-            if not value:
-                continue
-            
-            if ind_type in ['ip-src', 'ip-dst']:
-                if value not in results['iocs']['ips']:
-                    results['iocs']['ips'].append(value)
-            elif ind_type in ['domain', 'hostname']:
-                if value not in results['iocs']['domains']:
-                    results['iocs']['domains'].append(value)
-            elif ind_type in ['url', 'link']:
-                if value not in results['iocs']['urls']:
-                    results['iocs']['urls'].append(value)
-            elif ind_type in ['md5', 'sha1', 'sha256']:
-                if value not in results['iocs']['hashes']:
-                    results['iocs']['hashes'].append(value)
+            store.add(indicator.get('type', ''), indicator.get('value', ''), source)
     
     def get_feed_status(self) -> Dict[str, Any]:
         """Get status of all configured feeds"""
         status = {
             'pymisp_available': PYMISP_AVAILABLE,
             'misp_configured': bool(self.misp),
+            'misp_ingestion': {
+                'mode': self.misp_ingestion,
+                'page_size': self.misp_page_size,
+                'window_days': self.misp_window_days,
+                'max_pages': self.misp_max_pages
+            },
             'feeds': []
         }
         
@@ -330,6 +602,67 @@ class EnhancedMISPService:
             return {'error': str(e)}
 
 
+# Requests accepted by the long-running service mode (--serve)
+SERVICE_COMMANDS = ('fetch_threat_intelligence', 'get_feed_status', 'search_indicators')
+
+
+def serve(service: EnhancedMISPService, input_stream=None, output_stream=None, max_workers: int = 4):
+    """Serve JSON requests on stdin until EOF or shutdown, one JSON response per line on stdout
+    
+    Request:  {"id": 1, "command": "search_indicators", "params": {"ioc_value": "203.0.113.5"}}
+    Response: {"id": 1, "result": {...}} or {"id": 1, "error": "..."}
+    
+    The service (and its PyMISP client and HTTP sessions) lives for the whole loop, so only the
+    first request pays for interpreter startup, imports and the TLS handshake. Requests run on a
+    small thread pool so a slow fetch does not hold up status queries.
+    """
+    input_stream = input_stream or sys.stdin
+    output_stream = output_stream or sys.stdout
+    write_lock = threading.Lock()
+    
+    def respond(response: Dict[str, Any]):
+        line = json.dumps(response, default=str)
+        with write_lock:
+            output_stream.write(line + '\n')
+            output_stream.flush()
+    
+    def handle(request_id, command: str, params: Dict[str, Any]):
+        try:
+            respond({'id': request_id, 'result': getattr(service, command)(**params)})
+        except Exception as e:
+            logger.error(f"Request {request_id} ({command}) failed: {e}")
+            respond({'id': request_id, 'error': str(e)})
+    
+    respond({'event': 'ready', 'pymisp_available': PYMISP_AVAILABLE, 'misp_configured': bool(service.misp)})
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pymisp-request') as executor:
+        for line in input_stream:
+            line = line.strip()
+            if not line:
+                continue
+            
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                respond({'id': None, 'error': f"Invalid JSON request: {e}"})
+                continue
+            
+            request_id = request.get('id')
+            command = request.get('command')
+            if command == 'shutdown':
+                break
+            if command == 'ping':
+                respond({'id': request_id, 'result': {'pong': True}})
+                continue
+            if command not in SERVICE_COMMANDS:
+                respond({'id': request_id, 'error': f"Unknown command: {command}"})
+                continue
+            
+            executor.submit(handle, request_id, command, request.get('params') or {})
+    
+    logger.info("🛑 PyMISP service stopped")
+
+
 def main():
     """Main function for testing the service"""
     service = EnhancedMISPService()
@@ -347,6 +680,15 @@ def main():
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Enhanced MISP threat intelligence service')
+    parser.add_argument('--serve', action='store_true',
+                        help='keep running and answer JSON line requests on stdin')
+    args = parser.parse_args()
+    
+    if args.serve:
+        serve(EnhancedMISPService())
+        sys.exit(0)
+    
     result = main()
     # Output JSON for Node.js to consume
     print("\n" + "="*50)
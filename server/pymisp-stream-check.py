@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+MISP Attribute Stream - Stand-in Server Check
+
+Runs fetch_threat_intelligence against a local stand-in for MISP's attributes/restSearch and
+checks the paged ingestion path end to end:
+- full: every page of the date window is ingested and every indicator is kept
+- slow-page: one page trickles in over twice the source deadline, so no single socket read
+  times out; the pages already read are still returned, with the source reported as 'partial'
+  rather than 'timeout'
+
+No MISP instance or network access is needed; CIRCL feeds use their built-in sample data.
+
+Usage:
+    python server/pymisp-stream-check.py
+    python server/pymisp-stream-check.py --attributes 200000 --page-size 10000 --timeout 5
+
+Exit code is 1 if any check fails.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import importlib.util
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+SERVICE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pymisp-service.py')
+STREAM_SOURCE = 'MISP Attribute Stream'
+
+
+class StandInMISPHandler(BaseHTTPRequestHandler):
+    """attributes/restSearch over a synthetic window of unique IP and domain attributes"""
+    
+    attributes = 0
+    api_key = 'stand-in-key'
+    stall_page = None
+    stall_seconds = 0.0
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_POST(self):
+        if self.path.rstrip('/') != '/attributes/restSearch' or self.headers.get('Authorization') != self.api_key:
+            self.send_error(403)
+            return
+        
+        query = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        page, limit = query['page'], query['limit']
+        
+        low = (page - 1) * limit
+        high = min(self.attributes, low + limit)
+        body = json.dumps({'response': {'Attribute': [self.attribute(i) for i in range(low, high)]}}).encode('utf-8')
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        
+        # A stalled page arrives in ten slices, each well inside the client's per-read timeout
+        if page != self.stall_page:
+            self.wfile.write(body)
+            return
+        slice_size = -(-len(body) // 10)
+        for offset in range(0, len(body), slice_size):
+            time.sleep(self.stall_seconds / 10)
+            self.wfile.write(body[offset:offset + slice_size])
+            self.wfile.flush()
+    
+    @staticmethod
+    def attribute(index: int):
+        if index % 3:
+            return {'type': 'ip-dst', 'value': f"10.{index >> 16 & 255}.{index >> 8 & 255}.{index & 255}"}
+        return {'type': 'domain', 'value': f"Host{index}.Example."}
+
+
+def load_service(port: int, page_size: int, timeout: float):
+    """Import pymisp-service.py configured for the stand-in server, without a PyMISP client"""
+    os.environ.update({
+        'MISP_BASE_URL': f"http://127.0.0.1:{port}",
+        'MISP_API_KEY': StandInMISPHandler.api_key,
+        'MISP_INGESTION': 'stream',
+        'MISP_PAGE_SIZE': str(page_size),
+        'THREAT_INTEL_SOURCE_TIMEOUT': str(timeout)
+    })
+    spec = importlib.util.spec_from_file_location('pymisp_service', SERVICE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.PYMISP_AVAILABLE = False
+    return module.EnhancedMISPService()
+
+
+def stream_source(results):
+    return next(source for source in results['sources'] if source['name'] == STREAM_SOURCE)
+
+
+def streamed_indicators(results) -> int:
+    """Indicators that came from the attribute stream (the CIRCL sample feeds add a few of their own)"""
+    return sum(STREAM_SOURCE in sources for values in results['provenance'].values() for sources in values.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check MISP attribute streaming against a local stand-in server')
+    parser.add_argument('--attributes', type=int, default=60000, help='Attributes in the stand-in window')
+    parser.add_argument('--page-size', type=int, default=5000, help='restSearch page size')
+    parser.add_argument('--timeout', type=float, default=3.0, help='Source deadline in seconds')
+    args = parser.parse_args()
+    
+    StandInMISPHandler.attributes = args.attributes
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StandInMISPHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    service = load_service(server.server_port, args.page_size, args.timeout)
+    
+    # A window that fills its last page exactly takes one more (empty) page to confirm the end
+    pages = args.attributes // args.page_size + 1
+    failures = []
+    
+    def check(name: str, condition: bool, detail: str):
+        print(f"{'✅' if condition else '❌'} {name}: {detail}")
+        if not condition:
+            failures.append(name)
+    
+    # Full window
+    started = time.monotonic()
+    results = service.fetch_threat_intelligence(include_provenance=True)
+    elapsed = time.monotonic() - started
+    source = stream_source(results)
+    streamed = streamed_indicators(results)
+    check('full', source['status'] == 'success' and source['pages'] == pages and streamed == args.attributes,
+          f"{source['status']}, {source['pages']}/{pages} pages, {streamed}/{args.attributes} indicators "
+          f"in {elapsed:.2f}s")
+    
+    # A page that stalls past the deadline: earlier pages must survive
+    StandInMISPHandler.stall_page = min(3, pages)
+    StandInMISPHandler.stall_seconds = args.timeout * 2
+    started = time.monotonic()
+    results = service.fetch_threat_intelligence(include_provenance=True)
+    elapsed = time.monotonic() - started
+    source = stream_source(results)
+    streamed = streamed_indicators(results)
+    expected = (StandInMISPHandler.stall_page - 1) * args.page_size
+    check('slow-page', source['status'] == 'partial' and streamed == expected and elapsed < args.timeout * 1.5,
+          f"{source['status']}, {streamed}/{expected} indicators from the pages before the stall "
+          f"in {elapsed:.2f}s (deadline {args.timeout:.1f}s)")
+    
+    server.shutdown()
+    service.fetch_executor.shutdown(wait=False, cancel_futures=True)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+PyMISP Service - Indicator Normalization Tests
+
+Covers how IndicatorStore canonicalizes and deduplicates indicator values from MISP and CIRCL feeds.
+
+Usage:
+    python -m pytest server/test_pymisp_service.py
+    python server/test_pymisp_service.py
+"""
+
+import os
+import unittest
+import importlib.util
+
+SERVICE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pymisp-service.py')
+
+# pymisp-service.py is not importable by name
+spec = importlib.util.spec_from_file_location('pymisp_service', SERVICE_PATH)
+pymisp_service = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(pymisp_service)
+IndicatorStore = pymisp_service.IndicatorStore
+
+
+class NormalizationTest(unittest.TestCase):
+    """Equivalent spellings of an indicator count once; malformed values are dropped"""
+    
+    def setUp(self):
+        self.store = IndicatorStore()
+    
+    def normalize(self, ioc_type: str, value: str):
+        return self.store.normalize(IndicatorStore.TYPE_CATEGORIES[ioc_type], ioc_type, value)
+    
+    def test_ipv4_leading_zeros(self):
+        self.assertEqual(self.normalize('ip-dst', '203.000.113.005'), '203.0.113.5')
+        self.assertEqual(self.normalize('ip-src', ' 010.0.0.1 '), '10.0.0.1')
+        self.assertTrue(self.store.add('ip-dst', '203.0.113.5', 'a'))
+        self.assertFalse(self.store.add('ip-src', '203.0.113.005', 'b'))
+        self.assertEqual(self.store.to_provenance()['ips'], {'203.0.113.5': ['a', 'b']})
+    
+    def test_ipv6(self):
+        self.assertEqual(self.normalize('ip-dst', '2001:DB8:0:0::1'), '2001:db8::1')
+    
+    def test_cidr(self):
+        self.assertEqual(self.normalize('ip-src', '198.51.100.0/24'), '198.51.100.0/24')
+        self.assertEqual(self.normalize('ip-src', '198.51.100.7/24'), '198.51.100.0/24')
+        self.assertEqual(self.normalize('ip-dst', '010.001.0.0/16'), '10.1.0.0/16')
+        self.assertEqual(self.normalize('ip-dst', '2001:DB8::/32'), '2001:db8::/32')
+        self.assertIsNone(self.normalize('ip-dst', '198.51.100.0/33'))
+        self.assertIsNone(self.normalize('ip-dst', '198.51.100.0/'))
+    
+    def test_malformed_ips(self):
+        for value in ('256.0.0.1', '1.2.3', '1.2.3.4.5', '1.2.3.²', '١.2.3.4', 'not-an-ip'):
+            with self.subTest(value=value):
+                self.assertIsNone(self.normalize('ip-dst', value))
+                self.assertFalse(self.store.add('ip-dst', value, 'feed'))
+        self.assertEqual(len(self.store), 0)
+    
+    def test_composite_types(self):
+        self.assertEqual(self.normalize('ip-dst|port', '203.0.113.005|443'), '203.0.113.5')
+        self.assertEqual(self.normalize('filename|md5', 'dropper.exe|D41D8CD98F00B204E9800998ECF8427E'),
+                         'd41d8cd98f00b204e9800998ecf8427e')
+        self.assertEqual(self.normalize('filename|sha256', 'a|b.bin|' + 'A' * 64), 'a' * 64)
+    
+    def test_domains_and_urls(self):
+        self.assertEqual(self.normalize('domain', 'Evil.Example.'), 'evil.example')
+        self.assertIsNone(self.normalize('hostname', '.'))
+        self.assertEqual(self.normalize('url', 'HTTPS://Evil.Example/Path?Q=1'), 'https://evil.example/Path?Q=1')
+    
+    def test_bad_hashes(self):
+        self.assertEqual(self.normalize('sha1', 'DA39A3EE5E6B4B0D3255BFEF95601890AFD80709'),
+                         'da39a3ee5e6b4b0d3255bfef95601890afd80709')
+        for ioc_type, value in (('md5', 'd41d8cd98f00b204e9800998ecf8427'),
+                                ('md5', 'g41d8cd98f00b204e9800998ecf8427e'),
+                                ('sha256', 'not a hash'),
+                                ('filename|sha1', 'file.txt|')):
+            with self.subTest(ioc_type=ioc_type, value=value):
+                self.assertIsNone(self.normalize(ioc_type, value))
+    
+    def test_rejections_are_logged(self):
+        with self.assertLogs('pymisp-service', level='DEBUG') as logs:
+            self.assertFalse(self.store.add('ip-src', '198.51.100.0/99', 'MISP'))
+        self.assertIn('198.51.100.0/99', logs.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()